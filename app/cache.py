@@ -0,0 +1,295 @@
+"""
+Read-through response cache for the public job and worker endpoints.
+
+Entries are keyed on a scope ("jobs", "jobs:42", "workers", ...) plus the
+endpoint's parsed query parameters, so equivalent requests share an entry.
+Each scope carries a generation number that is part of the key; bumping
+it invalidates every entry in the scope at once without scanning. ORM
+hooks bump the scopes touched by a transaction once it commits, so every
+write path (routers, admin tools, scripts using SessionLocal) invalidates
+without calling the cache explicitly.
+
+The backend decides where entries live:
+- "memory" (default): TTL + LRU dictionary in this process
+- "redis": shared by every uvicorn worker (needs the optional `redis` package)
+- "off": never stores anything
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+
+from app.database import SessionLocal
+from app.models.job import Job
+from app.models.review import Review
+from app.models.workers import Worker
+
+logger = logging.getLogger("jobsify")
+
+CACHE_BACKEND = os.environ.get("JOBSIFY_CACHE_BACKEND", "memory")
+CACHE_TTL_SECONDS = int(os.environ.get("JOBSIFY_CACHE_TTL", "30"))
+CACHE_MAX_ENTRIES = int(os.environ.get("JOBSIFY_CACHE_MAX_ENTRIES", "2048"))
+CACHE_REDIS_URL = os.environ.get("JOBSIFY_REDIS_URL", "redis://localhost:6379/0")
+CACHE_REDIS_PREFIX = "jobsify:cache:"
+
+
+class MemoryCacheBackend:
+    """TTL + LRU store local to this process."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: int):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def generation(self, scope: str) -> int:
+        with self._lock:
+            return self._generations.get(scope, 0)
+
+    def bump(self, scope: str):
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+
+class RedisCacheBackend:
+    """Shares entries and generations between processes through Redis."""
+
+    def __init__(self, url: str = CACHE_REDIS_URL, prefix: str = CACHE_REDIS_PREFIX):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("JOBSIFY_CACHE_BACKEND=redis requires the 'redis' package") from exc
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._prefix = prefix
+        # Redis evicts on its own (maxmemory-policy allkeys-lru); nothing to count here
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(self._prefix + key)
+
+    def set(self, key: str, value: str, ttl: int):
+        self._client.set(self._prefix + key, value, ex=ttl)
+
+    def generation(self, scope: str) -> int:
+        return int(self._client.get(f"{self._prefix}gen:{scope}") or 0)
+
+    def bump(self, scope: str):
+        self._client.incr(f"{self._prefix}gen:{scope}")
+
+    def size(self) -> Optional[int]:
+        return None
+
+    def clear(self):
+        for key in self._client.scan_iter(f"{self._prefix}*"):
+            self._client.delete(key)
+
+
+class NullCacheBackend:
+    evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        return None
+
+    def set(self, key: str, value: str, ttl: int):
+        pass
+
+    def generation(self, scope: str) -> int:
+        return 0
+
+    def bump(self, scope: str):
+        pass
+
+    def size(self) -> int:
+        return 0
+
+    def clear(self):
+        pass
+
+
+def create_backend(name: str = CACHE_BACKEND):
+    if name == "memory":
+        return MemoryCacheBackend()
+    if name == "redis":
+        return RedisCacheBackend()
+    if name == "off":
+        return NullCacheBackend()
+    raise ValueError(f"Unknown cache backend: {name}")
+
+
+class ResponseCache:
+    """Caches JSON-ready response bodies and tracks hit/miss counts."""
+
+    def __init__(self, backend=None, ttl: int = CACHE_TTL_SECONDS):
+        self._backend = backend
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0, "errors": 0}
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = create_backend()
+        return self._backend
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._lock:
+            self._stats[stat] += amount
+
+    def key(self, scope: str, **params) -> str:
+        """Build the lookup key; `params` are the endpoint's parsed arguments."""
+        normalized = {name: value for name, value in params.items() if value is not None}
+        try:
+            generation = self.backend.generation(scope)
+        except Exception as exc:
+            self._count("errors")
+            logger.error(f"Cache generation lookup failed for {scope}: {exc}")
+            generation = "unavailable"
+        return f"{scope}@{generation}|{json.dumps(normalized, sort_keys=True, default=str)}"
+
+    def lookup(self, key: str) -> Optional[JSONResponse]:
+        """Return the cached response for `key`, or None on a miss."""
+        content = self.lookup_content(key)
+        if content is None:
+            return None
+        return JSONResponse(content=content, headers={"X-Cache": "HIT"})
+
+    def lookup_content(self, key: str):
+        """Return the cached JSON-ready content for `key`, or None on a miss."""
+        if "@unavailable|" in key:
+            return None
+        try:
+            body = self.backend.get(key)
+        except Exception as exc:
+            # Caching is best-effort: fall through to the database.
+            self._count("errors")
+            logger.error(f"Cache read failed: {exc}")
+            body = None
+        if body is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return json.loads(body)
+
+    def store(self, key: str, content) -> JSONResponse:
+        """Cache `content` under `key` and return it as a response."""
+        return JSONResponse(content=self.store_content(key, content), headers={"X-Cache": "MISS"})
+
+    def store_content(self, key: str, content):
+        """Cache `content` under `key` and return its JSON-ready form."""
+        content = jsonable_encoder(content)
+        if "@unavailable|" not in key:
+            try:
+                self.backend.set(key, json.dumps(content, separators=(",", ":")), self._ttl)
+                self._count("stores")
+            except Exception as exc:
+                self._count("errors")
+                logger.error(f"Cache write failed: {exc}")
+        return content
+
+    def invalidate(self, *scopes: str):
+        for scope in scopes:
+            try:
+                self.backend.bump(scope)
+                self._count("invalidations")
+            except Exception as exc:
+                self._count("errors")
+                logger.error(f"Cache invalidation failed for {scope}: {exc}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["evictions"] = self.backend.evictions
+        stats["entries"] = self.backend.size()
+        stats["backend"] = type(self.backend).__name__
+        stats["ttl_seconds"] = self._ttl
+        return stats
+
+    def clear(self):
+        self.backend.clear()
+        with self._lock:
+            for stat in self._stats:
+                self._stats[stat] = 0
+
+
+response_cache = ResponseCache()
+
+
+# ---------------- ORM HOOKS ----------------
+
+def _scopes_for(obj, is_new: bool) -> set[str]:
+    if isinstance(obj, Job):
+        # Freshly posted jobs wait for approval and are invisible to listings
+        if is_new and not obj.verified:
+            return set()
+        return {"jobs", f"jobs:{obj.id}"}
+    if isinstance(obj, Worker):
+        if is_new and not obj.is_verified:
+            return set()
+        return {"workers", f"workers:{obj.id}"}
+    if isinstance(obj, Review):
+        # Rating aggregates on the worker change with every review write
+        return {"workers", f"workers:{obj.worker_id}", f"reviews:{obj.worker_id}"}
+    return set()
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_cache_scopes(session, flush_context):
+    scopes = session.info.setdefault("cache_scopes", set())
+    for obj in session.new:
+        scopes |= _scopes_for(obj, is_new=True)
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            scopes |= _scopes_for(obj, is_new=False)
+    for obj in session.deleted:
+        scopes |= _scopes_for(obj, is_new=False)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_committed_scopes(session):
+    scopes = session.info.pop("cache_scopes", None)
+    if scopes:
+        response_cache.invalidate(*sorted(scopes))
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_rolled_back_scopes(session):
+    session.info.pop("cache_scopes", None)
@@ -0,0 +1,62 @@
+"""
+HTTP validators (ETag / Last-Modified) for conditional GETs.
+
+Validators are derived from row versions (updated_at, counts) instead of
+the response body, so a matching If-None-Match or If-Modified-Since is
+answered with 304 before the row is loaded or serialized.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts) -> str:
+    """Weak ETag over the parts that identify one version of a representation."""
+    payload = "|".join(
+        part.isoformat() if isinstance(part, datetime) else "" if part is None else str(part)
+        for part in parts
+    )
+    return f'W/"{hashlib.sha1(payload.encode()).hexdigest()[:24]}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; every timestamp we store is UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> dict:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """If-None-Match wins over If-Modified-Since, as RFC 9110 requires."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in client_etags or etag.removeprefix("W/") in client_etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = _as_utc(parsedate_to_datetime(if_modified_since))
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
+
+
+def with_validators(response: Response, etag: str, last_modified: Optional[datetime] = None) -> Response:
+    response.headers.update(validator_headers(etag, last_modified))
+    return response
@@ -0,0 +1,148 @@
+"""
+Denormalized unread counters for the message and notification badges
+
+Counters change in the same transaction as the rows they count:
+- new unread Message/Notification rows are counted by a flush hook, so
+  every insert path is covered without touching it
+- mark-read endpoints call adjust_unread_counters with the UPDATE rowcount
+rebuild_unread_counters recomputes everything from the source tables.
+"""
+from collections import defaultdict
+
+from sqlalchemy import case, event, func, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.emails import normalize_email
+from app.models.conversation import Message
+from app.models.counter import UserCounter
+from app.models.notification import Notification
+
+
+def _upsert(bind):
+    dialect = bind.dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert
+    if dialect == "postgresql":
+        return postgresql.insert
+    # No ON CONFLICT support known for this dialect; see _update_then_insert
+    return None
+
+
+def _adjusted(column, delta: int):
+    # Never let drift push a badge below zero
+    return case((column + delta < 0, 0), else_=column + delta)
+
+
+def adjust_unread_counters(db: Session, user_email: str, messages: int = 0, notifications: int = 0):
+    """Add the deltas to a user's counters inside the caller's transaction."""
+    if not messages and not notifications:
+        return
+    _apply_adjustment(db.connection(), normalize_email(user_email), messages, notifications)
+
+
+def _update_then_insert(connection, user_email: str, messages: int, notifications: int):
+    """Portable upsert: update the row, or insert it if there is none yet."""
+    adjust = (
+        update(UserCounter)
+        .where(UserCounter.user_email == user_email)
+        .values(
+            unread_messages=_adjusted(UserCounter.unread_messages, messages),
+            unread_notifications=_adjusted(UserCounter.unread_notifications, notifications),
+        )
+    )
+    if connection.execute(adjust).rowcount:
+        return
+    try:
+        # Savepoint, so losing an insert race does not abort the caller's transaction
+        with connection.begin_nested():
+            connection.execute(UserCounter.__table__.insert().values(
+                user_email=user_email,
+                unread_messages=max(messages, 0),
+                unread_notifications=max(notifications, 0),
+            ))
+    except IntegrityError:
+        connection.execute(adjust)
+
+
+def _apply_adjustment(connection, user_email: str, messages: int, notifications: int):
+    insert = _upsert(connection)
+    if insert is None:
+        _update_then_insert(connection, user_email, messages, notifications)
+        return
+    stmt = insert(UserCounter).values(
+        user_email=user_email,
+        unread_messages=max(messages, 0),
+        unread_notifications=max(notifications, 0),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserCounter.user_email],
+        set_={
+            "unread_messages": _adjusted(UserCounter.unread_messages, messages),
+            "unread_notifications": _adjusted(UserCounter.unread_notifications, notifications),
+        },
+    )
+    connection.execute(stmt)
+
+
+def get_unread_counters(db: Session, user_email: str) -> tuple[int, int]:
+    """(unread_messages, unread_notifications) via a primary-key lookup."""
+    counter = db.get(UserCounter, normalize_email(user_email))
+    if counter is None:
+        return 0, 0
+    return counter.unread_messages, counter.unread_notifications
+
+
+async def get_unread_counters_async(db, user_email: str) -> tuple[int, int]:
+    """get_unread_counters for an AsyncSession."""
+    counter = await db.get(UserCounter, normalize_email(user_email))
+    if counter is None:
+        return 0, 0
+    return counter.unread_messages, counter.unread_notifications
+
+
+def rebuild_unread_counters(db: Session) -> int:
+    """Recompute every counter from messages and notifications. Returns users written."""
+    totals = defaultdict(lambda: [0, 0])
+    message_counts = (
+        db.query(Message.recipient_email, func.count(Message.id))
+        .filter(Message.is_read == False)
+        .group_by(Message.recipient_email)
+    )
+    for email, count in message_counts:
+        totals[email][0] += count
+    notification_counts = (
+        db.query(Notification.user_email, func.count(Notification.id))
+        .filter(Notification.is_read == False, Notification.user_email.isnot(None))
+        .group_by(Notification.user_email)
+    )
+    for email, count in notification_counts:
+        totals[email][1] += count
+
+    db.query(UserCounter).delete(synchronize_session=False)
+    db.bulk_insert_mappings(
+        UserCounter,
+        [
+            {"user_email": email, "unread_messages": messages, "unread_notifications": notifications}
+            for email, (messages, notifications) in totals.items()
+        ],
+    )
+    db.commit()
+    return len(totals)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _count_new_unread_rows(session, flush_context):
+    deltas = defaultdict(lambda: [0, 0])
+    for obj in session.new:
+        if isinstance(obj, Message) and not obj.is_read:
+            deltas[normalize_email(obj.recipient_email)][0] += 1
+        elif isinstance(obj, Notification) and obj.user_email and not obj.is_read:
+            deltas[normalize_email(obj.user_email)][1] += 1
+
+    if deltas:
+        connection = session.connection()
+        for user_email, (messages, notifications) in deltas.items():
+            _apply_adjustment(connection, user_email, messages, notifications)
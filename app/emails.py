@@ -0,0 +1,14 @@
+"""
+Canonical email form.
+
+Every email column stores the stripped, lowercased address (enforced by
+model validators), so lookups compare with plain equality and use the
+column indexes instead of scanning with lower().
+"""
+from typing import Optional
+
+
+def normalize_email(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return value.strip().lower()
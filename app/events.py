@@ -0,0 +1,202 @@
+"""
+In-process pub/sub hub for pushing new messages and notifications to
+connected clients.
+
+Rows are captured from the ORM session when they are flushed and published
+only once the transaction commits, so every code path that inserts a
+Message or Notification feeds the hub without calling it explicitly.
+
+The backend decides how events travel between processes:
+- "memory" (default): delivered to subscribers in this process only
+- "redis": fanned out over a Redis channel so every uvicorn worker
+  receives every event (needs the optional `redis` package)
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Callable
+
+from sqlalchemy import event
+
+from app.database import SessionLocal
+from app.models.conversation import Message
+from app.models.notification import Notification
+
+logger = logging.getLogger("jobsify")
+
+EVENT_BACKEND = os.environ.get("JOBSIFY_EVENT_BACKEND", "memory")
+EVENT_REDIS_URL = os.environ.get("JOBSIFY_REDIS_URL", "redis://localhost:6379/0")
+EVENT_REDIS_CHANNEL = "jobsify:events"
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class InProcessBackend:
+    """Delivers published events straight back to the local hub."""
+
+    def start(self, deliver: Callable[[dict], None]):
+        self._deliver = deliver
+
+    def publish(self, envelope: dict):
+        self._deliver(envelope)
+
+    def stop(self):
+        pass
+
+
+class RedisBackend:
+    """Shares events between processes through a Redis pub/sub channel."""
+
+    def __init__(self, url: str = EVENT_REDIS_URL, channel: str = EVENT_REDIS_CHANNEL):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("JOBSIFY_EVENT_BACKEND=redis requires the 'redis' package") from exc
+        self._client = redis.Redis.from_url(url)
+        self._channel = channel
+        self._pubsub = None
+        self._thread = None
+
+    def start(self, deliver: Callable[[dict], None]):
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self._channel: lambda message: deliver(json.loads(message["data"]))})
+        self._thread = self._pubsub.run_in_thread(sleep_time=0.5, daemon=True)
+
+    def publish(self, envelope: dict):
+        self._client.publish(self._channel, json.dumps(envelope, default=str))
+
+    def stop(self):
+        if self._thread is not None:
+            self._thread.stop()
+        if self._pubsub is not None:
+            self._pubsub.close()
+
+
+def create_backend(name: str = EVENT_BACKEND):
+    if name == "memory":
+        return InProcessBackend()
+    if name == "redis":
+        return RedisBackend()
+    raise ValueError(f"Unknown event backend: {name}")
+
+
+class EventHub:
+    """Routes events to the asyncio queues of a user's open connections."""
+
+    def __init__(self, backend=None):
+        self._backend = backend
+        self._subscribers = defaultdict(set)  # email -> {(loop, queue)}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._started:
+                return
+            if self._backend is None:
+                self._backend = create_backend()
+            self._backend.start(self._deliver)
+            self._started = True
+
+    def publish(self, user_email: str, event_type: str, data: dict):
+        """Thread-safe; called from sync request handlers after commit."""
+        self._ensure_started()
+        envelope = {"user_email": user_email.strip().lower(), "type": event_type, "data": data}
+        try:
+            self._backend.publish(envelope)
+        except Exception as exc:
+            # Push is best-effort: clients can always fall back to polling.
+            logger.error(f"Failed to publish {event_type} event: {exc}")
+
+    def subscribe(self, user_email: str) -> asyncio.Queue:
+        """Register a queue for the calling event loop's connection."""
+        self._ensure_started()
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        entry = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers[user_email.strip().lower()].add(entry)
+        return queue
+
+    def unsubscribe(self, user_email: str, queue: asyncio.Queue):
+        email = user_email.strip().lower()
+        with self._lock:
+            entries = self._subscribers.get(email, set())
+            entries.difference_update({entry for entry in entries if entry[1] is queue})
+            if not entries:
+                self._subscribers.pop(email, None)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._subscribers.values())
+
+    def _deliver(self, envelope: dict):
+        with self._lock:
+            entries = list(self._subscribers.get(envelope["user_email"], ()))
+        event_payload = {"type": envelope["type"], "data": envelope["data"]}
+        for loop, queue in entries:
+            loop.call_soon_threadsafe(_offer, queue, event_payload)
+
+    def stop(self):
+        with self._lock:
+            if self._started:
+                self._backend.stop()
+                self._started = False
+
+
+def _offer(queue: asyncio.Queue, event_payload: dict):
+    try:
+        queue.put_nowait(event_payload)
+    except asyncio.QueueFull:
+        # Slow consumer: drop rather than grow without bound.
+        pass
+
+
+event_hub = EventHub()
+
+
+# ---------------- ORM HOOKS ----------------
+
+def _message_event(message: Message) -> tuple[str, str, dict]:
+    created_at = message.__dict__.get("created_at")
+    return message.recipient_email, "message", {
+        "id": message.id,
+        "conversation_id": message.conversation_id,
+        "sender_email": message.sender_email,
+        "recipient_email": message.recipient_email,
+        "content": message.content,
+        "is_read": bool(message.is_read),
+        "created_at": created_at.isoformat() if created_at else None,
+    }
+
+
+def _notification_event(notification: Notification) -> tuple[str, str, dict]:
+    return notification.user_email, "notification", {
+        "id": notification.id,
+        "title": notification.title,
+        "message": notification.message,
+        "type": notification.type,
+        "reference_id": notification.reference_id,
+    }
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_new_rows(session, flush_context):
+    pending = session.info.setdefault("pending_events", [])
+    for obj in session.new:
+        if isinstance(obj, Message):
+            pending.append(_message_event(obj))
+        elif isinstance(obj, Notification) and obj.user_email:
+            pending.append(_notification_event(obj))
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_committed_rows(session):
+    for user_email, event_type, data in session.info.pop("pending_events", []):
+        event_hub.publish(user_email, event_type, data)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_rolled_back_rows(session):
+    session.info.pop("pending_events", None)
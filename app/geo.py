@@ -0,0 +1,56 @@
+"""
+Geospatial helpers for "near me" searches
+"""
+import math
+from typing import Optional
+
+KM_PER_DEGREE = 111.32
+EARTH_RADIUS_KM = 6371.0
+
+
+def parse_coordinate(value: Optional[str], limit: float) -> Optional[float]:
+    """Parse a latitude/longitude string, returning None when missing or out of range."""
+    if value is None:
+        return None
+    try:
+        number = float(str(value).strip())
+    except ValueError:
+        return None
+    if math.isnan(number) or abs(number) > limit:
+        return None
+    return number
+
+
+def parse_lat_lng(latitude: Optional[str], longitude: Optional[str]) -> tuple[Optional[float], Optional[float]]:
+    lat = parse_coordinate(latitude, 90.0)
+    lng = parse_coordinate(longitude, 180.0)
+    if lat is None or lng is None:
+        return None, None
+    return lat, lng
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> tuple[float, float, float, float]:
+    """Return (min_lat, max_lat, min_lng, max_lng) enclosing the search circle."""
+    lat_delta = radius_km / KM_PER_DEGREE
+    lng_scale = max(math.cos(math.radians(lat)), 0.01)
+    lng_delta = radius_km / (KM_PER_DEGREE * lng_scale)
+    return lat - lat_delta, lat + lat_delta, lng - lng_delta, lng + lng_delta
+
+
+def distance_sq_expr(lat_column, lng_column, lat: float, lng: float):
+    """
+    Squared equirectangular distance in km² as a SQL expression.
+    Uses only arithmetic so SQLite can sort by it without math extensions.
+    """
+    lng_scale = math.cos(math.radians(lat))
+    dy = (lat_column - lat) * KM_PER_DEGREE
+    dx = (lng_column - lng) * (KM_PER_DEGREE * lng_scale)
+    return dy * dy + dx * dx
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = math.radians(lat2 - lat1)
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
@@ -1,13 +1,7 @@
-from .database import Base, engine
+# 👇 SCHEMA IS MANAGED BY MIGRATIONS (migrations/versions)
+# Kept so `python -m app.init_db` still works; same as `python migrate.py upgrade`
+from migrate import upgrade
 
-# 👇 IMPORT ALL MODELS YOU WANT TABLES FOR
-from .models.user import User
-from .models.job import Job
-from .models.workers import Worker
-from .models.report import Report
-from .models.review import Review
-from .models.notification import Notification
-
-print("Creating database tables...")
-Base.metadata.create_all(bind=engine)
+print("Upgrading database schema...")
+upgrade()
 print("Done.")
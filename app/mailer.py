@@ -0,0 +1,290 @@
+"""
+Background delivery of outbound mail (OTPs and other transactional email).
+
+Request handlers only insert a row into outbound_emails (enqueue_email)
+and return; they never wait on SMTP. Dispatcher threads claim due rows,
+send them over an SMTP session that each thread keeps open between
+messages, and retry transient failures with exponential backoff and
+jitter. The queue is a table, so mail queued just before a restart or
+crash is still sent. A claim is a lease: rows left "sending" by a process
+that died become due again when it runs out. Claims are atomic, so every
+uvicorn worker can run a dispatcher against the same queue.
+
+SMTP settings come only from the environment (JOBSIFY_SMTP_HOST, _PORT,
+_USER, _PASSWORD). Without JOBSIFY_SMTP_HOST the dispatcher does not start
+and mail stays queued. For local development and tests, point them at
+dev_smtp.py (an aiosmtpd sink) instead of a real provider.
+
+A message body is stored in plain text until the message is sent or given
+up on, then blanked. It has to be: retries may run in another process, so
+the body cannot live only in the claiming thread's memory. For OTP mail,
+this means a code sits in outbound_emails for as long as its delivery is
+pending. Codes expire after OTP_TTL_SECONDS (see app/otp.py), so treat
+read access to that table like read access to the mailbox.
+"""
+import logging
+import os
+import random
+import smtplib
+import threading
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Optional
+
+from sqlalchemy import delete, insert, select, update
+
+from app.database import engine
+from app.models.mail import OutboundEmail
+
+logger = logging.getLogger("jobsify")
+
+# No defaults for the server or credentials: an unset host keeps the dispatcher off
+SMTP_HOST = os.environ.get("JOBSIFY_SMTP_HOST", "")
+SMTP_PORT = int(os.environ.get("JOBSIFY_SMTP_PORT", "587"))
+SMTP_STARTTLS = os.environ.get("JOBSIFY_SMTP_STARTTLS", "1") not in ("0", "false", "no")
+# An empty user skips AUTH (e.g. the dev_smtp.py sink)
+SMTP_USER = os.environ.get("JOBSIFY_SMTP_USER", "")
+SMTP_PASSWORD = os.environ.get("JOBSIFY_SMTP_PASSWORD", "")
+SMTP_TIMEOUT_SECONDS = float(os.environ.get("JOBSIFY_SMTP_TIMEOUT", "10"))
+# Providers drop idle sessions; reconnect rather than find out mid-send
+SMTP_IDLE_SECONDS = float(os.environ.get("JOBSIFY_SMTP_IDLE_SECONDS", "30"))
+MAIL_FROM = os.environ.get("JOBSIFY_MAIL_FROM", SMTP_USER or "no-reply@jobsify.local")
+
+# Dispatcher threads per process; 0 leaves the queue to other processes
+MAIL_WORKERS = int(os.environ.get("JOBSIFY_MAIL_WORKERS", "2"))
+MAIL_MAX_ATTEMPTS = int(os.environ.get("JOBSIFY_MAIL_MAX_ATTEMPTS", "6"))
+MAIL_RETRY_BASE_SECONDS = float(os.environ.get("JOBSIFY_MAIL_RETRY_BASE_SECONDS", "5"))
+MAIL_RETRY_MAX_SECONDS = float(os.environ.get("JOBSIFY_MAIL_RETRY_MAX_SECONDS", "600"))
+MAIL_LEASE_SECONDS = float(os.environ.get("JOBSIFY_MAIL_LEASE_SECONDS", "120"))
+# How often idle threads look for mail queued by other processes or due for retry
+MAIL_POLL_SECONDS = float(os.environ.get("JOBSIFY_MAIL_POLL_SECONDS", "5"))
+MAIL_RETENTION_SECONDS = int(os.environ.get("JOBSIFY_MAIL_RETENTION_SECONDS", str(7 * 24 * 3600)))
+
+QUEUED = "queued"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+
+def enqueue_email(recipient: str, subject: str, body: str) -> int:
+    """Queue a plain-text email for background delivery and return its id."""
+    now = time.time()
+    with mail_dispatcher.bind.begin() as conn:
+        email_id = conn.execute(insert(OutboundEmail).values(
+            recipient=recipient,
+            subject=subject,
+            body=body,
+            status=QUEUED,
+            attempts=0,
+            next_attempt_at=now,
+            created_at=now,
+        )).inserted_primary_key[0]
+    mail_dispatcher.wake()
+    return email_id
+
+
+def build_message(recipient: str, subject: str, body: str) -> MIMEMultipart:
+    message = MIMEMultipart()
+    message['From'] = MAIL_FROM
+    message['To'] = recipient
+    message['Subject'] = subject
+    message.attach(MIMEText(body, 'plain'))
+    return message
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before the next try after `attempts` failed ones, with jitter."""
+    delay = min(MAIL_RETRY_MAX_SECONDS, MAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def is_permanent(exc: Exception) -> bool:
+    """5xx replies (bad recipient, rejected content) will fail again; auth errors are config, not the message."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return True
+    if isinstance(exc, smtplib.SMTPAuthenticationError):
+        return False
+    return isinstance(exc, smtplib.SMTPResponseException) and 500 <= exc.smtp_code < 600
+
+
+class SmtpSession:
+    """An SMTP connection reused across messages; reconnects when idle or dropped."""
+
+    def __init__(self):
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT_SECONDS)
+        if SMTP_STARTTLS:
+            server.starttls()
+        if SMTP_USER:
+            server.login(SMTP_USER, SMTP_PASSWORD)
+        return server
+
+    def send(self, message):
+        self.close_if_idle()
+        for attempt in range(2):
+            if self._server is None:
+                self._server = self._connect()
+            try:
+                self._server.send_message(message)
+            except smtplib.SMTPServerDisconnected:
+                # The server hung up on a session we reused; retry once on a new one
+                self._server = None
+                if attempt:
+                    raise
+            else:
+                self._last_used = time.monotonic()
+                return
+
+    def close_if_idle(self):
+        if self._server is not None and time.monotonic() - self._last_used > SMTP_IDLE_SECONDS:
+            self.close()
+
+    def close(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+
+class MailDispatcher:
+    """Thread pool draining outbound_emails."""
+
+    def __init__(self, workers: int = MAIL_WORKERS, bind=None):
+        self._workers = workers
+        self._bind = bind
+        self._threads: list[threading.Thread] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        self._stats = {"sent": 0, "retried": 0, "failed": 0}
+
+    @property
+    def bind(self):
+        return self._bind or engine
+
+    def start(self):
+        if not SMTP_HOST and self._workers > 0:
+            logger.warning("JOBSIFY_SMTP_HOST is not set; outbound mail stays queued until a configured process sends it")
+            return
+        with self._lock:
+            if self._threads or self._workers <= 0:
+                return
+            self._stop.clear()
+            for index in range(self._workers):
+                thread = threading.Thread(target=self._run, name=f"mail-dispatcher-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0):
+        """Stop after the messages in flight; unsent mail stays queued for the next start."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        self._stop.set()
+        self._wake.set()
+        for thread in threads:
+            thread.join(timeout)
+
+    def wake(self):
+        self._wake.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def claim(self):
+        """Lease the next due message to this thread, or return None if nothing is due."""
+        now = time.time()
+        due = (OutboundEmail.status.in_([QUEUED, SENDING])) & (OutboundEmail.next_attempt_at <= now)
+        # SKIP LOCKED keeps PostgreSQL dispatchers off each other's rows; SQLite ignores it
+        # and serializes the single UPDATE on its write lock instead
+        next_id = (
+            select(OutboundEmail.id)
+            .where(due)
+            .order_by(OutboundEmail.next_attempt_at, OutboundEmail.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        with self.bind.begin() as conn:
+            return conn.execute(
+                update(OutboundEmail)
+                .where(OutboundEmail.id == next_id, due)
+                .values(status=SENDING, attempts=OutboundEmail.attempts + 1, next_attempt_at=now + MAIL_LEASE_SECONDS)
+                .returning(OutboundEmail.id, OutboundEmail.recipient, OutboundEmail.subject,
+                           OutboundEmail.body, OutboundEmail.attempts)
+            ).first()
+
+    def deliver(self, session: SmtpSession, job):
+        try:
+            session.send(build_message(job.recipient, job.subject, job.body))
+        except Exception as exc:
+            session.close()
+            self._record_failure(job, exc)
+            return
+        self._finish(job.id, status=SENT, sent_at=time.time(), body="", last_error=None)
+        self._count("sent")
+
+    def _record_failure(self, job, exc: Exception):
+        error = f"{type(exc).__name__}: {exc}"[:500]
+        if is_permanent(exc) or job.attempts >= MAIL_MAX_ATTEMPTS:
+            logger.error(f"Giving up on email {job.id} to {job.recipient} after {job.attempts} attempt(s): {error}")
+            self._finish(job.id, status=FAILED, body="", last_error=error)
+            self._count("failed")
+            return
+        delay = retry_delay(job.attempts)
+        logger.warning(f"Email {job.id} to {job.recipient} failed (attempt {job.attempts}), retrying in {delay:.1f}s: {error}")
+        self._finish(job.id, status=QUEUED, next_attempt_at=time.time() + delay, last_error=error)
+        self._count("retried")
+
+    def _finish(self, email_id: int, **values):
+        with self.bind.begin() as conn:
+            conn.execute(update(OutboundEmail).where(OutboundEmail.id == email_id).values(**values))
+
+    def prune(self) -> int:
+        """Delete sent and failed messages older than MAIL_RETENTION_SECONDS."""
+        with self.bind.begin() as conn:
+            return conn.execute(
+                delete(OutboundEmail).where(
+                    OutboundEmail.status.in_([SENT, FAILED]),
+                    OutboundEmail.created_at < time.time() - MAIL_RETENTION_SECONDS,
+                )
+            ).rowcount
+
+    def _idle(self, session: SmtpSession):
+        if time.monotonic() - self._last_prune > 3600:
+            self._last_prune = time.monotonic()
+            self.prune()
+        if self._wake.wait(MAIL_POLL_SECONDS):
+            self._wake.clear()
+        else:
+            session.close_if_idle()
+
+    def _run(self):
+        session = SmtpSession()
+        try:
+            while not self._stop.is_set():
+                try:
+                    job = self.claim()
+                    if job is None:
+                        self._idle(session)
+                    else:
+                        self.deliver(session, job)
+                except Exception as exc:
+                    logger.error(f"Mail dispatcher error: {exc}")
+                    self._stop.wait(MAIL_POLL_SECONDS)
+        finally:
+            session.close()
+
+
+mail_dispatcher = MailDispatcher()
@@ -1,7 +1,9 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from app.database import Base, engine
+from app.database import ASYNC_ROUTES, Base, dispose_async_engine, engine
+from app.mailer import mail_dispatcher
+from app.passwords import shutdown_password_pool, start_password_pool
 import traceback
 
 # Import models to ensure they are registered with SQLAlchemy
@@ -11,10 +13,16 @@ from app.models.workers import Worker
 from app.models.report import Report
 from app.models.review import Review
 from app.models.notification import Notification
+from app.models.conversation import Conversation, Message
+from app.models.counter import UserCounter
+from app.models.otp import OtpCode
+from app.models.mail import OutboundEmail
+from app.models.rate_limit import RateLimitBucket
 
 
 from app.routers import auth, jobs, workers, reports, reviews
-from app.routers import admin_reports, admin_workers, notifications, admin
+from app.routers import admin_reports, admin_workers, notifications, admin, events, messages
+from app.routers import jobs_async, workers_async, notifications_async, messages_async, reviews_async
 
 
 app = FastAPI()
@@ -39,10 +47,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+def start_hashing_pool():
+    start_password_pool()
+
+
+# Registered after the password pool so its workers fork before these threads exist
+@app.on_event("startup")
+def start_mail_dispatcher():
+    mail_dispatcher.start()
+
+
+@app.on_event("shutdown")
+def stop_password_pool():
+    shutdown_password_pool()
+
+
+@app.on_event("shutdown")
+def stop_mail_dispatcher():
+    mail_dispatcher.stop()
+
+
+@app.on_event("shutdown")
+async def close_async_engine():
+    await dispose_async_engine()
+
+
 @app.get("/")
 def root():
     return {"message": "Jobsify backend running"}
 
+if ASYNC_ROUTES:
+    # Async read routes shadow their sync twins, so they must be mounted first
+    app.include_router(jobs_async)
+    app.include_router(workers_async)
+    app.include_router(notifications_async)
+    app.include_router(messages_async)
+    app.include_router(reviews_async)
+
 app.include_router(auth)
 app.include_router(jobs)
 app.include_router(workers)
@@ -52,3 +94,5 @@ app.include_router(admin_reports)
 app.include_router(admin_workers)
 app.include_router(notifications)
 app.include_router(admin)
+app.include_router(messages)
+app.include_router(events)
@@ -1,18 +1,251 @@
 """
-Simple in-memory rate limiter for FastAPI
+Rate limiter for the auth endpoints.
+
+Each key (e.g. "login:<email>") is a sliding-window counter: the number of
+requests in the current fixed window plus the previous window's count,
+weighted by how much of that window still overlaps the sliding one. That
+is four numbers per key no matter how many requests it makes, and a
+check is O(1). Emails in keys are normalized, so case and whitespace
+variants of one address share a budget. A key that goes over its limit is locked out for
+RATE_LIMIT_LOCKOUT_SECONDS.
+
+The backend decides where counters live:
+- "database" (default): the rate_limits table, so limits hold across
+  uvicorn workers and restarts; each check is a single atomic upsert
+- "redis": shared through Redis; each check is one Lua script (needs the optional `redis` package)
+- "memory": this process only; LRU-bounded to RATE_LIMIT_MAX_KEYS and
+  idle keys expire once their windows and lockout have passed
 """
+import logging
+import math
+import os
+import threading
 import time
-from collections import defaultdict
-from fastapi import HTTPException, Request
+from collections import OrderedDict
+
+from fastapi import HTTPException
+from sqlalchemy import delete, text
+
+from app.database import engine
+from app.emails import normalize_email
+from app.models.rate_limit import RateLimitBucket
+
+logger = logging.getLogger("jobsify")
+
+RATE_LIMIT_BACKEND = os.environ.get("JOBSIFY_RATE_LIMIT_BACKEND", "database")
+RATE_LIMIT_LOCKOUT_SECONDS = int(os.environ.get("JOBSIFY_RATE_LIMIT_LOCKOUT", "300"))
+RATE_LIMIT_MAX_KEYS = int(os.environ.get("JOBSIFY_RATE_LIMIT_MAX_KEYS", "100000"))
+RATE_LIMIT_SWEEP_INTERVAL = int(os.environ.get("JOBSIFY_RATE_LIMIT_SWEEP_INTERVAL", "60"))
+RATE_LIMIT_REDIS_URL = os.environ.get("JOBSIFY_REDIS_URL", "redis://localhost:6379/0")
+RATE_LIMIT_REDIS_PREFIX = "jobsify:ratelimit:"
+
+
+def window_start(now: float, window: int) -> int:
+    return int(now // window) * window
+
+
+class MemoryRateLimitBackend:
+    """Counters local to this process, in an LRU map."""
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self._max_keys = max_keys
+        # key -> [window_start, current, previous, locked_until, expires_at], least recently hit first
+        self._buckets: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def hit(self, key: str, limit: int, window: int, lockout: int, now: float) -> float:
+        """Count a request; returns when the key's lockout ends (in the past if allowed)."""
+        start = window_start(now, window)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [start, 0, 0, 0.0, 0.0]
+            else:
+                self._buckets.move_to_end(key)
+
+            if 0 < bucket[3] <= now:
+                # A lockout that has run out starts the key over, as if it were new
+                bucket[1:4] = [0, 0, 0.0]
+            if bucket[0] != start:
+                bucket[2] = bucket[1] if bucket[0] == start - window else 0
+                bucket[1] = 0
+                bucket[0] = start
+            if bucket[3] <= now:
+                estimate = bucket[2] * (1 - (now - start) / window) + bucket[1]
+                if estimate >= limit:
+                    bucket[3] = now + lockout
+                else:
+                    bucket[1] += 1
+            bucket[4] = max(start + 2 * window, bucket[3])
+            locked_until = bucket[3]
+
+            self._expire(now)
+            return locked_until
+
+    def _expire(self, now: float):
+        # The least recently hit keys are the likeliest to be idle; drop those that are
+        # done, then make room if the map is still over its bound
+        while self._buckets:
+            oldest = next(iter(self._buckets.values()))
+            if oldest[4] > now:
+                break
+            self._buckets.popitem(last=False)
+        while len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+            self.evictions += 1
+
+    def reset(self, key: str):
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._buckets)
+
+
+def _database_hit_sql() -> str:
+    # Every expression reads the row as it was before this statement, so the whole
+    # check-and-count is one atomic upsert on SQLite (3.35+) and PostgreSQL alike
+    lockout_over = "rate_limits.locked_until > 0 AND rate_limits.locked_until <= :now"
+    previous = (
+        f"CASE WHEN {lockout_over} THEN 0 "
+        "WHEN rate_limits.window_start = :window_start THEN rate_limits.previous_count "
+        "WHEN rate_limits.window_start = :window_start - :window THEN rate_limits.current_count ELSE 0 END"
+    )
+    current = (
+        f"CASE WHEN {lockout_over} THEN 0 "
+        "WHEN rate_limits.window_start = :window_start THEN rate_limits.current_count ELSE 0 END"
+    )
+    locked = "rate_limits.locked_until > :now"
+    over = f"({previous}) * :previous_weight + ({current}) >= :limit"
+    return f"""
+        INSERT INTO rate_limits (bucket, window_start, current_count, previous_count, locked_until, expires_at)
+        VALUES (:bucket, :window_start, 1, 0, 0, :expires_at)
+        ON CONFLICT (bucket) DO UPDATE SET
+            window_start = :window_start,
+            previous_count = {previous},
+            current_count = CASE WHEN {locked} OR {over} THEN {current} ELSE ({current}) + 1 END,
+            locked_until = CASE WHEN {locked} THEN rate_limits.locked_until
+                                WHEN {over} THEN :now + :lockout
+                                ELSE 0 END,
+            expires_at = :expires_at
+        RETURNING locked_until
+    """
+
+
+class DatabaseRateLimitBackend:
+    """Counters in the rate_limits table, shared by every worker."""
+
+    def __init__(self, bind=engine, sweep_interval: int = RATE_LIMIT_SWEEP_INTERVAL):
+        self._bind = bind
+        self._sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        self._hit = text(_database_hit_sql())
+
+    def hit(self, key: str, limit: int, window: int, lockout: int, now: float) -> float:
+        start = window_start(now, window)
+        with self._bind.begin() as conn:
+            locked_until = conn.execute(self._hit, {
+                "bucket": key,
+                "window_start": start,
+                "window": window,
+                "previous_weight": 1 - (now - start) / window,
+                "limit": limit,
+                "now": now,
+                "lockout": lockout,
+                # Upper bound on when the row stops mattering; precise enough for sweeping
+                "expires_at": start + 2 * window + lockout,
+            }).scalar_one()
+        if time.monotonic() - self._last_sweep >= self._sweep_interval:
+            self._last_sweep = time.monotonic()
+            self.sweep(now)
+        return locked_until
+
+    def sweep(self, now: float) -> int:
+        with self._bind.begin() as conn:
+            return conn.execute(delete(RateLimitBucket).where(RateLimitBucket.expires_at <= now)).rowcount
+
+    def reset(self, key: str):
+        with self._bind.begin() as conn:
+            conn.execute(delete(RateLimitBucket).where(RateLimitBucket.bucket == key))
+
+    def size(self) -> int:
+        with self._bind.connect() as conn:
+            return conn.execute(text("SELECT COUNT(*) FROM rate_limits")).scalar_one()
+
+
+_REDIS_HIT = """
+local now, window, limit, lockout = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+local start = math.floor(now / window) * window
+local state = redis.call('HMGET', KEYS[1], 'start', 'current', 'previous', 'locked_until')
+local bucket_start = tonumber(state[1])
+local current, previous, locked_until = tonumber(state[2]) or 0, tonumber(state[3]) or 0, tonumber(state[4]) or 0
+if locked_until > 0 and locked_until <= now then
+    current, previous, locked_until = 0, 0, 0
+end
+if bucket_start ~= start then
+    if bucket_start == start - window then previous = current else previous = 0 end
+    current = 0
+end
+if locked_until <= now then
+    if previous * (1 - (now - start) / window) + current >= limit then
+        locked_until = now + lockout
+    else
+        current = current + 1
+    end
+end
+redis.call('HSET', KEYS[1], 'start', start, 'current', current, 'previous', previous, 'locked_until', tostring(locked_until))
+redis.call('EXPIRE', KEYS[1], math.ceil(math.max(start + 2 * window, locked_until) - now))
+return tostring(locked_until)
+"""
+
+
+class RedisRateLimitBackend:
+    """Counters in Redis hashes that expire once they stop mattering."""
+
+    def __init__(self, url: str = RATE_LIMIT_REDIS_URL, prefix: str = RATE_LIMIT_REDIS_PREFIX):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("JOBSIFY_RATE_LIMIT_BACKEND=redis requires the 'redis' package") from exc
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._prefix = prefix
+        self._hit = self._client.register_script(_REDIS_HIT)
+
+    def hit(self, key: str, limit: int, window: int, lockout: int, now: float) -> float:
+        return float(self._hit(keys=[self._prefix + key], args=[now, window, limit, lockout]))
+
+    def reset(self, key: str):
+        self._client.delete(self._prefix + key)
+
+    def size(self):
+        return None
+
+
+def create_backend(name: str = RATE_LIMIT_BACKEND):
+    if name == "database":
+        return DatabaseRateLimitBackend()
+    if name == "redis":
+        return RedisRateLimitBackend()
+    if name == "memory":
+        return MemoryRateLimitBackend()
+    raise ValueError(f"Unknown rate limit backend: {name}")
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter"""
-    
-    def __init__(self):
-        self.requests = defaultdict(list)
-        self.locked_ips = {}
-    
+    """Sliding-window rate limiter with lockout"""
+
+    def __init__(self, backend=None, lockout_seconds: int = RATE_LIMIT_LOCKOUT_SECONDS):
+        self._backend = backend
+        self._lockout_seconds = lockout_seconds
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = create_backend()
+        return self._backend
+
     def check_rate_limit(self, key: str, max_requests: int = 5, window_seconds: int = 60):
         """
         Check if key has exceeded rate limit
@@ -22,39 +255,23 @@ class RateLimiter:
             window_seconds: Time window in seconds
         """
         now = time.time()
-        
-        # Check if IP is locked
-        if key in self.locked_ips:
-            if time.time() < self.locked_ips[key]:
-                raise HTTPException(
-                    status_code=429,
-                    detail="Too many attempts. Please try again later."
-                )
-            else:
-                # Unlock the IP
-                del self.locked_ips[key]
-        
-        # Clean old requests
-        self.requests[key] = [t for t in self.requests[key] if now - t < window_seconds]
-        
-        # Check if limit exceeded
-        if len(self.requests[key]) >= max_requests:
-            # Lock for 5 minutes
-            self.locked_ips[key] = now + 300
+        try:
+            locked_until = self.backend.hit(key, max_requests, window_seconds, self._lockout_seconds, now)
+        except Exception as exc:
+            # Fail open: an unavailable limiter must not take sign-in down with it
+            logger.error(f"Rate limit check failed for {key}: {exc}")
+            return
+
+        if locked_until > now:
             raise HTTPException(
                 status_code=429,
-                detail="Too many attempts. Please try again later."
+                detail="Too many attempts. Please try again later.",
+                headers={"Retry-After": str(math.ceil(locked_until - now))},
             )
-        
-        # Add current request
-        self.requests[key].append(now)
-    
+
     def reset(self, key: str):
         """Reset rate limit for a key"""
-        if key in self.requests:
-            del self.requests[key]
-        if key in self.locked_ips:
-            del self.locked_ips[key]
+        self.backend.reset(key)
 
 
 # Global rate limiter instance
@@ -63,14 +280,14 @@ rate_limiter = RateLimiter()
 
 def check_login_rate_limit(email: str):
     """Check rate limit for login attempts"""
-    rate_limiter.check_rate_limit(f"login:{email}", max_requests=5, window_seconds=60)
+    rate_limiter.check_rate_limit(f"login:{normalize_email(email)}", max_requests=5, window_seconds=60)
 
 
 def check_register_rate_limit(email: str):
     """Check rate limit for registration attempts"""
-    rate_limiter.check_rate_limit(f"register:{email}", max_requests=3, window_seconds=300)
+    rate_limiter.check_rate_limit(f"register:{normalize_email(email)}", max_requests=3, window_seconds=300)
 
 
 def check_otp_rate_limit(email: str):
     """Check rate limit for OTP requests"""
-    rate_limiter.check_rate_limit(f"otp:{email}", max_requests=3, window_seconds=300)
+    rate_limiter.check_rate_limit(f"otp:{normalize_email(email)}", max_requests=3, window_seconds=300)
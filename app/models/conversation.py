@@ -1,8 +1,9 @@
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 
 from app.database import Base
+from app.emails import normalize_email
 
 
 class Conversation(Base):
@@ -27,6 +28,10 @@ class Conversation(Base):
         ),
     )
 
+    @validates("participant_one_email", "participant_two_email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
+
 
 class Message(Base):
     __tablename__ = "messages"
@@ -45,3 +50,7 @@ class Message(Base):
         Index("idx_messages_conversation_created", "conversation_id", "created_at"),
         Index("idx_messages_recipient_read", "recipient_email", "is_read"),
     )
+
+    @validates("sender_email", "recipient_email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
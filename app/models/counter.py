@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import validates
+
+from app.database import Base
+from app.emails import normalize_email
+
+
+class UserCounter(Base):
+    """Denormalized per-user badge counts, kept in step with messages/notifications."""
+
+    __tablename__ = "user_counters"
+
+    user_email = Column(String, primary_key=True)
+    unread_messages = Column(Integer, nullable=False, default=0)
+    unread_notifications = Column(Integer, nullable=False, default=0)
+
+    @validates("user_email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, Boolean, Float, ForeignKey, Index, DateTime
+from sqlalchemy.orm import validates
+from datetime import datetime, timezone
 from app.database import Base
+from app.emails import normalize_email
 
 
 class Job(Base):
@@ -14,11 +16,19 @@ class Job(Base):
     phone = Column(String, nullable=False)
     latitude = Column(String, nullable=True)
     longitude = Column(String, nullable=True)
+    # Numeric copies of latitude/longitude for radius search
+    lat = Column(Float, nullable=True)
+    lng = Column(Float, nullable=True)
     user_email = Column(String, nullable=False, index=True)
     verified = Column(Boolean, default=False, index=True)
     urgent = Column(Boolean, default=False)
     salary = Column(String, nullable=True)
+    # Numeric bounds parsed from `salary` at write time so range filters can use an index
+    salary_min = Column(Float, nullable=True)
+    salary_max = Column(Float, nullable=True)
     created_at = Column(String, default=lambda: datetime.now().isoformat(), index=True)
+    # Row version for HTTP validators (ETag / Last-Modified)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
     
     required_workers = Column(Integer, default=1)
     hired_count = Column(Integer, default=0)
@@ -36,8 +46,14 @@ class Job(Base):
         Index('idx_jobs_verified_hidden', 'verified', 'is_hidden'),
         Index('idx_jobs_user_verified', 'user_email', 'verified'),
         Index('idx_jobs_category_verified', 'category', 'verified'),
+        Index('idx_jobs_verified_hidden_salary', 'verified', 'is_hidden', 'salary_min', 'salary_max'),
+        Index('idx_jobs_verified_hidden_geo', 'verified', 'is_hidden', 'lat', 'lng'),
     )
 
+    @validates("user_email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
+
 
 class SavedJob(Base):
     __tablename__ = "saved_jobs"
@@ -50,3 +66,7 @@ class SavedJob(Base):
     __table_args__ = (
         Index('idx_saved_jobs_user_job', 'user_email', 'job_id', unique=True),
     )
+
+    @validates("user_email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
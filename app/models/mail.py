@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Float, Index, Integer, String, Text
+
+from app.database import Base
+
+
+class OutboundEmail(Base):
+    """Mail waiting for (or done with) delivery by the dispatcher in app/mailer.py."""
+
+    __tablename__ = "outbound_emails"
+
+    id = Column(Integer, primary_key=True)
+    recipient = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    # Blanked once the message is sent or given up on (it may hold an OTP)
+    body = Column(Text, nullable=False, default="")
+    status = Column(String, nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    # Unix times. While "sending", next_attempt_at is the claim's lease expiry
+    next_attempt_at = Column(Float, nullable=False)
+    created_at = Column(Float, nullable=False)
+    sent_at = Column(Float, nullable=True)
+    last_error = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index('idx_outbound_emails_status_due', 'status', 'next_attempt_at'),
+    )
@@ -1,6 +1,8 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
+from sqlalchemy.orm import validates
 from sqlalchemy.sql import func
 from app.database import Base
+from app.emails import normalize_email
 
 class Notification(Base):
     __tablename__ = "notifications"
@@ -17,3 +19,7 @@ class Notification(Base):
     __table_args__ = (
         Index('idx_notifications_user_read', 'user_email', 'is_read'),
     )
+
+    @validates("user_email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy.orm import validates
+
+from app.database import Base
+from app.emails import normalize_email
+
+
+class OtpCode(Base):
+    """Outstanding one-time code per email (used by the "database" OTP store)."""
+
+    __tablename__ = "otp_codes"
+
+    email = Column(String, primary_key=True)
+    purpose = Column(String, nullable=False)
+    # HMAC of the code, never the code itself
+    code_hash = Column(String, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    # Unix time, so every worker and both dialects compare it the same way
+    expires_at = Column(Float, nullable=False, index=True)
+
+    @validates("email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, Column, Float, Integer, String
+
+from app.database import Base
+
+
+class RateLimitBucket(Base):
+    """Sliding-window counter for one rate-limit key (used by the "database" limiter backend)."""
+
+    __tablename__ = "rate_limits"
+
+    bucket = Column(String, primary_key=True)
+    # Start (Unix seconds) of the current fixed window and the counts for it and the one before
+    window_start = Column(BigInteger, nullable=False)
+    current_count = Column(Integer, nullable=False, default=0)
+    previous_count = Column(Integer, nullable=False, default=0)
+    locked_until = Column(Float, nullable=False, default=0)
+    # Past this the row no longer affects any decision and may be swept
+    expires_at = Column(Float, nullable=False, index=True)
@@ -1,6 +1,8 @@
 from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy.orm import validates
 from sqlalchemy.sql import func
 from app.database import Base
+from app.emails import normalize_email
 
 
 class Report(Base):
@@ -16,3 +18,7 @@ class Report(Base):
     description = Column(String, nullable=True)
     status = Column(String, default="pending")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    @validates("reporter_email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
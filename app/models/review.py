@@ -1,6 +1,8 @@
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import validates
 from datetime import datetime, timezone
 from app.database import Base
+from app.emails import normalize_email
 
 
 class Review(Base):
@@ -13,9 +15,11 @@ class Review(Base):
     rating = Column(Integer, nullable=False, index=True)
     comment = Column(String, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
     __table_args__ = (
         Index('idx_reviews_worker_rating', 'worker_id', 'rating'),
+        Index('idx_reviews_worker_created', 'worker_id', 'created_at', 'id'),
     )
     
     def to_dict(self):
@@ -37,3 +41,7 @@ class Review(Base):
                 return self.created_at
             return self.created_at.isoformat()
         return None
+
+    @validates("reviewer_email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
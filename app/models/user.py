@@ -1,6 +1,8 @@
 from sqlalchemy import Boolean, Column, Index, Integer, String
+from sqlalchemy.orm import validates
 
 from app.database import Base
+from app.emails import normalize_email
 
 
 class User(Base):
@@ -31,3 +33,7 @@ class User(Base):
         if self.email and "@" in self.email:
             return self.email.split("@")[0]
         return "User"
+
+    @validates("email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
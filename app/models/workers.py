@@ -1,5 +1,8 @@
-from sqlalchemy import Column, Integer, String, Boolean, Float, Index
+from sqlalchemy import Column, Integer, String, Boolean, Float, Index, DateTime
+from sqlalchemy.orm import validates
+from datetime import datetime, timezone
 from app.database import Base
+from app.emails import normalize_email
 
 
 class Worker(Base):
@@ -11,10 +14,13 @@ class Worker(Base):
     name = Column(String)
     role = Column(String, index=True)
     phone = Column(String)
-    experience = Column(Integer, index=True)
+    experience = Column(Integer, default=0, index=True)
     location = Column(String, index=True)
     latitude = Column(String, nullable=True)
     longitude = Column(String, nullable=True)
+    # Numeric copies of latitude/longitude for radius search
+    lat = Column(Float, nullable=True)
+    lng = Column(Float, nullable=True)
     user_email = Column(String, nullable=False, index=True)
     is_verified = Column(Boolean, default=False, index=True)
     availability_type = Column(String, default="everyday", index=True)
@@ -22,9 +28,37 @@ class Worker(Base):
     is_available = Column(Boolean, default=True, index=True)
     rating = Column(Float, default=0, index=True)
     reviews = Column(Integer, default=0)
+    # Running rating aggregates, updated with deltas on every review write
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_5 = Column(Integer, nullable=False, default=0, server_default="0")
+    # Bumped by every review insert, edit and delete; versions the worker's review list
+    review_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # Row version for HTTP validators (ETag / Last-Modified); also bumped by rating deltas
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    @property
+    def rating_distribution(self) -> dict:
+        return {
+            5: self.rating_5 or 0,
+            4: self.rating_4 or 0,
+            3: self.rating_3 or 0,
+            2: self.rating_2 or 0,
+            1: self.rating_1 or 0,
+        }
 
     __table_args__ = (
         Index('idx_workers_verified_available', 'is_verified', 'is_available'),
         Index('idx_workers_role_verified', 'role', 'is_verified'),
         Index('idx_workers_location_verified', 'location', 'is_verified'),
+        Index('idx_workers_verified_available_geo', 'is_verified', 'is_available', 'lat', 'lng'),
+        Index('idx_workers_verified_available_rating', 'is_verified', 'is_available', 'rating'),
+        Index('idx_workers_verified_available_experience', 'is_verified', 'is_available', 'experience'),
     )
+
+    @validates("user_email")
+    def _normalize_email(self, key, value):
+        return normalize_email(value)
@@ -0,0 +1,286 @@
+"""
+One-time codes for email verification and password reset.
+
+Each email has at most one outstanding code; issuing a new one replaces
+it. Only an HMAC of the code (keyed with JOBSIFY_OTP_SECRET) is stored.
+A code expires after its TTL and is deleted after OTP_MAX_ATTEMPTS wrong
+guesses, so a 6-digit code cannot be brute-forced in its lifetime. A
+correct code is consumed atomically: it works once, even if two workers
+check it at the same moment. A check can also leave a correct code in
+place (consume=False) so a caller can finish costly work before spending
+it; wrong guesses count against the code either way.
+
+The backend decides where codes live:
+- "database" (default): the otp_codes table, shared by every uvicorn worker
+- "redis": shared through Redis, which expires keys itself (needs the optional `redis` package)
+- "memory": this process only (single-worker development); bounded, swept by a background thread
+"""
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import delete, insert, select, update
+
+from app.database import engine
+from app.models.otp import OtpCode
+
+logger = logging.getLogger("jobsify")
+
+OTP_BACKEND = os.environ.get("JOBSIFY_OTP_BACKEND", "database")
+OTP_SECRET = os.environ.get("JOBSIFY_OTP_SECRET", "jobsify-otp-secret-change-in-production")
+OTP_TTL_SECONDS = int(os.environ.get("JOBSIFY_OTP_TTL", "300"))
+OTP_MAX_ATTEMPTS = int(os.environ.get("JOBSIFY_OTP_MAX_ATTEMPTS", "5"))
+OTP_MAX_ENTRIES = int(os.environ.get("JOBSIFY_OTP_MAX_ENTRIES", "10000"))
+OTP_SWEEP_INTERVAL = int(os.environ.get("JOBSIFY_OTP_SWEEP_INTERVAL", "60"))
+OTP_REDIS_URL = os.environ.get("JOBSIFY_REDIS_URL", "redis://localhost:6379/0")
+OTP_REDIS_PREFIX = "jobsify:otp:"
+
+# Outcomes of OtpStore.verify
+VERIFIED = "verified"
+MISSING = "missing"  # no code, expired, or issued for another purpose
+INVALID = "invalid"
+LOCKED = "locked"  # this guess used up the last attempt; the code is gone
+
+
+@dataclass
+class OtpRecord:
+    purpose: str
+    code_hash: str
+    expires_at: float  # Unix time
+    attempts: int = 0
+
+
+def hash_code(email: str, purpose: str, code: str) -> str:
+    message = f"{email}\x00{purpose}\x00{code}".encode()
+    return hmac.new(OTP_SECRET.encode(), message, hashlib.sha256).hexdigest()
+
+
+class MemoryOtpBackend:
+    """Bounded map local to this process; a daemon thread drops expired codes."""
+
+    def __init__(self, max_entries: int = OTP_MAX_ENTRIES, sweep_interval: int = OTP_SWEEP_INTERVAL):
+        self._max_entries = max_entries
+        self._sweep_interval = sweep_interval
+        self._entries: OrderedDict = OrderedDict()  # email -> OtpRecord, oldest issue first
+        self._lock = threading.Lock()
+        self._sweeper: Optional[threading.Thread] = None
+        self.evictions = 0
+
+    def put(self, email: str, record: OtpRecord):
+        with self._lock:
+            self._entries[email] = record
+            self._entries.move_to_end(email)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            if self._sweeper is None:
+                self._sweeper = threading.Thread(target=self._sweep_forever, name="otp-sweeper", daemon=True)
+                self._sweeper.start()
+
+    def check(self, email: str, purpose: str, code_hash: str, max_attempts: int, consume: bool = True) -> str:
+        with self._lock:
+            record = self._entries.get(email)
+            if record is None:
+                return MISSING
+            if record.expires_at <= time.time():
+                del self._entries[email]
+                return MISSING
+            if record.purpose != purpose:
+                return MISSING
+            if hmac.compare_digest(record.code_hash, code_hash):
+                if consume:
+                    del self._entries[email]
+                return VERIFIED
+            record.attempts += 1
+            if record.attempts >= max_attempts:
+                del self._entries[email]
+                return LOCKED
+            return INVALID
+
+    def discard(self, email: str):
+        with self._lock:
+            self._entries.pop(email, None)
+
+    def sweep(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [email for email, record in self._entries.items() if record.expires_at <= now]
+            for email in expired:
+                del self._entries[email]
+        return len(expired)
+
+    def _sweep_forever(self):
+        while True:
+            time.sleep(self._sweep_interval)
+            try:
+                self.sweep()
+            except Exception as exc:
+                logger.error(f"OTP sweep failed: {exc}")
+
+
+class DatabaseOtpBackend:
+    """Keeps codes in otp_codes so any worker can verify what another issued."""
+
+    def __init__(self, bind=engine, sweep_interval: int = OTP_SWEEP_INTERVAL):
+        self._bind = bind
+        self._sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+
+    def _upsert(self, values: dict):
+        dialect = self._bind.dialect.name
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        elif dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            dialect_insert = None
+
+        with self._bind.begin() as conn:
+            if dialect_insert is None:
+                conn.execute(delete(OtpCode).where(OtpCode.email == values["email"]))
+                conn.execute(insert(OtpCode).values(**values))
+                return
+            statement = dialect_insert(OtpCode).values(**values)
+            conn.execute(statement.on_conflict_do_update(
+                index_elements=[OtpCode.email],
+                set_={name: statement.excluded[name] for name in values if name != "email"},
+            ))
+
+    def put(self, email: str, record: OtpRecord):
+        self._upsert({
+            "email": email,
+            "purpose": record.purpose,
+            "code_hash": record.code_hash,
+            "attempts": record.attempts,
+            "expires_at": record.expires_at,
+        })
+        # Unverified signups never come back for their code; clear those out now and then
+        if time.monotonic() - self._last_sweep >= self._sweep_interval:
+            self._last_sweep = time.monotonic()
+            self.sweep()
+
+    def check(self, email: str, purpose: str, code_hash: str, max_attempts: int, consume: bool = True) -> str:
+        with self._bind.begin() as conn:
+            row = conn.execute(
+                select(OtpCode.purpose, OtpCode.code_hash, OtpCode.expires_at).where(OtpCode.email == email)
+            ).first()
+            if row is None or row.expires_at <= time.time() or row.purpose != purpose:
+                return MISSING
+            # Every write below is conditioned on the code we read, so a concurrent
+            # re-issue or verification in another worker is never clobbered
+            current = (OtpCode.email == email) & (OtpCode.code_hash == row.code_hash)
+            if hmac.compare_digest(row.code_hash, code_hash):
+                if not consume:
+                    return VERIFIED
+                consumed = conn.execute(delete(OtpCode).where(current)).rowcount
+                return VERIFIED if consumed else MISSING
+            conn.execute(update(OtpCode).where(current).values(attempts=OtpCode.attempts + 1))
+            locked = conn.execute(delete(OtpCode).where(current & (OtpCode.attempts >= max_attempts))).rowcount
+            return LOCKED if locked else INVALID
+
+    def discard(self, email: str):
+        with self._bind.begin() as conn:
+            conn.execute(delete(OtpCode).where(OtpCode.email == email))
+
+    def sweep(self) -> int:
+        with self._bind.begin() as conn:
+            return conn.execute(delete(OtpCode).where(OtpCode.expires_at <= time.time())).rowcount
+
+
+# Runs atomically on the Redis server; HMACs are compared as plain strings there
+_REDIS_CHECK = """
+local record = redis.call('HMGET', KEYS[1], 'purpose', 'code_hash')
+if not record[1] or record[1] ~= ARGV[1] then
+    return 'missing'
+end
+if record[2] == ARGV[2] then
+    if ARGV[4] == '1' then
+        redis.call('DEL', KEYS[1])
+    end
+    return 'verified'
+end
+if redis.call('HINCRBY', KEYS[1], 'attempts', 1) >= tonumber(ARGV[3]) then
+    redis.call('DEL', KEYS[1])
+    return 'locked'
+end
+return 'invalid'
+"""
+
+
+class RedisOtpBackend:
+    """Shares codes between processes through Redis; keys expire with the code."""
+
+    def __init__(self, url: str = OTP_REDIS_URL, prefix: str = OTP_REDIS_PREFIX):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("JOBSIFY_OTP_BACKEND=redis requires the 'redis' package") from exc
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._prefix = prefix
+        self._check = self._client.register_script(_REDIS_CHECK)
+
+    def put(self, email: str, record: OtpRecord):
+        key = self._prefix + email
+        ttl_ms = max(1, int((record.expires_at - time.time()) * 1000))
+        pipeline = self._client.pipeline()
+        pipeline.delete(key)
+        pipeline.hset(key, mapping={"purpose": record.purpose, "code_hash": record.code_hash, "attempts": record.attempts})
+        pipeline.pexpire(key, ttl_ms)
+        pipeline.execute()
+
+    def check(self, email: str, purpose: str, code_hash: str, max_attempts: int, consume: bool = True) -> str:
+        return self._check(keys=[self._prefix + email], args=[purpose, code_hash, max_attempts, int(consume)])
+
+    def discard(self, email: str):
+        self._client.delete(self._prefix + email)
+
+    def sweep(self) -> int:
+        return 0
+
+
+def create_backend(name: str = OTP_BACKEND):
+    if name == "database":
+        return DatabaseOtpBackend()
+    if name == "redis":
+        return RedisOtpBackend()
+    if name == "memory":
+        return MemoryOtpBackend()
+    raise ValueError(f"Unknown OTP backend: {name}")
+
+
+class OtpStore:
+    """Issues and checks codes; the backend only ever sees their hashes."""
+
+    def __init__(self, backend=None, max_attempts: int = OTP_MAX_ATTEMPTS):
+        self._backend = backend
+        self._max_attempts = max_attempts
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = create_backend()
+        return self._backend
+
+    def issue(self, email: str, purpose: str, ttl: int = OTP_TTL_SECONDS) -> str:
+        """Create a code for `email`, replacing any outstanding one, and return it."""
+        code = str(100000 + secrets.randbelow(900000))
+        record = OtpRecord(purpose=purpose, code_hash=hash_code(email, purpose, code), expires_at=time.time() + ttl)
+        self.backend.put(email, record)
+        return code
+
+    def verify(self, email: str, purpose: str, code: str, consume: bool = True) -> str:
+        """Check `code`; returns VERIFIED (and consumes it unless `consume` is False), MISSING, INVALID or LOCKED."""
+        return self.backend.check(email, purpose, hash_code(email, purpose, code), self._max_attempts, consume)
+
+    def discard(self, email: str):
+        self.backend.discard(email)
+
+
+otp_store = OtpStore()
@@ -0,0 +1,90 @@
+"""
+Opaque cursor helpers for keyset pagination
+"""
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import String
+from sqlalchemy.types import TypeDecorator
+
+
+def encode_cursor(values: dict) -> str:
+    """Encode the sort key of the last row on a page into an opaque token."""
+    raw = json.dumps(values, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+# Accepted JSON types per cursor key (bool is excluded separately: it is an int in Python)
+CURSOR_KEY_TYPES = {
+    "id": (int,),
+    "sort": (str,),
+    "value": (int, float, type(None)),
+    "at": (str,),
+    "worker": (int,),
+}
+
+
+def _valid(key: str, value) -> bool:
+    if isinstance(value, bool):
+        return False
+    if not isinstance(value, CURSOR_KEY_TYPES.get(key, (int, float, str, type(None)))):
+        return False
+    if key == "at":
+        try:
+            datetime.fromisoformat(value)
+        except ValueError:
+            return False
+    return True
+
+
+def decode_cursor(cursor: str, *keys: str) -> dict:
+    """
+    Decode a token produced by encode_cursor.
+    Raises a 400 when the token is malformed, missing one of the expected keys,
+    or holds a value of the wrong type for one of them.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if not isinstance(values, dict) or any(key not in values or not _valid(key, values[key]) for key in keys):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+class CursorTimestamp(TypeDecorator):
+    """
+    A timestamp column as carried in a cursor "at" value: an ISO string either way.
+
+    On SQLite it is the stored text, compared as text: rows there can mix
+    second and microsecond precision, so only the exact stored value compares
+    equal to itself. Elsewhere it is bound and read with the column's own type.
+    Use as `type_coerce(column, CursorTimestamp(column.type))` to read the
+    value and `literal(value, CursorTimestamp(column.type))` to compare with it.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, column_type):
+        super().__init__()
+        self.column_type = column_type
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(self.column_type)
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "sqlite":
+            return value
+        return datetime.fromisoformat(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return value.isoformat()
@@ -0,0 +1,169 @@
+"""
+Password hashing off the request threadpool.
+
+bcrypt spends ~200ms of CPU per hash or check at the default cost. Run
+inline in sync handlers, a login burst takes every threadpool thread and
+core, and unrelated endpoints queue behind it. In server mode hashing
+therefore runs on a small dedicated process pool (lower CPU priority than
+the API process), and admission control caps how many requests may wait
+on it. A request beyond the cap gets 503 + Retry-After after at most
+PASSWORD_ADMISSION_TIMEOUT instead of holding a threadpool thread, so
+auth never takes more than PASSWORD_MAX_PENDING of them.
+
+If a worker process dies (e.g. OOM-killed), the pool is broken for good;
+it is replaced once per failure and the request retried, and a second
+failure answers 503 rather than 500.
+
+The bcrypt cost is configurable; hashes made with a different cost are
+upgraded on the next successful login (see needs_rehash).
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import bcrypt
+from fastapi import HTTPException
+
+logger = logging.getLogger("jobsify")
+
+BCRYPT_ROUNDS = int(os.environ.get("JOBSIFY_BCRYPT_ROUNDS", "12"))
+# Worker processes; 0 hashes inline (default outside server mode, e.g. scripts)
+PASSWORD_WORKERS = os.environ.get("JOBSIFY_PASSWORD_WORKERS")
+# Requests allowed to wait on the pool (running + queued) before shedding load;
+# each one holds a threadpool thread, so keep this well under its 40 threads
+PASSWORD_MAX_PENDING = int(os.environ.get("JOBSIFY_PASSWORD_MAX_PENDING", "16"))
+PASSWORD_ADMISSION_TIMEOUT = float(os.environ.get("JOBSIFY_PASSWORD_ADMISSION_TIMEOUT", "0.1"))
+PASSWORD_WORKER_NICE = int(os.environ.get("JOBSIFY_PASSWORD_WORKER_NICE", "5"))
+
+_executor: Optional[ProcessPoolExecutor] = None
+_admission: Optional[threading.BoundedSemaphore] = None
+_executor_lock = threading.Lock()
+
+
+# ---------------- RUN IN WORKER PROCESSES ----------------
+
+def _lower_priority(nice: int):
+    if nice and hasattr(os, "nice"):
+        os.nice(nice)
+
+
+def _hash(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _check(password: bytes, hashed: bytes) -> bool:
+    try:
+        return bcrypt.checkpw(password, hashed)
+    except ValueError:
+        # Not a bcrypt hash (e.g. a legacy plain value); never a match
+        return False
+
+
+# ---------------- POOL ----------------
+
+def _worker_count() -> int:
+    if PASSWORD_WORKERS is not None:
+        return int(PASSWORD_WORKERS)
+    from app.database import DEPLOYMENT_MODE
+
+    if DEPLOYMENT_MODE != "server":
+        return 0
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+def _new_executor(workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_lower_priority,
+        initargs=(PASSWORD_WORKER_NICE,),
+    )
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor, _admission
+    if _admission is not None:
+        return _executor
+    with _executor_lock:
+        if _admission is None:
+            workers = _worker_count()
+            if workers > 0:
+                _executor = _new_executor(workers)
+            _admission = threading.BoundedSemaphore(PASSWORD_MAX_PENDING)
+    return _executor
+
+
+def _replace_executor(broken: ProcessPoolExecutor) -> Optional[ProcessPoolExecutor]:
+    """Swap out a broken pool; threads that saw the same failure share one replacement."""
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            logger.error("Password hashing pool broke (a worker process died); starting a new one")
+            broken.shutdown(wait=False, cancel_futures=True)
+            _executor = _new_executor(_worker_count())
+        return _executor
+
+
+def _unavailable(detail: str) -> HTTPException:
+    return HTTPException(status_code=503, detail=detail, headers={"Retry-After": "1"})
+
+
+def _run(fn, *args):
+    executor = _get_executor()
+    if not _admission.acquire(timeout=PASSWORD_ADMISSION_TIMEOUT):
+        raise _unavailable("Too many sign-in requests right now. Please try again shortly.")
+    try:
+        if executor is None:
+            return fn(*args)
+        try:
+            return executor.submit(fn, *args).result()
+        except BrokenProcessPool:
+            executor = _replace_executor(executor)
+        if executor is None:
+            # The pool was shut down meanwhile
+            raise _unavailable("Sign-in is temporarily unavailable. Please try again shortly.")
+        try:
+            return executor.submit(fn, *args).result()
+        except BrokenProcessPool:
+            raise _unavailable("Sign-in is temporarily unavailable. Please try again shortly.")
+    finally:
+        _admission.release()
+
+
+def start_password_pool():
+    """
+    Start the workers at app startup, before request threads exist, so they
+    are forked from a quiet process and the first logins skip process start-up.
+    """
+    executor = _get_executor()
+    if executor is not None:
+        for future in [executor.submit(_lower_priority, 0) for _ in range(_worker_count())]:
+            future.result()
+
+
+def shutdown_password_pool():
+    global _executor, _admission
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _admission = None
+
+
+# ---------------- PUBLIC API ----------------
+
+def hash_password(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    return _run(_hash, password.encode(), rounds).decode()
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    return _run(_check, password.encode(), hashed.encode())
+
+
+def needs_rehash(hashed: str, rounds: int = BCRYPT_ROUNDS) -> bool:
+    """True when `hashed` was made with a different bcrypt cost than configured."""
+    # $2b$12$<salt+hash>
+    parts = hashed.split("$")
+    return len(parts) < 4 or not parts[2].isdigit() or int(parts[2]) != rounds
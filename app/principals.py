@@ -0,0 +1,153 @@
+"""
+Cache of authenticated principals for the auth dependencies.
+
+get_current_user / get_current_admin only need a user's id, email, role
+and blocked flag, so those are cached per token subject (the email) with
+a TTL and an LRU bound instead of reading the users table on every
+protected request. ORM hooks drop a user's entry once a transaction that
+changes or deletes the row commits (blocking, password resets, role
+changes, ...), so every write path through SessionLocal invalidates
+without calling the cache explicitly.
+
+The cache is local to each process; writes made in another uvicorn worker
+are picked up there when the entry expires (JOBSIFY_PRINCIPAL_CACHE_TTL).
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.emails import normalize_email
+from app.models.user import User
+
+PRINCIPAL_CACHE_TTL_SECONDS = int(os.environ.get("JOBSIFY_PRINCIPAL_CACHE_TTL", "30"))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.environ.get("JOBSIFY_PRINCIPAL_CACHE_MAX_ENTRIES", "4096"))
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: int
+    email: str
+    role: str
+    blocked: bool
+
+
+class PrincipalCache:
+    """TTL + LRU map of email -> Principal."""
+
+    def __init__(self, ttl: int = PRINCIPAL_CACHE_TTL_SECONDS, max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()  # email -> (expires_at, principal)
+        self._lock = threading.Lock()
+        # Bumped by every invalidation so a lookup that raced with one is not stored
+        self._epoch = 0
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+
+    def epoch(self) -> int:
+        with self._lock:
+            return self._epoch
+
+    def get(self, email: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is not None and time.monotonic() <= entry[0]:
+                self._entries.move_to_end(email)
+                self._stats["hits"] += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[email]
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, principal: Principal, epoch: int):
+        """Store `principal` unless an invalidation happened since `epoch` was read."""
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._entries[principal.email] = (time.monotonic() + self._ttl, principal)
+            self._entries.move_to_end(principal.email)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, *emails: str):
+        with self._lock:
+            self._epoch += 1
+            for email in emails:
+                self._entries.pop(email, None)
+            self._stats["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["ttl_seconds"] = self._ttl
+        return stats
+
+
+principal_cache = PrincipalCache()
+
+
+def load_principal(db: Session, email: str) -> Optional[Principal]:
+    """Cached principal for `email`, or None if there is no such user."""
+    # Keyed like the invalidation hooks below, whatever case the token subject has
+    email = normalize_email(email)
+    principal = principal_cache.get(email)
+    if principal is not None:
+        return principal
+
+    epoch = principal_cache.epoch()
+    row = (
+        db.query(User.id, User.email, User.role, User.blocked)
+        .filter(User.email == email)
+        .first()
+    )
+    if row is None:
+        return None
+    principal = Principal(id=row.id, email=row.email, role=row.role, blocked=bool(row.blocked))
+    principal_cache.set(principal, epoch)
+    return principal
+
+
+# ---------------- ORM HOOKS ----------------
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_changed_principals(session, flush_context):
+    emails = session.info.setdefault("principal_emails", set())
+    for obj in list(session.dirty) + list(session.deleted):
+        if not isinstance(obj, User):
+            continue
+        # Include the old address when the email itself changed
+        history = sa_inspect(obj).attrs.email.history
+        for email in (*history.unchanged, *history.deleted, *history.added):
+            if email:
+                emails.add(normalize_email(email))
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_committed_principals(session):
+    emails = session.info.pop("principal_emails", None)
+    if emails:
+        principal_cache.invalidate(*emails)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_rolled_back_principals(session):
+    session.info.pop("principal_emails", None)
@@ -0,0 +1,102 @@
+"""
+Incremental worker rating aggregates
+
+Each review write adjusts the worker's running sum, count and per-star
+histogram with a single UPDATE in the same transaction, instead of
+re-reading every review. rebuild_worker_ratings recomputes them from the
+reviews table to repair drift.
+"""
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import Float, Numeric, case, cast, func, update
+from sqlalchemy.orm import Session
+
+from app.models.review import Review
+from app.models.workers import Worker
+
+STAR_COLUMNS = {
+    1: Worker.rating_1,
+    2: Worker.rating_2,
+    3: Worker.rating_3,
+    4: Worker.rating_4,
+    5: Worker.rating_5,
+}
+
+
+def apply_rating_change(
+    db: Session, worker_id: int, added: Optional[int] = None, removed: Optional[int] = None
+):
+    """
+    Record a rating being added, removed, or changed (both) for a worker.
+    With neither, only the review version is bumped (a comment edit).
+    SET expressions see the pre-update row, so concurrent writers cannot
+    lose each other's deltas.
+    """
+    sum_delta = (added or 0) - (removed or 0)
+    count_delta = (added is not None) - (removed is not None)
+
+    star_deltas = defaultdict(int)
+    if added is not None:
+        star_deltas[added] += 1
+    if removed is not None:
+        star_deltas[removed] -= 1
+
+    new_sum = func.coalesce(Worker.rating_sum, 0) + sum_delta
+    new_count = func.coalesce(Worker.reviews, 0) + count_delta
+    values = {
+        Worker.review_version: Worker.review_version + 1,
+        Worker.rating_sum: new_sum,
+        Worker.reviews: new_count,
+        Worker.rating: case(
+            # Float division, then NUMERIC so round(x, 1) works on SQLite and PostgreSQL
+            (new_count > 0, func.round(cast(cast(new_sum, Float) / new_count, Numeric), 1)),
+            else_=0,
+        ),
+    }
+    for star, delta in star_deltas.items():
+        if delta:
+            column = STAR_COLUMNS[star]
+            values[column] = func.coalesce(column, 0) + delta
+
+    db.execute(
+        update(Worker).where(Worker.id == worker_id).values(values),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def rebuild_worker_ratings(db: Session) -> int:
+    """Recompute every worker's aggregates from the reviews table. Returns workers with reviews."""
+    histograms = defaultdict(lambda: defaultdict(int))
+    rows = (
+        db.query(Review.worker_id, Review.rating, func.count(Review.id))
+        .join(Worker, Worker.id == Review.worker_id)
+        .group_by(Review.worker_id, Review.rating)
+        .all()
+    )
+    for worker_id, rating, count in rows:
+        histograms[worker_id][rating] += count
+
+    db.execute(
+        update(Worker).values(
+            rating=0, reviews=0, rating_sum=0,
+            rating_1=0, rating_2=0, rating_3=0, rating_4=0, rating_5=0,
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    mappings = []
+    for worker_id, histogram in histograms.items():
+        count = sum(histogram.values())
+        total = sum(star * n for star, n in histogram.items())
+        mapping = {
+            "id": worker_id,
+            "reviews": count,
+            "rating_sum": total,
+            "rating": round(total / count, 1) if count else 0,
+        }
+        for star in STAR_COLUMNS:
+            mapping[f"rating_{star}"] = histogram.get(star, 0)
+        mappings.append(mapping)
+    db.bulk_update_mappings(Worker, mappings)
+    db.commit()
+    return len(mappings)
@@ -8,3 +8,10 @@ from .notifications import router as notifications
 from .admin import router as admin
 from .reviews import router as reviews
 from .messages import router as messages
+from .events import router as events
+
+from .jobs import async_router as jobs_async
+from .workers import async_router as workers_async
+from .notifications import async_router as notifications_async
+from .messages import async_router as messages_async
+from .reviews import async_router as reviews_async
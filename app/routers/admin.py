@@ -12,12 +12,14 @@ from pydantic import BaseModel
 
 class BlockUserRequest(BaseModel):
     user_id: int
+from app.principals import Principal
 from app.routers.auth import get_current_admin
+from app.cache import response_cache
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 @router.get("/stats")
-def get_admin_stats(db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def get_admin_stats(db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     try:
         pending_jobs = db.query(Job).filter(Job.verified == False).count()
         providers = db.query(Worker).filter(Worker.is_verified == False).count()
@@ -38,12 +40,17 @@ def get_admin_stats(db: Session = Depends(get_db), current_admin: User = Depends
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/cache-stats")
+def get_cache_stats(current_admin: Principal = Depends(get_current_admin)):
+    """Hit/miss counters of the listing response cache (this process only)."""
+    return response_cache.stats()
+
 @router.get("/users", response_model=List[UserResponse])
-def get_all_users(db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def get_all_users(db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     return db.query(User).all()
 
 @router.put("/users/block")
-def block_user(request: BlockUserRequest, db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def block_user(request: BlockUserRequest, db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     user = db.query(User).filter(User.id == request.user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
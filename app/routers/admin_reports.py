@@ -10,6 +10,7 @@ from app.models.workers import Worker
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.report import ReportResponse
+from app.principals import Principal
 from app.routers.auth import get_current_admin
 
 router = APIRouter(
@@ -25,7 +26,7 @@ class ReportActionRequest(BaseModel):
 @router.get("/")
 def get_all_reports(
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     return db.query(Report).order_by(Report.id.desc()).all()
 
@@ -33,7 +34,7 @@ def get_all_reports(
 @router.get("/pending")
 def get_pending_reports(
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     return db.query(Report).filter(Report.status == "pending").order_by(Report.id.desc()).all()
 
@@ -44,7 +45,7 @@ def take_action_on_report(
     action_data: Optional[ReportActionRequest] = None,
     action: Optional[str] = Query(default=None),
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_current_admin),
 ):
     # Accept both body and query param to avoid frontend/backend mismatch.
     resolved_action = (action_data.action if action_data else action)
@@ -1,17 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-import bcrypt
-import random
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 from datetime import datetime, timedelta, timezone
 
 from app.database import get_db
+from app.emails import normalize_email
 from app.schemas.user import UserCreate, UserLogin
 from app.models.user import User
+from app.mailer import enqueue_email
+from app.otp import INVALID, LOCKED, VERIFIED, otp_store
+from app.passwords import hash_password, needs_rehash, verify_password
+from app.principals import Principal, load_principal
 from app.middleware.rate_limiter import check_login_rate_limit, check_register_rate_limit, check_otp_rate_limit
 
 JWT_SECRET = "your-secret-key-change-in-production"
@@ -23,7 +23,6 @@ OTP_PURPOSE_RESET_PASSWORD = "reset-password"
 
 security = HTTPBearer()
 router = APIRouter(prefix="/auth", tags=["Auth"])
-otp_storage = {}
 
 ADMIN_EMAILS = [
     "admin@jobsify.com",
@@ -31,19 +30,10 @@ ADMIN_EMAILS = [
     "superadmin@jobsify.com"
 ]
 
-SMTP_SERVER = "smtp.gmail.com"
-SMTP_PORT = 587
-SENDER_EMAIL = "adithyancoding@gmail.com"
-SENDER_PASSWORD = "famn yqnn rjlz lhyl"
-
 
 def send_otp_email(recipient_email: str, otp: str):
+    # Queued for the background dispatcher (app/mailer.py); never waits on SMTP
     try:
-        msg = MIMEMultipart()
-        msg['From'] = SENDER_EMAIL
-        msg['To'] = recipient_email
-        msg['Subject'] = "Your OTP for Jobsify Email Verification"
-
         body = f"""
         Hello,
 
@@ -56,16 +46,10 @@ def send_otp_email(recipient_email: str, otp: str):
         Best regards,
         Jobsify Team
         """
-        msg.attach(MIMEText(body, 'plain'))
-
-        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-        server.starttls()
-        server.login(SENDER_EMAIL, SENDER_PASSWORD)
-        server.sendmail(SENDER_EMAIL, recipient_email, msg.as_string())
-        server.quit()
+        enqueue_email(recipient_email, "Your OTP for Jobsify Email Verification", body)
         return True
     except Exception as e:
-        print(f"Failed to send OTP email to {recipient_email}: {e}")
+        print(f"Failed to queue OTP email to {recipient_email}: {e}")
         return False
 
 
@@ -82,43 +66,29 @@ def validate_password_strength(password: str):
         raise HTTPException(status_code=400, detail="Password must contain at least one special character")
 
 
-def _create_otp_record(purpose: str) -> dict:
-    otp = str(random.randint(100000, 999999))
-    return {
-        "code": otp,
-        "purpose": purpose,
-        "expires_at": datetime.now(timezone.utc) + timedelta(minutes=OTP_EXPIRATION_MINUTES),
-    }
-
-
 def _store_otp(email: str, purpose: str) -> str:
-    record = _create_otp_record(purpose)
-    otp_storage[email] = record
-    send_otp_email(email, record["code"])
-    return record["code"]
-
-
-def _get_valid_otp_record(email: str, purpose: str | None = None):
-    record = otp_storage.get(email)
-    if not record:
-        return None
+    otp = otp_store.issue(email, purpose, ttl=OTP_EXPIRATION_MINUTES * 60)
+    send_otp_email(email, otp)
+    return otp
 
-    expires_at = record.get("expires_at")
-    if not expires_at or datetime.now(timezone.utc) > expires_at:
-        otp_storage.pop(email, None)
-        return None
 
-    if purpose and record.get("purpose") != purpose:
-        return None
-
-    return record
+def _consume_otp(email: str, purpose: str, otp: str, consume: bool = True):
+    """Raise unless `otp` is the outstanding code for `email`; a valid code works once."""
+    result = otp_store.verify(email, purpose, otp, consume=consume)
+    if result == VERIFIED:
+        return
+    if result == INVALID:
+        raise HTTPException(status_code=400, detail="Invalid OTP")
+    if result == LOCKED:
+        raise HTTPException(status_code=429, detail="Too many invalid attempts. Please request a new OTP.")
+    raise HTTPException(status_code=400, detail="OTP not found or expired")
 
 
 @router.post("/register")
 def register(user: UserCreate, db: Session = Depends(get_db)):
     check_register_rate_limit(user.email)
 
-    normalized_email = user.email.lower()
+    normalized_email = normalize_email(user.email)
     existing_user = db.query(User).filter(User.email == normalized_email).first()
     if existing_user:
         if existing_user.email_verified:
@@ -134,7 +104,7 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
 
     validate_password_strength(user.password)
     role = "admin" if normalized_email in ADMIN_EMAILS else "user"
-    hashed_password = bcrypt.hashpw(user.password.encode(), bcrypt.gensalt()).decode()
+    hashed_password = hash_password(user.password)
 
     new_user = User(
         first_name=(user.first_name or "").strip() or None,
@@ -170,16 +140,10 @@ def verify_otp(data: dict, db: Session = Depends(get_db)):
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    record = _get_valid_otp_record(db_user.email, OTP_PURPOSE_VERIFY_EMAIL)
-    if not record:
-        raise HTTPException(status_code=400, detail="OTP not found or expired")
-
-    if record["code"] != otp:
-        raise HTTPException(status_code=400, detail="Invalid OTP")
+    _consume_otp(db_user.email, OTP_PURPOSE_VERIFY_EMAIL, otp)
 
     db_user.email_verified = True
     db.commit()
-    otp_storage.pop(db_user.email, None)
 
     access_token = create_access_token(data={"sub": db_user.email})
     return {
@@ -196,7 +160,7 @@ def verify_otp(data: dict, db: Session = Depends(get_db)):
 
 @router.post("/forgot-password/request")
 def request_password_reset(data: dict, db: Session = Depends(get_db)):
-    email = (data.get("email") or "").strip().lower()
+    email = normalize_email(data.get("email") or "")
     if not email:
         raise HTTPException(status_code=400, detail="Email is required")
 
@@ -213,7 +177,7 @@ def request_password_reset(data: dict, db: Session = Depends(get_db)):
 
 @router.post("/forgot-password/reset")
 def reset_password(data: dict, db: Session = Depends(get_db)):
-    email = (data.get("email") or "").strip().lower()
+    email = normalize_email(data.get("email") or "")
     otp = (data.get("otp") or "").strip()
     new_password = data.get("new_password") or ""
 
@@ -225,16 +189,15 @@ def reset_password(data: dict, db: Session = Depends(get_db)):
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    record = _get_valid_otp_record(email, OTP_PURPOSE_RESET_PASSWORD)
-    if not record:
-        raise HTTPException(status_code=400, detail="OTP not found or expired")
+    # Check the code before hashing so only its holder can spend a hashing-pool slot
+    # (wrong guesses still count towards the lockout), but consume it only after:
+    # hashing can be refused with a 503, and the user must keep a code to retry with
+    _consume_otp(email, OTP_PURPOSE_RESET_PASSWORD, otp, consume=False)
+    password_hash = hash_password(new_password)
+    _consume_otp(email, OTP_PURPOSE_RESET_PASSWORD, otp)
 
-    if record["code"] != otp:
-        raise HTTPException(status_code=400, detail="Invalid OTP")
-
-    db_user.password = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt()).decode()
+    db_user.password = password_hash
     db.commit()
-    otp_storage.pop(email, None)
     return {"message": "Password reset successful"}
 
 
@@ -242,16 +205,23 @@ def reset_password(data: dict, db: Session = Depends(get_db)):
 def login(user: UserLogin, db: Session = Depends(get_db)):
     check_login_rate_limit(user.email)
 
-    normalized_email = user.email.lower()
+    normalized_email = normalize_email(user.email)
     db_user = db.query(User).filter(User.email == normalized_email).first()
     if not db_user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     if db_user.blocked:
         raise HTTPException(status_code=403, detail="Account blocked. Please contact support.")
 
-    if not bcrypt.checkpw(user.password.encode(), db_user.password.encode()):
+    if not verify_password(user.password, db_user.password):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
+    # Upgrade hashes made with an older cost factor while we have the plain password
+    if needs_rehash(db_user.password):
+        db_user.password = hash_password(user.password)
+    if db_user.email in ADMIN_EMAILS and db_user.role != "admin":
+        db_user.role = "admin"
+    db.commit()
+
     if not db_user.email_verified and db_user.role != "admin":
         _store_otp(db_user.email, OTP_PURPOSE_VERIFY_EMAIL)
         return {
@@ -306,18 +276,10 @@ def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(securi
         if not email:
             raise HTTPException(status_code=401, detail="Invalid token payload")
 
-        if email in ADMIN_EMAILS:
-            user = db.query(User).filter(User.email == email).first()
-            if user:
-                if user.role != "admin":
-                    user.role = "admin"
-                    db.commit()
-                return user
-
-        user = db.query(User).filter(User.email == email, User.role == "admin").first()
-        if not user:
+        principal = load_principal(db, email)
+        if not principal or (principal.role != "admin" and email not in ADMIN_EMAILS):
             raise HTTPException(status_code=401, detail="Invalid token or not admin")
-        return user
+        return principal
     except HTTPException:
         raise
     except Exception as exc:
@@ -335,12 +297,12 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         if not email:
             raise HTTPException(status_code=401, detail="Invalid token payload")
 
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
+        principal = load_principal(db, email)
+        if not principal:
             raise HTTPException(status_code=401, detail="User not found")
-        if user.blocked:
+        if principal.blocked:
             raise HTTPException(status_code=403, detail="Account blocked. Please contact support.")
-        return user
+        return principal
     except HTTPException:
         raise
     except Exception as exc:
@@ -348,7 +310,11 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 
 
 @router.get("/me")
-def get_me(current_user: User = Depends(get_current_user)):
+def get_me(current_user: Principal = Depends(get_current_user), db: Session = Depends(get_db)):
+    # The principal only carries what authorization needs; the profile comes from the row
+    current_user = db.get(User, current_user.id)
+    if not current_user:
+        raise HTTPException(status_code=401, detail="User not found")
     return {
         "id": current_user.id,
         "first_name": current_user.first_name,
@@ -362,7 +328,7 @@ def get_me(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/refresh")
-def refresh_token(current_user: User = Depends(get_current_user)):
+def refresh_token(current_user: Principal = Depends(get_current_user)):
     new_token = create_access_token(data={"sub": current_user.email})
     return {
         "message": "Token refreshed successfully",
@@ -0,0 +1,47 @@
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+
+from app.events import event_hub
+from app.routers.auth import verify_token
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+
+@router.websocket("/ws")
+async def events_socket(websocket: WebSocket, token: str = Query(...)):
+    """Stream new messages and notifications for the token's user as JSON frames."""
+    try:
+        email = verify_token(token).get("sub")
+    except HTTPException:
+        email = None
+    if not email:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    queue = event_hub.subscribe(email)
+    # Reading from the socket is the only way to notice a client going away
+    # while no events are flowing, so wait on both sides at once.
+    receiver = asyncio.create_task(_drain_client(websocket))
+    try:
+        while True:
+            getter = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                getter.cancel()
+                break
+            await websocket.send_json(getter.result())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        event_hub.unsubscribe(email, queue)
+
+
+async def _drain_client(websocket: WebSocket):
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
@@ -1,18 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import re
 
-from app.database import get_db
+from app.database import get_async_db, get_db
+from app.emails import normalize_email
 from app.models.job import Job, SavedJob
 from app.models.report import Report
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.job import JobCreate, JobResponse, SavedJobCreate, SavedJobResponse
 from app.schemas.report import ReportCreate, ReportResponse
+from app.principals import Principal
 from app.routers.auth import get_current_admin
+from app.pagination import encode_cursor, decode_cursor
+from app.geo import parse_lat_lng, bounding_box, distance_sq_expr, haversine_km
+from app.search import search_terms, search_ids
+from app.cache import response_cache
+from app.conditional import is_not_modified, make_etag, not_modified, with_validators
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
+# Async twins of hot read routes, mounted ahead of `router` when JOBSIFY_ASYNC_ROUTES=1
+async_router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 
 def parse_salary_range_fixed(
@@ -31,10 +42,114 @@ def parse_salary_range_fixed(
     return min(numbers), max(numbers)
 
 
+def _apply_salary(job: Job, salary: Optional[str]) -> None:
+    """Store the salary text together with its parsed numeric bounds."""
+    job.salary = salary
+    job.salary_min, job.salary_max = parse_salary_range_fixed(salary)
+
+
+def _apply_coordinates(job: Job, latitude: Optional[str], longitude: Optional[str]) -> None:
+    """Store the coordinate strings together with their numeric copies."""
+    job.latitude = latitude
+    job.longitude = longitude
+    job.lat, job.lng = parse_lat_lng(latitude, longitude)
+
+
+def _serialize_job(job: Job) -> dict:
+    return {
+        "id": job.id,
+        "title": job.title,
+        "category": job.category,
+        "description": job.description,
+        "location": job.location,
+        "phone": job.phone,
+        "latitude": job.latitude,
+        "longitude": job.longitude,
+        "user_email": job.user_email,
+        "urgent": job.urgent,
+        "salary": job.salary,
+        "salary_min": job.salary_min or 0.0,
+        "salary_max": job.salary_max or 0.0,
+        "required_workers": job.required_workers,
+        "is_verified": job.is_verified,
+        "verified": job.verified,
+        "created_at": job.created_at,
+        "hired_count": job.hired_count,
+        "is_hidden": job.is_hidden,
+        "vacancies": job.vacancies,
+    }
+
+
+def _job_list_cache_key(page, limit, cursor, include_total, category, location, min_salary, max_salary, urgent):
+    return response_cache.key(
+        "jobs",
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+        category=category,
+        location=location,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        urgent=urgent,
+    )
+
+
+def _job_list_conditions(category, location, min_salary, max_salary, urgent) -> list:
+    """WHERE clause of the public job listing, shared by the sync and async routes."""
+    # verified/is_hidden equality + ORDER BY id walks idx_jobs_verified_hidden
+    # in rowid order, so a keyset page costs the same at any depth.
+    conditions = [Job.verified == True, Job.is_hidden == False]
+
+    if urgent is not None:
+        conditions.append(Job.urgent == urgent)
+
+    if category:
+        conditions.append(Job.category.ilike(f"%{category}%"))
+    if location:
+        locations = [loc.strip() for loc in location.split(",") if loc.strip()]
+        for selected_location in locations:
+            conditions.append(Job.location.ilike(f"%{selected_location}%"))
+
+    # A job matches when its advertised range lies inside [min_salary, max_salary];
+    # the salary_min range scan runs on idx_jobs_verified_hidden_salary.
+    if min_salary is not None and max_salary is not None:
+        conditions.append(Job.salary_min.between(min_salary, max_salary))
+        conditions.append(Job.salary_max <= max_salary)
+    elif min_salary is not None:
+        conditions.append(Job.salary_min >= min_salary)
+    elif max_salary is not None:
+        conditions.append(Job.salary_max <= max_salary)
+    return conditions
+
+
+def _job_list_page(jobs: list, total: Optional[int], page: int, limit: int, cursor: Optional[str]) -> dict:
+    """Build the listing body from up to limit + 1 rows (the extra row only signals has_more)."""
+    has_more = len(jobs) > limit
+    jobs = jobs[:limit]
+    next_cursor = encode_cursor({"id": jobs[-1].id}) if has_more else None
+    return {
+        "jobs": [_serialize_job(job) for job in jobs],
+        "total": total,
+        "page": page if cursor is None else None,
+        "limit": limit,
+        "total_pages": (total + limit - 1) // limit if total is not None else None,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
+
+
 @router.get("")
 def get_jobs_fixed(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="Opaque next_cursor from a previous page (keyset mode)"
+    ),
+    include_total: Optional[bool] = Query(
+        None,
+        description="Run the total count query (default: on for page mode, off for cursor mode)",
+    ),
     category: Optional[str] = Query(None, description="Filter by category"),
     location: Optional[str] = Query(
         None, description="Filter by location (comma-separated for multiple)"
@@ -45,76 +160,166 @@ def get_jobs_fixed(
     db: Session = Depends(get_db),
 ):
     try:
+        cache_key = _job_list_cache_key(
+            page, limit, cursor, include_total, category, location, min_salary, max_salary, urgent
+        )
+        cached = response_cache.lookup(cache_key)
+        if cached is not None:
+            return cached
+
         query = db.query(Job).filter(
-            Job.verified == True,
-            Job.is_hidden == False,
+            *_job_list_conditions(category, location, min_salary, max_salary, urgent)
         )
 
-        if urgent is not None:
-            query = query.filter(Job.urgent == urgent)
+        if include_total is None:
+            include_total = cursor is None
+        total = query.count() if include_total else None
 
-        if category:
-            query = query.filter(Job.category.ilike(f"%{category}%"))
-        if location:
-            locations = [loc.strip() for loc in location.split(",") if loc.strip()]
-            for selected_location in locations:
-                query = query.filter(Job.location.ilike(f"%{selected_location}%"))
+        query = query.order_by(Job.id.desc())
+        if cursor:
+            last_id = decode_cursor(cursor, "id")["id"]
+            query = query.filter(Job.id < last_id)
+        else:
+            query = query.offset((page - 1) * limit)
 
-        salary_conditions = []
-        if min_salary is not None:
-            salary_conditions.append(Job.salary.like(f"%{int(min_salary)}%"))
-        if max_salary is not None:
-            salary_conditions.append(Job.salary.like(f"%{int(max_salary)}%"))
-        if salary_conditions:
-            query = query.filter(*salary_conditions)
+        # Fetch one extra row to learn whether another page exists without counting.
+        jobs = query.limit(limit + 1).all()
+        return response_cache.store(cache_key, _job_list_page(jobs, total, page, limit, cursor))
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"ERROR in get_jobs_fixed: {e}")
+        import traceback
 
-        total = query.count()
-        offset = (page - 1) * limit
-        jobs = query.order_by(Job.id.desc()).offset(offset).limit(limit).all()
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
-        jobs_list = []
-        for job in jobs:
-            salary_min, salary_max = parse_salary_range_fixed(job.salary)
-            jobs_list.append(
-                {
-                    "id": job.id,
-                    "title": job.title,
-                    "category": job.category,
-                    "description": job.description,
-                    "location": job.location,
-                    "phone": job.phone,
-                    "latitude": job.latitude,
-                    "longitude": job.longitude,
-                    "user_email": job.user_email,
-                    "urgent": job.urgent,
-                    "salary": job.salary,
-                    "salary_min": salary_min or 0.0,
-                    "salary_max": salary_max or 0.0,
-                    "required_workers": job.required_workers,
-                    "is_verified": job.is_verified,
-                    "verified": job.verified,
-                    "created_at": job.created_at,
-                    "hired_count": job.hired_count,
-                    "is_hidden": job.is_hidden,
-                    "vacancies": job.vacancies,
-                }
-            )
 
-        return {
-            "jobs": jobs_list,
-            "total": total,
-            "page": page,
-            "limit": limit,
-            "total_pages": (total + limit - 1) // limit,
-        }
+@async_router.get("")
+async def get_jobs_async(
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="Opaque next_cursor from a previous page (keyset mode)"
+    ),
+    include_total: Optional[bool] = Query(
+        None,
+        description="Run the total count query (default: on for page mode, off for cursor mode)",
+    ),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    location: Optional[str] = Query(
+        None, description="Filter by location (comma-separated for multiple)"
+    ),
+    min_salary: Optional[float] = Query(None, description="Minimum salary"),
+    max_salary: Optional[float] = Query(None, description="Maximum salary"),
+    urgent: Optional[bool] = Query(None, description="Urgent jobs only"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        cache_key = _job_list_cache_key(
+            page, limit, cursor, include_total, category, location, min_salary, max_salary, urgent
+        )
+        cached = response_cache.lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        conditions = _job_list_conditions(category, location, min_salary, max_salary, urgent)
+
+        if include_total is None:
+            include_total = cursor is None
+        total = await db.scalar(select(func.count(Job.id)).where(*conditions)) if include_total else None
+
+        statement = select(Job).where(*conditions).order_by(Job.id.desc())
+        if cursor:
+            last_id = decode_cursor(cursor, "id")["id"]
+            statement = statement.where(Job.id < last_id)
+        else:
+            statement = statement.offset((page - 1) * limit)
+
+        jobs = (await db.scalars(statement.limit(limit + 1))).all()
+        return response_cache.store(cache_key, _job_list_page(list(jobs), total, page, limit, cursor))
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"ERROR in get_jobs_fixed: {e}")
+        print(f"ERROR in get_jobs_async: {e}")
         import traceback
 
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+# =====================================================
+# 👤 USER SIDE – JOBS NEAR ME
+# =====================================================
+@router.get("/nearby")
+def get_nearby_jobs(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the search centre"),
+    lng: float = Query(..., ge=-180, le=180, description="Longitude of the search centre"),
+    radius_km: float = Query(10, gt=0, le=200, description="Search radius in kilometres"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of jobs (nearest first)"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    urgent: Optional[bool] = Query(None, description="Urgent jobs only"),
+    db: Session = Depends(get_db),
+):
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    distance_sq = distance_sq_expr(Job.lat, Job.lng, lat, lng)
+
+    # Bounding box narrows the scan on idx_jobs_verified_hidden_geo; the
+    # distance expression then trims corners and orders the full match set.
+    query = db.query(Job).filter(
+        Job.verified == True,
+        Job.is_hidden == False,
+        Job.lat.between(min_lat, max_lat),
+        Job.lng.between(min_lng, max_lng),
+        distance_sq <= radius_km * radius_km,
+    )
+    if urgent is not None:
+        query = query.filter(Job.urgent == urgent)
+    if category:
+        query = query.filter(Job.category == category)
+
+    jobs = query.order_by(distance_sq, Job.id.desc()).limit(limit).all()
+
+    jobs_list = []
+    for job in jobs:
+        item = _serialize_job(job)
+        item["distance_km"] = round(haversine_km(lat, lng, job.lat, job.lng), 2)
+        jobs_list.append(item)
+
+    return {"jobs": jobs_list, "radius_km": radius_km, "count": len(jobs_list)}
+
+
+# =====================================================
+# 👤 USER SIDE – FULL-TEXT JOB SEARCH
+# =====================================================
+@router.get("/search")
+def search_jobs(
+    q: str = Query(..., min_length=1, description="Words to search in title, description, category and location"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    db: Session = Depends(get_db),
+):
+    terms = search_terms(q)
+    if not terms:
+        return {"jobs": [], "page": page, "limit": limit}
+
+    ids = search_ids(
+        db,
+        "jobs",
+        terms,
+        filters="t.verified = TRUE AND t.is_hidden = FALSE",
+        limit=limit,
+        offset=(page - 1) * limit,
+    )
+    jobs_by_id = {job.id: job for job in db.query(Job).filter(Job.id.in_(ids)).all()} if ids else {}
+
+    return {
+        "jobs": [_serialize_job(jobs_by_id[job_id]) for job_id in ids if job_id in jobs_by_id],
+        "page": page,
+        "limit": limit,
+    }
+
+
 # ---------------- USER SIDE ----------------
 
 # =====================================================
@@ -222,6 +427,7 @@ def parse_salary_range(salary_str: Optional[str]) -> tuple[Optional[float], Opti
 # =====================================================
 @router.get("/saved", response_model=list[JobResponse])
 def get_saved_jobs(email: str = Query(...), db: Session = Depends(get_db)):
+    email = normalize_email(email)
     try:
         saved_jobs = (
             db.query(Job)
@@ -244,6 +450,7 @@ def get_saved_jobs(email: str = Query(...), db: Session = Depends(get_db)):
 # =====================================================
 @router.get("/saved/{job_id}")
 def check_saved_job(job_id: int, email: str = Query(...), db: Session = Depends(get_db)):
+    email = normalize_email(email)
     try:
         saved_job = db.query(SavedJob).filter(
             SavedJob.job_id == job_id,
@@ -267,7 +474,7 @@ def get_my_jobs(email: str = Query(..., description="User email"), db: Session =
         if not email or email.strip() == "":
             raise HTTPException(status_code=400, detail="Email parameter is required")
         
-        email = email.strip().lower()
+        email = normalize_email(email)
         if "@" not in email:
             raise HTTPException(status_code=400, detail="Invalid email format")
         
@@ -303,12 +510,24 @@ def get_my_jobs(email: str = Query(..., description="User email"), db: Session =
 # 👤 USER SIDE – GET JOB BY ID
 # =====================================================
 @router.get("/{job_id}", response_model=JobResponse)
-def get_job_by_id(job_id: int, db: Session = Depends(get_db)):
+def get_job_by_id(job_id: int, request: Request, db: Session = Depends(get_db)):
     try:
-        job = db.query(Job).filter(Job.id == job_id).first()
-        if not job:
+        # Revalidation only needs the row version, not the full row
+        version = db.query(Job.updated_at).filter(Job.id == job_id).first()
+        if version is None:
             raise HTTPException(status_code=404, detail="Job not found")
-        return job
+        etag = make_etag("job", job_id, version.updated_at)
+        if is_not_modified(request, etag, version.updated_at):
+            return not_modified(etag, version.updated_at)
+
+        cache_key = response_cache.key(f"jobs:{job_id}")
+        response = response_cache.lookup(cache_key)
+        if response is None:
+            job = db.query(Job).filter(Job.id == job_id).first()
+            if not job:
+                raise HTTPException(status_code=404, detail="Job not found")
+            response = response_cache.store(cache_key, JobResponse.model_validate(job).model_dump())
+        return with_validators(response, etag, version.updated_at)
     except HTTPException:
         raise
     except Exception as e:
@@ -318,6 +537,35 @@ def get_job_by_id(job_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+# Typed path so /jobs/saved, /jobs/my, ... still reach the sync router
+@async_router.get("/{job_id:int}", response_model=JobResponse)
+async def get_job_by_id_async(job_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    try:
+        updated_at = (await db.execute(select(Job.updated_at).where(Job.id == job_id))).first()
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        updated_at = updated_at[0]
+        etag = make_etag("job", job_id, updated_at)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(etag, updated_at)
+
+        cache_key = response_cache.key(f"jobs:{job_id}")
+        response = response_cache.lookup(cache_key)
+        if response is None:
+            job = await db.get(Job, job_id)
+            if not job:
+                raise HTTPException(status_code=404, detail="Job not found")
+            response = response_cache.store(cache_key, JobResponse.model_validate(job).model_dump())
+        return with_validators(response, etag, updated_at)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"ERROR in get_job_by_id_async: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
 # =====================================================
 # 👤 USER SIDE – CREATE JOB
 # =====================================================
@@ -332,16 +580,15 @@ def create_job(job: JobCreate, db: Session = Depends(get_db)):
             description=job.description,
             location=job.location,
             phone=job.phone,
-            latitude=job.latitude,
-            longitude=job.longitude,
             user_email=job.user_email,
             verified=False,
             urgent=job.urgent if job.urgent is not None else False,
-            salary=job.salary,
             required_workers=job.required_workers if job.required_workers is not None else 1,
             hired_count=0,
             is_hidden=False,
         )
+        _apply_salary(new_job, job.salary)
+        _apply_coordinates(new_job, job.latitude, job.longitude)
 
         db.add(new_job)
         db.commit()
@@ -363,7 +610,7 @@ def create_job(job: JobCreate, db: Session = Depends(get_db)):
 # 🛡️ ADMIN SIDE – GET PENDING JOBS
 # =====================================================
 @router.get("/admin/pending", response_model=list[JobResponse])
-def get_pending_jobs(db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def get_pending_jobs(db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     return (
         db.query(Job)
         .filter(Job.verified == False)
@@ -376,7 +623,7 @@ def get_pending_jobs(db: Session = Depends(get_db), current_admin: User = Depend
 # 🛡️ ADMIN SIDE – APPROVE JOB
 # =====================================================
 @router.put("/admin/approve/{job_id}")
-def approve_job(job_id: int, db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def approve_job(job_id: int, db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     job = db.query(Job).filter(Job.id == job_id).first()
 
     if not job:
@@ -402,7 +649,7 @@ def approve_job(job_id: int, db: Session = Depends(get_db), current_admin: User
 # 🛡️ ADMIN SIDE – REJECT JOB
 # =====================================================
 @router.put("/admin/reject/{job_id}")
-def reject_job(job_id: int, db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def reject_job(job_id: int, db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     job = db.query(Job).filter(Job.id == job_id).first()
 
     if not job:
@@ -429,6 +676,7 @@ def reject_job(job_id: int, db: Session = Depends(get_db), current_admin: User =
 # =====================================================
 @router.put("/{job_id}", response_model=JobResponse)
 def update_job(job_id: int, job: JobCreate, email: str = Query(...), db: Session = Depends(get_db)):
+    email = normalize_email(email)
     existing_job = db.query(Job).filter(Job.id == job_id, Job.user_email == email).first()
 
     if not existing_job:
@@ -439,9 +687,8 @@ def update_job(job_id: int, job: JobCreate, email: str = Query(...), db: Session
     existing_job.description = job.description
     existing_job.location = job.location
     existing_job.phone = job.phone
-    existing_job.latitude = job.latitude
-    existing_job.longitude = job.longitude
-    existing_job.salary = job.salary
+    _apply_coordinates(existing_job, job.latitude, job.longitude)
+    _apply_salary(existing_job, job.salary)
     existing_job.urgent = job.urgent if job.urgent is not None else False
     
     # Update required_workers if provided
@@ -464,6 +711,7 @@ def update_job(job_id: int, job: JobCreate, email: str = Query(...), db: Session
 # =====================================================
 @router.delete("/{job_id}")
 def delete_job(job_id: int, email: str = Query(...), db: Session = Depends(get_db)):
+    email = normalize_email(email)
     job = db.query(Job).filter(Job.id == job_id, Job.user_email == email).first()
 
     if not job:
@@ -527,7 +775,7 @@ def save_job(saved_job: SavedJobCreate, db: Session = Depends(get_db)):
             raise HTTPException(status_code=404, detail="Job not found")
 
         existing = db.query(SavedJob).filter(
-            SavedJob.user_email == saved_job.user_email,
+            SavedJob.user_email == normalize_email(saved_job.user_email),
             SavedJob.job_id == saved_job.job_id
         ).first()
 
@@ -559,6 +807,7 @@ def save_job(saved_job: SavedJobCreate, db: Session = Depends(get_db)):
 # =====================================================
 @router.delete("/save/{job_id}")
 def unsave_job(job_id: int, email: str = Query(...), db: Session = Depends(get_db)):
+    email = normalize_email(email)
     try:
         saved_job = db.query(SavedJob).filter(
             SavedJob.job_id == job_id,
@@ -587,6 +836,7 @@ def unsave_job(job_id: int, email: str = Query(...), db: Session = Depends(get_d
 # =====================================================
 @router.put("/{job_id}/hide")
 def hide_job(job_id: int, email: str = Query(...), db: Session = Depends(get_db)):
+    email = normalize_email(email)
     try:
         job = db.query(Job).filter(Job.id == job_id, Job.user_email == email).first()
 
@@ -612,6 +862,7 @@ def hide_job(job_id: int, email: str = Query(...), db: Session = Depends(get_db)
 # =====================================================
 @router.put("/{job_id}/show")
 def show_job(job_id: int, email: str = Query(...), db: Session = Depends(get_db)):
+    email = normalize_email(email)
     try:
         job = db.query(Job).filter(Job.id == job_id, Job.user_email == email).first()
 
@@ -637,6 +888,7 @@ def show_job(job_id: int, email: str = Query(...), db: Session = Depends(get_db)
 # =====================================================
 @router.put("/{job_id}/hire")
 def hire_worker(job_id: int, email: str = Query(...), db: Session = Depends(get_db)):
+    email = normalize_email(email)
     try:
         job = db.query(Job).filter(Job.id == job_id, Job.user_email == email).first()
 
@@ -680,6 +932,7 @@ def update_required_workers(
     email: str = Query(...),
     db: Session = Depends(get_db)
 ):
+    email = normalize_email(email)
     try:
         job = db.query(Job).filter(Job.id == job_id, Job.user_email == email).first()
 
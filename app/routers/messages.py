@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import or_
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import and_, func, literal, or_, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
-from app.database import get_db
+from app.counters import adjust_unread_counters, get_unread_counters, get_unread_counters_async
+from app.database import get_async_db, get_db
+from app.emails import normalize_email
+from app.pagination import CursorTimestamp, decode_cursor, encode_cursor
 from app.models.conversation import Conversation, Message
 from app.models.notification import Notification
 from app.models.user import User
@@ -16,10 +22,8 @@ from app.schemas.message import (
 )
 
 router = APIRouter(prefix="/messages", tags=["Messages"])
-
-
-def _normalize_email(value: str) -> str:
-    return value.strip().lower()
+# Async twins of hot read routes, mounted ahead of `router` when JOBSIFY_ASYNC_ROUTES=1
+async_router = APIRouter(prefix="/messages", tags=["Messages"])
 
 
 def _conversation_query_for_user(db: Session, user_email: str):
@@ -38,10 +42,17 @@ def _other_participant(conversation: Conversation, user_email: str) -> str:
 
 
 def _resolve_display_name(db: Session, email: str) -> str:
-    user = db.query(User).filter(User.email == email).first()
-    if user:
-        return user.display_name
-    return email.split("@")[0]
+    return _resolve_display_names(db, [email])[email]
+
+
+def _resolve_display_names(db: Session, emails) -> dict[str, str]:
+    """Map each email to a display name with a single User lookup."""
+    emails = set(emails)
+    names = {email: email.split("@")[0] for email in emails}
+    if emails:
+        for user in db.query(User).filter(User.email.in_(emails)).all():
+            names[user.email] = user.display_name
+    return names
 
 
 def _resolve_worker_name(db: Session, worker_id: int | None) -> str | None:
@@ -53,37 +64,59 @@ def _resolve_worker_name(db: Session, worker_id: int | None) -> str | None:
     return worker.name
 
 
-def _build_conversation_response(
-    db: Session, conversation: Conversation, user_email: str
-) -> ConversationResponse:
-    participant_email = _other_participant(conversation, user_email)
-    unread_count = (
-        db.query(Message)
+def _unread_counts(db: Session, conversation_ids: list[int], user_email: str) -> dict[int, int]:
+    """Unread message counts for many conversations in one grouped query."""
+    if not conversation_ids:
+        return {}
+    rows = (
+        db.query(Message.conversation_id, func.count(Message.id))
         .filter(
-            Message.conversation_id == conversation.id,
+            Message.conversation_id.in_(conversation_ids),
             Message.recipient_email == user_email,
             Message.is_read == False,
         )
-        .count()
-    )
-    
-    # Use eager loaded worker if available to avoid N+1 query
-    worker_name = None
-    if conversation.worker:
-        worker_name = conversation.worker.name
-    elif conversation.worker_id:
-        worker_name = _resolve_worker_name(db, conversation.worker_id)
-
-    return ConversationResponse(
-        id=conversation.id,
-        participant_email=participant_email,
-        participant_name=_resolve_display_name(db, participant_email),
-        worker_id=conversation.worker_id,
-        worker_name=worker_name,
-        last_message=conversation.last_message,
-        last_message_at=conversation.last_message_at,
-        unread_count=unread_count,
+        .group_by(Message.conversation_id)
+        .all()
     )
+    return dict(rows)
+
+
+def _build_conversation_responses(
+    db: Session, conversations: list[Conversation], user_email: str
+) -> list[ConversationResponse]:
+    """Build inbox rows with a fixed number of queries, however many conversations."""
+    unread_counts = _unread_counts(db, [conversation.id for conversation in conversations], user_email)
+    participant_emails = [_other_participant(conversation, user_email) for conversation in conversations]
+    display_names = _resolve_display_names(db, participant_emails)
+
+    responses = []
+    for conversation, participant_email in zip(conversations, participant_emails):
+        # Use eager loaded worker if available to avoid N+1 query
+        worker_name = None
+        if conversation.worker:
+            worker_name = conversation.worker.name
+        elif conversation.worker_id:
+            worker_name = _resolve_worker_name(db, conversation.worker_id)
+
+        responses.append(
+            ConversationResponse(
+                id=conversation.id,
+                participant_email=participant_email,
+                participant_name=display_names[participant_email],
+                worker_id=conversation.worker_id,
+                worker_name=worker_name,
+                last_message=conversation.last_message,
+                last_message_at=conversation.last_message_at,
+                unread_count=unread_counts.get(conversation.id, 0),
+            )
+        )
+    return responses
+
+
+def _build_conversation_response(
+    db: Session, conversation: Conversation, user_email: str
+) -> ConversationResponse:
+    return _build_conversation_responses(db, [conversation], user_email)[0]
 
 
 def _get_conversation_or_404(db: Session, conversation_id: int) -> Conversation:
@@ -102,29 +135,61 @@ def _assert_participant(conversation: Conversation, user_email: str) -> None:
 
 
 @router.get("/conversations", response_model=list[ConversationResponse])
-def get_conversations(user_email: str = Query(...), db: Session = Depends(get_db)):
-    user_email = _normalize_email(user_email)
-    conversations = (
+def get_conversations(
+    response: Response,
+    user_email: str = Query(...),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Page size (default: whole inbox)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header value from the previous page"),
+    db: Session = Depends(get_db),
+):
+    user_email = normalize_email(user_email)
+    query = (
         _conversation_query_for_user(db, user_email)
         .options(joinedload(Conversation.worker))
         .order_by(Conversation.last_message_at.desc(), Conversation.id.desc())
-        .all()
     )
-    return [_build_conversation_response(db, conversation, user_email) for conversation in conversations]
+
+    if cursor:
+        # The cursor carries the boundary row's position as it was when the page
+        # was served, so new messages moving that row do not shift later pages.
+        position = decode_cursor(cursor, "at", "id")
+        boundary_at = literal(position["at"], CursorTimestamp(Conversation.last_message_at.type))
+        query = query.filter(
+            or_(
+                Conversation.last_message_at < boundary_at,
+                and_(Conversation.last_message_at == boundary_at, Conversation.id < position["id"]),
+            )
+        )
+
+    if limit is None:
+        conversations = query.all()
+    else:
+        # The stored text on SQLite (which mixes precisions), a timestamp on
+        # PostgreSQL; either compares exactly against the column again.
+        cursor_at = type_coerce(Conversation.last_message_at, CursorTimestamp(Conversation.last_message_at.type))
+        rows = query.add_columns(cursor_at.label("cursor_at")).limit(limit + 1).all()
+        conversations = [row.Conversation for row in rows[:limit]]
+        if len(rows) > limit:
+            response.headers["X-Next-Cursor"] = encode_cursor({
+                "at": rows[limit - 1].cursor_at,
+                "id": conversations[-1].id,
+            })
+
+    return _build_conversation_responses(db, conversations, user_email)
 
 
 @router.post("/conversations", response_model=ConversationResponse)
 def create_or_get_conversation(
     payload: ConversationCreate, db: Session = Depends(get_db)
 ):
-    sender_email = _normalize_email(payload.sender_email)
-    recipient_email = _normalize_email(payload.recipient_email)
+    sender_email = normalize_email(payload.sender_email)
+    recipient_email = normalize_email(payload.recipient_email)
 
     if payload.worker_id is not None:
         worker = db.query(Worker).filter(Worker.id == payload.worker_id).first()
         if not worker:
             raise HTTPException(status_code=404, detail="Worker not found")
-        recipient_email = _normalize_email(worker.user_email)
+        recipient_email = normalize_email(worker.user_email)
 
     if sender_email == recipient_email:
         raise HTTPException(
@@ -169,18 +234,67 @@ def create_or_get_conversation(
 def get_conversation_detail(
     conversation_id: int,
     user_email: str = Query(...),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Maximum messages to return (default: whole history)"),
+    before_id: Optional[int] = Query(None, description="Return messages older than this message id"),
+    after_id: Optional[int] = Query(None, description="Return only messages newer than this message id (polling delta)"),
     db: Session = Depends(get_db),
 ):
-    user_email = _normalize_email(user_email)
+    user_email = normalize_email(user_email)
+    if before_id is not None and after_id is not None:
+        raise HTTPException(status_code=400, detail="Use either before_id or after_id, not both")
+
     conversation = _get_conversation_or_404(db, conversation_id)
     _assert_participant(conversation, user_email)
 
-    messages = (
-        db.query(Message)
-        .filter(Message.conversation_id == conversation_id)
-        .order_by(Message.created_at.asc(), Message.id.asc())
-        .all()
-    )
+    query = db.query(Message).filter(Message.conversation_id == conversation_id)
+    boundary_id = before_id if before_id is not None else after_id
+    if boundary_id is not None:
+        # Keyset on (created_at, id) walks idx_messages_conversation_created;
+        # the boundary timestamp is read from the stored row itself, which must
+        # be a message of this conversation.
+        cursor_type = CursorTimestamp(Message.created_at.type)
+        stored_at = (
+            db.query(type_coerce(Message.created_at, cursor_type))
+            .filter(Message.id == boundary_id, Message.conversation_id == conversation_id)
+            .scalar()
+        )
+        if stored_at is None:
+            raise HTTPException(status_code=404, detail="Message not found in conversation")
+        boundary_at = literal(stored_at, cursor_type)
+        if before_id is not None:
+            query = query.filter(
+                or_(
+                    Message.created_at < boundary_at,
+                    and_(Message.created_at == boundary_at, Message.id < boundary_id),
+                )
+            )
+        else:
+            query = query.filter(
+                or_(
+                    Message.created_at > boundary_at,
+                    and_(Message.created_at == boundary_at, Message.id > boundary_id),
+                )
+            )
+
+    # has_more: older messages remain (latest/before_id pages) or newer ones (after_id pages)
+    has_more = False
+    if after_id is not None or limit is None:
+        query = query.order_by(Message.created_at.asc(), Message.id.asc())
+        if limit is not None:
+            query = query.limit(limit + 1)
+        messages = query.all()
+        if limit is not None and len(messages) > limit:
+            messages, has_more = messages[:limit], True
+    else:
+        messages = (
+            query.order_by(Message.created_at.desc(), Message.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        if len(messages) > limit:
+            messages, has_more = messages[:limit], True
+        messages.reverse()
+
     participant_email = _other_participant(conversation, user_email)
 
     return ConversationDetailResponse(
@@ -190,6 +304,7 @@ def get_conversation_detail(
         worker_id=conversation.worker_id,
         worker_name=_resolve_worker_name(db, conversation.worker_id),
         messages=[MessageResponse.model_validate(message) for message in messages],
+        has_more=has_more,
     )
 
 
@@ -200,7 +315,7 @@ def send_message_to_conversation(
     db: Session = Depends(get_db),
     skip_commit: bool = False,
 ):
-    sender_email = _normalize_email(payload.sender_email)
+    sender_email = normalize_email(payload.sender_email)
     conversation = _get_conversation_or_404(db, conversation_id)
     _assert_participant(conversation, sender_email)
 
@@ -241,32 +356,33 @@ def mark_conversation_as_read(
     user_email: str = Query(...),
     db: Session = Depends(get_db),
 ):
-    user_email = _normalize_email(user_email)
+    user_email = normalize_email(user_email)
     conversation = _get_conversation_or_404(db, conversation_id)
     _assert_participant(conversation, user_email)
 
-    unread_messages = (
+    # One set-based UPDATE; no Message objects are loaded into the session
+    updated = (
         db.query(Message)
         .filter(
             Message.conversation_id == conversation_id,
             Message.recipient_email == user_email,
             Message.is_read == False,
         )
-        .all()
+        .update({Message.is_read: True}, synchronize_session=False)
     )
-    for message in unread_messages:
-        message.is_read = True
+    adjust_unread_counters(db, user_email, messages=-updated)
 
     db.commit()
-    return {"message": "Conversation marked as read"}
+    return {"message": "Conversation marked as read", "updated": updated}
 
 
 @router.get("/unread-count")
 def get_unread_message_count(user_email: str = Query(...), db: Session = Depends(get_db)):
-    user_email = _normalize_email(user_email)
-    unread_count = (
-        db.query(Message)
-        .filter(Message.recipient_email == user_email, Message.is_read == False)
-        .count()
-    )
+    unread_count, _ = get_unread_counters(db, user_email)
+    return {"unread_count": unread_count}
+
+
+@async_router.get("/unread-count")
+async def get_unread_message_count_async(user_email: str = Query(...), db: AsyncSession = Depends(get_async_db)):
+    unread_count, _ = await get_unread_counters_async(db, user_email)
     return {"unread_count": unread_count}
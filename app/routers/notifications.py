@@ -1,13 +1,24 @@
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
-from app.database import get_db
+from pydantic import BaseModel
+from app.database import get_async_db, get_db
+from app.emails import normalize_email
+from app.counters import adjust_unread_counters, get_unread_counters, get_unread_counters_async
 from app.models.notification import Notification
 
+class MarkNotificationsReadRequest(BaseModel):
+    user_email: str
+    ids: List[int]
+
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
+# Async twins of hot read routes, mounted ahead of `router` when JOBSIFY_ASYNC_ROUTES=1
+async_router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 @router.get("", response_model=List[dict])
 def get_user_notifications(user_email: str = Query(...), db: Session = Depends(get_db)):
+    user_email = normalize_email(user_email)
     notifications = db.query(Notification).filter(Notification.user_email == user_email).order_by(Notification.created_at.desc()).all()
     return [
         {
@@ -27,11 +38,63 @@ def get_user_notifications(user_email: str = Query(...), db: Session = Depends(g
 def get_user_notifications_slash(user_email: str = Query(...), db: Session = Depends(get_db)):
     return get_user_notifications(user_email, db)
 
+@router.get("/unread-count")
+def get_unread_notification_count(user_email: str = Query(...), db: Session = Depends(get_db)):
+    _, unread_count = get_unread_counters(db, user_email)
+    return {"unread_count": unread_count}
+
+@async_router.get("/unread-count")
+async def get_unread_notification_count_async(user_email: str = Query(...), db: AsyncSession = Depends(get_async_db)):
+    _, unread_count = await get_unread_counters_async(db, user_email)
+    return {"unread_count": unread_count}
+
+@router.put("/read-all")
+def mark_all_as_read(user_email: str = Query(...), db: Session = Depends(get_db)):
+    user_email = normalize_email(user_email)
+    updated = (
+        db.query(Notification)
+        .filter(Notification.user_email == user_email, Notification.is_read == False)
+        .update({Notification.is_read: True}, synchronize_session=False)
+    )
+    adjust_unread_counters(db, user_email, notifications=-updated)
+    db.commit()
+    return {"message": "All notifications marked as read", "updated": updated}
+
+@router.put("/read")
+def mark_many_as_read(request: MarkNotificationsReadRequest, db: Session = Depends(get_db)):
+    if not request.ids:
+        return {"message": "Notifications marked as read", "updated": 0}
+    user_email = normalize_email(request.user_email)
+    # Scoped to the owner so one user cannot clear another user's badge
+    updated = (
+        db.query(Notification)
+        .filter(
+            Notification.user_email == user_email,
+            Notification.id.in_(request.ids),
+            Notification.is_read == False,
+        )
+        .update({Notification.is_read: True}, synchronize_session=False)
+    )
+    adjust_unread_counters(db, user_email, notifications=-updated)
+    db.commit()
+    return {"message": "Notifications marked as read", "updated": updated}
+
 @router.put("/{notification_id}/read")
 def mark_as_read(notification_id: int, db: Session = Depends(get_db)):
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
-    if notification:
-        notification.is_read = True
+    row = (
+        db.query(Notification.user_email, Notification.is_read)
+        .filter(Notification.id == notification_id)
+        .first()
+    )
+    if not row:
+        return {"error": "Notification not found"}
+    if not row.is_read:
+        updated = (
+            db.query(Notification)
+            .filter(Notification.id == notification_id, Notification.is_read == False)
+            .update({Notification.is_read: True}, synchronize_session=False)
+        )
+        if row.user_email:
+            adjust_unread_counters(db, row.user_email, notifications=-updated)
         db.commit()
-        return {"message": "Notification marked as read"}
-    return {"error": "Notification not found"}
+    return {"message": "Notification marked as read"}
@@ -1,17 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import and_, func, literal, or_, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi.responses import JSONResponse
+from typing import Optional
 import logging
 
-from app.database import get_db
+from app.cache import response_cache
+from app.conditional import is_not_modified, make_etag, not_modified, with_validators
+from app.database import get_async_db, get_db
+from app.emails import normalize_email
 from app.models.review import Review
 from app.models.user import User
 from app.models.workers import Worker
 from app.schemas.review import ReviewCreate, ReviewUpdate, ReviewResponse, WorkerRatingSummary
+from app.ratings import apply_rating_change
+from app.pagination import CursorTimestamp, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/reviews", tags=["Reviews"])
+# Async twins of hot read routes, mounted ahead of `router` when JOBSIFY_ASYNC_ROUTES=1
+async_router = APIRouter(prefix="/reviews", tags=["Reviews"])
+
+def _review_set_version(db: Session, *criteria):
+    """(count, max id, max updated_at) of a review set; changes on any insert, edit or delete."""
+    return db.query(func.count(Review.id), func.max(Review.id), func.max(Review.updated_at)).filter(*criteria).one()
 
 
 def _resolve_reviewer_name(user: User | None, reviewer_email: str) -> str:
@@ -22,59 +35,156 @@ def _resolve_reviewer_name(user: User | None, reviewer_email: str) -> str:
     return reviewer_email or "User"
 
 
+def _worker_reviews_validators(worker_id: int, limit: Optional[int], cursor: Optional[str], version):
+    """(etag, last_modified, first-page cache key or None) from the worker's (review_version, updated_at)."""
+    # review_version is bumped by every review write for the worker (app/ratings.py),
+    # and updated_at with it, so one primary-key read versions the whole list
+    etag = make_etag("worker-reviews", worker_id, limit, cursor, version.review_version)
+    # The first page goes through the shared response cache ("reviews:<id>" is
+    # invalidated by the ORM hooks on every review write for the worker)
+    cache_key = (
+        response_cache.key(f"reviews:{worker_id}", limit=limit, version=version.review_version)
+        if cursor is None else None
+    )
+    return etag, version.updated_at, cache_key
+
+
+def _worker_reviews_statement(worker_id: int, limit: Optional[int], cursor: Optional[str]):
+    """
+    Newest-first page of a worker's reviews as (Review, cursor_at) rows; with a
+    limit, fetches one extra row to detect a next page.
+    """
+    cursor_type = CursorTimestamp(Review.created_at.type)
+    statement = (
+        select(Review, type_coerce(Review.created_at, cursor_type).label("cursor_at"))
+        .where(Review.worker_id == worker_id)
+        .order_by(Review.created_at.desc(), Review.id.desc())
+    )
+    if cursor:
+        # The cursor carries the boundary row's position as served, so deleting
+        # that review does not end the listing early
+        position = decode_cursor(cursor, "at", "id", "worker")
+        if position["worker"] != worker_id:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        boundary_at = literal(position["at"], cursor_type)
+        statement = statement.where(
+            or_(
+                Review.created_at < boundary_at,
+                and_(Review.created_at == boundary_at, Review.id < position["id"]),
+            )
+        )
+    if limit is not None:
+        statement = statement.limit(limit + 1)
+    return statement
+
+
+def _worker_reviews_page(worker_id: int, rows: list, limit: Optional[int], users_by_email: dict) -> dict:
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor({"at": rows[-1].cursor_at, "id": rows[-1].Review.id, "worker": worker_id})
+    reviews = [row.Review for row in rows]
+    return {"items": _reviews_to_dicts(reviews, users_by_email), "next_cursor": next_cursor}
+
+
 @router.get("/worker/{worker_id}", response_model=list[ReviewResponse])
-def get_worker_reviews(worker_id: int, db: Session = Depends(get_db)):
-    """Get all reviews for a specific worker."""
-    worker = db.query(Worker).filter(Worker.id == worker_id).first()
-    if not worker:
+def get_worker_reviews(
+    worker_id: int,
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size (default: all reviews)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header value from the previous page"),
+    db: Session = Depends(get_db),
+):
+    """Get reviews for a specific worker, newest first."""
+    version = db.execute(_worker_version_statement(worker_id)).first()
+    if not version:
+        raise HTTPException(status_code=404, detail="Worker not found")
+    etag, last_modified, cache_key = _worker_reviews_validators(worker_id, limit, cursor, version)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+
+    if cache_key is not None:
+        cached = response_cache.lookup_content(cache_key)
+        if cached is not None:
+            return _review_page_response(cached, "HIT", etag, last_modified)
+
+    rows = db.execute(_worker_reviews_statement(worker_id, limit, cursor)).all()
+    users = _reviewer_users_statement([row.Review for row in rows])
+    users_by_email = {user.email: user for user in db.scalars(users)} if users is not None else {}
+
+    page = _worker_reviews_page(worker_id, rows, limit, users_by_email)
+    if cache_key is not None:
+        page = response_cache.store_content(cache_key, page)
+    return _review_page_response(page, "MISS", etag, last_modified)
+
+
+# Typed path so only numeric worker ids are shadowed
+@async_router.get("/worker/{worker_id:int}", response_model=list[ReviewResponse])
+async def get_worker_reviews_async(
+    worker_id: int,
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size (default: all reviews)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header value from the previous page"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get reviews for a specific worker, newest first."""
+    version = (await db.execute(_worker_version_statement(worker_id))).first()
+    if not version:
         raise HTTPException(status_code=404, detail="Worker not found")
+    etag, last_modified, cache_key = _worker_reviews_validators(worker_id, limit, cursor, version)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
 
-    reviews = (
-        db.query(Review)
-        .filter(Review.worker_id == worker_id)
-        .order_by(Review.created_at.desc())
-        .all()
-    )
-    content = [_review_to_dict_with_user(review, db) for review in reviews]
-    headers = {
-        "Cache-Control": "no-cache, no-store, must-revalidate",
-        "Pragma": "no-cache",
-        "Expires": "0",
-    }
-    return JSONResponse(content=content, headers=headers)
+    if cache_key is not None:
+        cached = response_cache.lookup_content(cache_key)
+        if cached is not None:
+            return _review_page_response(cached, "HIT", etag, last_modified)
+
+    rows = (await db.execute(_worker_reviews_statement(worker_id, limit, cursor))).all()
+    users = _reviewer_users_statement([row.Review for row in rows])
+    users_by_email = {user.email: user for user in await db.scalars(users)} if users is not None else {}
+
+    page = _worker_reviews_page(worker_id, rows, limit, users_by_email)
+    if cache_key is not None:
+        page = response_cache.store_content(cache_key, page)
+    return _review_page_response(page, "MISS", etag, last_modified)
+
+
+def _worker_version_statement(worker_id: int):
+    return select(Worker.review_version, Worker.updated_at).where(Worker.id == worker_id)
+
+
+def _review_page_response(page: dict, cache_status: str, etag: str, last_modified) -> JSONResponse:
+    headers = {"X-Cache": cache_status}
+    if page["next_cursor"]:
+        headers["X-Next-Cursor"] = page["next_cursor"]
+    return with_validators(JSONResponse(content=page["items"], headers=headers), etag, last_modified)
 
 
 @router.get("/worker/{worker_id}/summary", response_model=WorkerRatingSummary)
-def get_worker_rating_summary(worker_id: int, db: Session = Depends(get_db)):
+def get_worker_rating_summary(worker_id: int, request: Request, db: Session = Depends(get_db)):
     """Get rating summary for a worker."""
-    worker = db.query(Worker).filter(Worker.id == worker_id).first()
-    if not worker:
+    # Rating aggregates live on the worker row, so its version covers them
+    version = db.query(Worker.updated_at).filter(Worker.id == worker_id).first()
+    if version is None:
         raise HTTPException(status_code=404, detail="Worker not found")
+    etag = make_etag("rating-summary", worker_id, version.updated_at)
+    if is_not_modified(request, etag, version.updated_at):
+        return not_modified(etag, version.updated_at)
 
-    distribution = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
-    reviews = db.query(Review).filter(Review.worker_id == worker_id).all()
-
-    for review in reviews:
-        if review.rating in distribution:
-            distribution[review.rating] += 1
-
+    worker = db.query(Worker).filter(Worker.id == worker_id).first()
     content = WorkerRatingSummary(
         average_rating=worker.rating or 0.0,
-        total_reviews=len(reviews),
-        rating_distribution=distribution,
+        total_reviews=worker.reviews or 0,
+        rating_distribution=worker.rating_distribution,
     ).model_dump()
-    headers = {
-        "Cache-Control": "no-cache, no-store, must-revalidate",
-        "Pragma": "no-cache",
-        "Expires": "0",
-    }
-    return JSONResponse(content=content, headers=headers)
+    return with_validators(JSONResponse(content=content), etag, version.updated_at)
 
 
 @router.post("", response_model=ReviewResponse)
 def create_review(review: ReviewCreate, db: Session = Depends(get_db)):
     """Add a review for a worker (no authentication required)."""
-    reviewer_email = review.reviewer_email.strip().lower()
+    reviewer_email = normalize_email(review.reviewer_email)
 
     worker = db.query(Worker).filter(Worker.id == review.worker_id).first()
     if not worker:
@@ -84,7 +194,7 @@ def create_review(review: ReviewCreate, db: Session = Depends(get_db)):
         db.query(Review)
         .filter(
             Review.worker_id == review.worker_id,
-            func.lower(Review.reviewer_email) == reviewer_email,
+            Review.reviewer_email == reviewer_email,
         )
         .first()
     )
@@ -95,7 +205,7 @@ def create_review(review: ReviewCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Rating must be between 1 and 5")
 
     try:
-        user = db.query(User).filter(func.lower(User.email) == reviewer_email).first()
+        user = db.query(User).filter(User.email == reviewer_email).first()
         new_review = Review(
             worker_id=review.worker_id,
             reviewer_email=reviewer_email,
@@ -105,10 +215,10 @@ def create_review(review: ReviewCreate, db: Session = Depends(get_db)):
         )
 
         db.add(new_review)
+        apply_rating_change(db, review.worker_id, added=review.rating)
         db.commit()
         db.refresh(new_review)
 
-        _update_worker_rating(review.worker_id, db)
         return _review_to_dict(new_review)
     except HTTPException:
         raise
@@ -131,24 +241,31 @@ def update_review(
         logger.error("Review %s not found", review_id)
         raise HTTPException(status_code=404, detail="Review not found")
 
-    reviewer_email = (review_update.reviewer_email or existing_review.reviewer_email).strip().lower()
-    if reviewer_email != existing_review.reviewer_email.lower():
+    reviewer_email = normalize_email(review_update.reviewer_email or existing_review.reviewer_email)
+    if reviewer_email != existing_review.reviewer_email:
         logger.warning("Unauthorized update attempt on review %s by %s", review_id, reviewer_email)
         raise HTTPException(status_code=403, detail="You can only update your own reviews")
 
-    if review_update.rating is not None:
-        if review_update.rating < 1 or review_update.rating > 5:
-            logger.warning("Invalid rating %s for review %s", review_update.rating, review_id)
-            raise HTTPException(status_code=400, detail="Rating must be between 1 and 5")
-        existing_review.rating = review_update.rating
+    if review_update.rating is not None and (review_update.rating < 1 or review_update.rating > 5):
+        logger.warning("Invalid rating %s for review %s", review_update.rating, review_id)
+        raise HTTPException(status_code=400, detail="Rating must be between 1 and 5")
 
+    rating_changed = review_update.rating is not None and review_update.rating != existing_review.rating
+    # Always called so a comment-only edit still bumps the worker's review version
+    apply_rating_change(
+        db,
+        existing_review.worker_id,
+        added=review_update.rating if rating_changed else None,
+        removed=existing_review.rating if rating_changed else None,
+    )
+    if rating_changed:
+        existing_review.rating = review_update.rating
     if review_update.comment is not None:
         existing_review.comment = review_update.comment
 
     db.commit()
     db.refresh(existing_review)
 
-    _update_worker_rating(existing_review.worker_id, db)
     logger.info("Updated review %s", review_id)
     return _review_to_dict(existing_review)
 
@@ -160,7 +277,7 @@ def delete_review(
     db: Session = Depends(get_db),
 ):
     """Delete a review (no authentication required)."""
-    normalized_email = reviewer_email.strip().lower()
+    normalized_email = normalize_email(reviewer_email)
     logger.debug("Delete review %s by %s", review_id, normalized_email)
 
     review = db.query(Review).filter(Review.id == review_id).first()
@@ -168,7 +285,7 @@ def delete_review(
         logger.error("Review %s not found", review_id)
         raise HTTPException(status_code=404, detail="Review not found")
 
-    if review.reviewer_email.lower() != normalized_email:
+    if review.reviewer_email != normalized_email:
         logger.warning(
             "Unauthorized delete on review %s by %s, owner is %s",
             review_id,
@@ -178,34 +295,37 @@ def delete_review(
         raise HTTPException(status_code=403, detail="You can only delete your own reviews")
 
     worker_id = review.worker_id
+    apply_rating_change(db, worker_id, removed=review.rating)
     db.delete(review)
     db.commit()
 
-    _update_worker_rating(worker_id, db)
     logger.info("Deleted review %s", review_id)
     return {"message": "Review deleted successfully"}
 
 
 @router.get("/my", response_model=list[ReviewResponse])
 def get_my_reviews(
+    request: Request,
     reviewer_email: str = Query(...),
     db: Session = Depends(get_db),
 ):
     """Get all reviews given by the user."""
-    normalized_email = reviewer_email.strip().lower()
+    normalized_email = normalize_email(reviewer_email)
+    # ETag only: max(updated_at) does not move when an older review is deleted,
+    # so it cannot back If-Modified-Since; the count does catch deletes
+    count, max_id, max_updated_at = _review_set_version(db, Review.reviewer_email == normalized_email)
+    etag = make_etag("my-reviews", normalized_email, count, max_id, max_updated_at)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
     reviews = (
         db.query(Review)
-        .filter(func.lower(Review.reviewer_email) == normalized_email)
+        .filter(Review.reviewer_email == normalized_email)
         .order_by(Review.created_at.desc())
         .all()
     )
     content = [_review_to_dict(review) for review in reviews]
-    headers = {
-        "Cache-Control": "no-cache, no-store, must-revalidate",
-        "Pragma": "no-cache",
-        "Expires": "0",
-    }
-    return JSONResponse(content=content, headers=headers)
+    return with_validators(JSONResponse(content=content), etag)
 
 
 def _review_to_dict(review: Review) -> dict:
@@ -220,40 +340,21 @@ def _review_to_dict(review: Review) -> dict:
     }
 
 
-def _review_to_dict_with_user(review: Review, db: Session) -> dict:
-    reviewer_name = review.reviewer_name
-    if not reviewer_name:
-        user = db.query(User).filter(func.lower(User.email) == review.reviewer_email.lower()).first()
-        reviewer_name = _resolve_reviewer_name(user, review.reviewer_email)
-
-    return {
-        "id": review.id,
-        "worker_id": review.worker_id,
-        "reviewer_email": review.reviewer_email,
-        "reviewer_name": reviewer_name,
-        "rating": review.rating,
-        "comment": review.comment,
-        "created_at": review.created_at.isoformat() if review.created_at else None,
-    }
-
-
-def _update_worker_rating(worker_id: int, db: Session):
-    reviews = db.query(Review).filter(Review.worker_id == worker_id).all()
+def _reviewer_users_statement(reviews: list[Review]):
+    """Users for reviews without a stored reviewer name, or None when every review has one."""
+    missing_emails = {review.reviewer_email for review in reviews if not review.reviewer_name}
+    if not missing_emails:
+        return None
+    return select(User).where(User.email.in_(missing_emails))
 
-    worker = db.query(Worker).filter(Worker.id == worker_id).first()
-    if not worker:
-        return
 
-    if not reviews:
-        worker.rating = 0
-        worker.reviews = 0
-        db.commit()
-        db.refresh(worker)
-        return
-
-    total_rating = sum(review.rating for review in reviews)
-    average = total_rating / len(reviews)
-    worker.rating = round(average, 1)
-    worker.reviews = len(reviews)
-    db.commit()
-    db.refresh(worker)
+def _reviews_to_dicts(reviews: list[Review], users_by_email: dict) -> list[dict]:
+    """Serialize reviews, filling missing reviewer names from one batched User lookup."""
+    results = []
+    for review in reviews:
+        item = _review_to_dict(review)
+        if not item["reviewer_name"]:
+            user = users_by_email.get(review.reviewer_email)
+            item["reviewer_name"] = _resolve_reviewer_name(user, review.reviewer_email)
+        results.append(item)
+    return results
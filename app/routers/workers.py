@@ -1,30 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_async_db, get_db
+from app.emails import normalize_email
 from app.models.workers import Worker
 from app.models.report import Report
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.workers import WorkerCreate, WorkerResponse
 from app.schemas.report import ReportCreate, ReportResponse
+from app.principals import Principal
 from app.routers.auth import get_current_admin
+from app.geo import parse_lat_lng, bounding_box, distance_sq_expr, haversine_km
+from app.pagination import encode_cursor, decode_cursor
+from app.search import search_terms, search_ids
+from app.cache import response_cache
+from app.conditional import is_not_modified, make_etag, not_modified, with_validators
 
 
 router = APIRouter(prefix="/workers", tags=["Workers"])
+# Async twins of hot read routes, mounted ahead of `router` when JOBSIFY_ASYNC_ROUTES=1
+async_router = APIRouter(prefix="/workers", tags=["Workers"])
 
-
-def _normalize_email(value: Optional[str]) -> Optional[str]:
-    if value is None:
-        return None
-    value = value.strip().lower()
-    return value or None
+# sort_by -> (column, descending); each column has an (is_verified, is_available, column) index
+WORKER_SORT_COLUMNS = {
+    "experience_high": (Worker.experience, True),
+    "experience_low": (Worker.experience, False),
+    "rating_high": (Worker.rating, True),
+    "rating_low": (Worker.rating, False),
+}
+UNLOCATED_DISTANCE_SQ = 1e12
 
 
 def _serialize_worker(worker: Worker, viewer_email: Optional[str] = None) -> dict:
-    owner_email = _normalize_email(worker.user_email)
-    viewer_email = _normalize_email(viewer_email)
+    owner_email = normalize_email(worker.user_email)
+    viewer_email = normalize_email(viewer_email)
     is_owner = viewer_email is not None and viewer_email == owner_email
     return {
         "id": worker.id,
@@ -48,85 +61,318 @@ def _serialize_worker(worker: Worker, viewer_email: Optional[str] = None) -> dic
         "can_message": not is_owner,
     }
 
-# 🔹 GET VERIFIED & AVAILABLE WORKERS (WITH FILTERING AND PAGINATION)
-@router.get("")
-def get_workers(
-    db: Session = Depends(get_db),
-    viewer_email: Optional[str] = Query(None, description="Logged-in user email for ownership flags"),
-    page: int = Query(1, ge=1, description="Page number"),
-    limit: int = Query(20, ge=1, le=100, description="Items per page"),
-    min_experience: Optional[int] = Query(None, description="Minimum years of experience"),
-    max_experience: Optional[int] = Query(None, description="Maximum years of experience"),
-    min_rating: Optional[float] = Query(None, description="Minimum rating (0-5)"),
-    location: Optional[str] = Query(None, description="Filter by location (partial match)"),
-    availability_type: Optional[str] = Query(None, description="Filter by availability type: everyday, selected_days, not_available"),
-    available_days: Optional[str] = Query(None, description="Filter by specific days (comma-separated: Mon,Tue,Wed)"),
-    is_available: Optional[bool] = Query(None, description="Filter by availability"),
-    sort_by: Optional[str] = Query("distance", description="Sort by: distance, experience_high, experience_low, rating_high, rating_low")
-):
-    query = db.query(Worker).filter(Worker.is_verified == True)
-    
+def _apply_coordinates(worker: Worker, latitude: Optional[str], longitude: Optional[str]) -> None:
+    """Store the coordinate strings together with their numeric copies."""
+    worker.latitude = latitude
+    worker.longitude = longitude
+    worker.lat, worker.lng = parse_lat_lng(latitude, longitude)
+
+
+def _worker_list_cache_key(viewer_email, page, limit, cursor, include_total, min_experience, max_experience,
+                           min_rating, location, availability_type, available_days, is_available, sort_by, lat, lng):
+    return response_cache.key(
+        "workers",
+        viewer_email=normalize_email(viewer_email),
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+        min_experience=min_experience,
+        max_experience=max_experience,
+        min_rating=min_rating,
+        location=location,
+        availability_type=availability_type,
+        available_days=available_days,
+        is_available=is_available,
+        sort_by=sort_by,
+        lat=lat,
+        lng=lng,
+    )
+
+
+def _worker_list_conditions(min_experience, max_experience, min_rating, location,
+                            availability_type, available_days, is_available) -> list:
+    """WHERE clause of the public worker listing, shared by the sync and async routes."""
+    conditions = [Worker.is_verified == True]
+
     # Apply availability filter
     if is_available is not None:
-        query = query.filter(Worker.is_available == is_available)
+        conditions.append(Worker.is_available == is_available)
     else:
         # Default: show only available workers
-        query = query.filter(Worker.is_available == True)
-    
+        conditions.append(Worker.is_available == True)
+
     # Apply availability type filter
     if availability_type is not None:
-        query = query.filter(Worker.availability_type == availability_type)
-    
+        conditions.append(Worker.availability_type == availability_type)
+
     # Apply available days filter (workers who work on any of the specified days)
     if available_days is not None:
         days_list = [d.strip() for d in available_days.split(",")]
         # Filter workers who have any of the specified days in their available_days
-        conditions = [Worker.available_days.ilike(f"%{day}%") for day in days_list]
-        from sqlalchemy import or_
-        query = query.filter(or_(*conditions))
-    
+        conditions.append(or_(*[Worker.available_days.ilike(f"%{day}%") for day in days_list]))
+
     # Apply experience filters
     if min_experience is not None:
-        query = query.filter(Worker.experience >= min_experience)
+        conditions.append(Worker.experience >= min_experience)
     if max_experience is not None:
-        query = query.filter(Worker.experience <= max_experience)
-    
+        conditions.append(Worker.experience <= max_experience)
+
     # Apply rating filter
     if min_rating is not None:
-        query = query.filter(Worker.rating >= min_rating)
-    
+        conditions.append(Worker.rating >= min_rating)
+
     # Apply location filter
     if location is not None:
-        query = query.filter(Worker.location.ilike(f"%{location}%"))
-    
-    # Get total count
-    total = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * limit
-    workers = query.order_by(Worker.id.desc()).offset(offset).limit(limit).all()
-    
-    # Apply sorting (in memory after pagination)
-    if sort_by == "experience_high":
-        workers.sort(key=lambda w: w.experience or 0, reverse=True)
-    elif sort_by == "experience_low":
-        workers.sort(key=lambda w: w.experience or 0)
-    elif sort_by == "rating_high":
-        workers.sort(key=lambda w: w.rating or 0, reverse=True)
-    elif sort_by == "rating_low":
-        workers.sort(key=lambda w: w.rating or 0)
-    
+        conditions.append(Worker.location.ilike(f"%{location}%"))
+    return conditions
+
+
+def _worker_list_order(sort_by, lat, lng):
+    """(sort key or None, descending, by distance, ORDER BY) for the listing."""
+    # Every sort order is (key, id) in one direction, so the page boundary is a
+    # single row-value comparison that seeks on the matching composite index.
+    sort_by_distance = sort_by == "distance" and lat is not None and lng is not None
+    if sort_by_distance:
+        # Workers without coordinates sort after every located worker
+        sort_key = func.coalesce(distance_sq_expr(Worker.lat, Worker.lng, lat, lng), UNLOCATED_DISTANCE_SQ)
+        descending = False
+    elif sort_by in WORKER_SORT_COLUMNS:
+        sort_key, descending = WORKER_SORT_COLUMNS[sort_by]
+    else:
+        sort_key, descending = None, True
+
+    if sort_key is not None:
+        order = [sort_key.desc(), Worker.id.desc()] if descending else [sort_key.asc(), Worker.id.asc()]
+    else:
+        order = [Worker.id.desc()]
+    return sort_key, descending, sort_by_distance, order
+
+
+def _worker_list_boundary(cursor: str, sort_by, sort_key, descending: bool):
+    """Keyset condition selecting the rows after `cursor`."""
+    position = decode_cursor(cursor, "sort", "id", *(("value",) if sort_key is not None else ()))
+    if position["sort"] != sort_by:
+        raise HTTPException(status_code=400, detail="Cursor does not match sort_by")
+    if sort_key is None:
+        return Worker.id < position["id"]
+    boundary = tuple_(sort_key, Worker.id)
+    after = tuple_(position["value"], position["id"])
+    return boundary < after if descending else boundary > after
+
+
+def _worker_list_page(rows: list, sort_key, sort_by, sort_by_distance: bool, total: Optional[int], page: int,
+                      limit: int, cursor: Optional[str], viewer_email, lat, lng) -> dict:
+    """
+    Build the listing body from up to limit + 1 rows (the extra row only signals
+    has_more). Rows are Worker objects, or (Worker, sort_value) when sorting by a key.
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        if sort_key is None:
+            next_cursor = encode_cursor({"sort": sort_by, "id": last.id})
+        else:
+            next_cursor = encode_cursor({"sort": sort_by, "value": last.sort_value, "id": last.Worker.id})
+
     # Convert SQLAlchemy objects to dictionaries
     workers_list = []
-    for worker in workers:
-        workers_list.append(_serialize_worker(worker, viewer_email))
-    
+    for row in rows:
+        worker = row if sort_key is None else row.Worker
+        item = _serialize_worker(worker, viewer_email)
+        if sort_by_distance and worker.lat is not None:
+            item["distance_km"] = round(haversine_km(lat, lng, worker.lat, worker.lng), 2)
+        workers_list.append(item)
+
     return {
         "workers": workers_list,
         "total": total,
+        "page": page if cursor is None else None,
+        "limit": limit,
+        "total_pages": (total + limit - 1) // limit if total is not None else None,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
+
+
+# 🔹 GET VERIFIED & AVAILABLE WORKERS (WITH FILTERING AND PAGINATION)
+@router.get("")
+def get_workers(
+    db: Session = Depends(get_db),
+    viewer_email: Optional[str] = Query(None, description="Logged-in user email for ownership flags"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page (keyset mode)"),
+    include_total: Optional[bool] = Query(None, description="Run the total count query (default: on for page mode, off for cursor mode)"),
+    min_experience: Optional[int] = Query(None, description="Minimum years of experience"),
+    max_experience: Optional[int] = Query(None, description="Maximum years of experience"),
+    min_rating: Optional[float] = Query(None, description="Minimum rating (0-5)"),
+    location: Optional[str] = Query(None, description="Filter by location (partial match)"),
+    availability_type: Optional[str] = Query(None, description="Filter by availability type: everyday, selected_days, not_available"),
+    available_days: Optional[str] = Query(None, description="Filter by specific days (comma-separated: Mon,Tue,Wed)"),
+    is_available: Optional[bool] = Query(None, description="Filter by availability"),
+    sort_by: Optional[str] = Query("distance", description="Sort by: distance, experience_high, experience_low, rating_high, rating_low"),
+    lat: Optional[float] = Query(None, ge=-90, le=90, description="Viewer latitude (required for distance sort)"),
+    lng: Optional[float] = Query(None, ge=-180, le=180, description="Viewer longitude (required for distance sort)"),
+):
+    cache_key = _worker_list_cache_key(
+        viewer_email, page, limit, cursor, include_total, min_experience, max_experience,
+        min_rating, location, availability_type, available_days, is_available, sort_by, lat, lng,
+    )
+    cached = response_cache.lookup(cache_key)
+    if cached is not None:
+        return cached
+
+    query = db.query(Worker).filter(*_worker_list_conditions(
+        min_experience, max_experience, min_rating, location, availability_type, available_days, is_available
+    ))
+
+    if include_total is None:
+        include_total = cursor is None
+    total = query.count() if include_total else None
+
+    sort_key, descending, sort_by_distance, order = _worker_list_order(sort_by, lat, lng)
+    if sort_key is not None:
+        query = query.add_columns(sort_key.label("sort_value"))
+    query = query.order_by(*order)
+
+    if cursor:
+        query = query.filter(_worker_list_boundary(cursor, sort_by, sort_key, descending))
+    else:
+        query = query.offset((page - 1) * limit)
+
+    rows = query.limit(limit + 1).all()
+    return response_cache.store(cache_key, _worker_list_page(
+        rows, sort_key, sort_by, sort_by_distance, total, page, limit, cursor, viewer_email, lat, lng
+    ))
+
+
+@async_router.get("")
+async def get_workers_async(
+    db: AsyncSession = Depends(get_async_db),
+    viewer_email: Optional[str] = Query(None, description="Logged-in user email for ownership flags"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page (keyset mode)"),
+    include_total: Optional[bool] = Query(None, description="Run the total count query (default: on for page mode, off for cursor mode)"),
+    min_experience: Optional[int] = Query(None, description="Minimum years of experience"),
+    max_experience: Optional[int] = Query(None, description="Maximum years of experience"),
+    min_rating: Optional[float] = Query(None, description="Minimum rating (0-5)"),
+    location: Optional[str] = Query(None, description="Filter by location (partial match)"),
+    availability_type: Optional[str] = Query(None, description="Filter by availability type: everyday, selected_days, not_available"),
+    available_days: Optional[str] = Query(None, description="Filter by specific days (comma-separated: Mon,Tue,Wed)"),
+    is_available: Optional[bool] = Query(None, description="Filter by availability"),
+    sort_by: Optional[str] = Query("distance", description="Sort by: distance, experience_high, experience_low, rating_high, rating_low"),
+    lat: Optional[float] = Query(None, ge=-90, le=90, description="Viewer latitude (required for distance sort)"),
+    lng: Optional[float] = Query(None, ge=-180, le=180, description="Viewer longitude (required for distance sort)"),
+):
+    cache_key = _worker_list_cache_key(
+        viewer_email, page, limit, cursor, include_total, min_experience, max_experience,
+        min_rating, location, availability_type, available_days, is_available, sort_by, lat, lng,
+    )
+    cached = response_cache.lookup(cache_key)
+    if cached is not None:
+        return cached
+
+    conditions = _worker_list_conditions(
+        min_experience, max_experience, min_rating, location, availability_type, available_days, is_available
+    )
+
+    if include_total is None:
+        include_total = cursor is None
+    total = await db.scalar(select(func.count(Worker.id)).where(*conditions)) if include_total else None
+
+    sort_key, descending, sort_by_distance, order = _worker_list_order(sort_by, lat, lng)
+    columns = [Worker] if sort_key is None else [Worker, sort_key.label("sort_value")]
+    statement = select(*columns).where(*conditions).order_by(*order)
+
+    if cursor:
+        statement = statement.where(_worker_list_boundary(cursor, sort_by, sort_key, descending))
+    else:
+        statement = statement.offset((page - 1) * limit)
+
+    result = await db.execute(statement.limit(limit + 1))
+    rows = list(result.scalars()) if sort_key is None else list(result.all())
+    return response_cache.store(cache_key, _worker_list_page(
+        rows, sort_key, sort_by, sort_by_distance, total, page, limit, cursor, viewer_email, lat, lng
+    ))
+
+
+# =====================================================
+# 👤 USER SIDE – WORKERS NEAR ME
+# =====================================================
+@router.get("/nearby")
+def get_nearby_workers(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the search centre"),
+    lng: float = Query(..., ge=-180, le=180, description="Longitude of the search centre"),
+    radius_km: float = Query(10, gt=0, le=200, description="Search radius in kilometres"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of workers (nearest first)"),
+    role: Optional[str] = Query(None, description="Filter by role"),
+    viewer_email: Optional[str] = Query(None, description="Logged-in user email for ownership flags"),
+    db: Session = Depends(get_db),
+):
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    distance_sq = distance_sq_expr(Worker.lat, Worker.lng, lat, lng)
+
+    # Bounding box narrows the scan on idx_workers_verified_available_geo; the
+    # distance expression then trims corners and orders the full match set.
+    query = db.query(Worker).filter(
+        Worker.is_verified == True,
+        Worker.is_available == True,
+        Worker.lat.between(min_lat, max_lat),
+        Worker.lng.between(min_lng, max_lng),
+        distance_sq <= radius_km * radius_km,
+    )
+    if role:
+        query = query.filter(Worker.role == role)
+
+    workers = query.order_by(distance_sq, Worker.id.desc()).limit(limit).all()
+
+    workers_list = []
+    for worker in workers:
+        item = _serialize_worker(worker, viewer_email)
+        item["distance_km"] = round(haversine_km(lat, lng, worker.lat, worker.lng), 2)
+        workers_list.append(item)
+
+    return {"workers": workers_list, "radius_km": radius_km, "count": len(workers_list)}
+
+
+# =====================================================
+# 👤 USER SIDE – FULL-TEXT WORKER SEARCH
+# =====================================================
+@router.get("/search")
+def search_workers(
+    q: str = Query(..., min_length=1, description="Words to search in name, role and location"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    viewer_email: Optional[str] = Query(None, description="Logged-in user email for ownership flags"),
+    db: Session = Depends(get_db),
+):
+    terms = search_terms(q)
+    if not terms:
+        return {"workers": [], "page": page, "limit": limit}
+
+    ids = search_ids(
+        db,
+        "workers",
+        terms,
+        filters="t.is_verified = TRUE AND t.is_available = TRUE",
+        limit=limit,
+        offset=(page - 1) * limit,
+    )
+    workers_by_id = {worker.id: worker for worker in db.query(Worker).filter(Worker.id.in_(ids)).all()} if ids else {}
+
+    return {
+        "workers": [
+            _serialize_worker(workers_by_id[worker_id], viewer_email)
+            for worker_id in ids
+            if worker_id in workers_by_id
+        ],
         "page": page,
         "limit": limit,
-        "total_pages": (total + limit - 1) // limit
     }
 
 
@@ -136,7 +382,7 @@ def get_workers(
 
 @router.get("/my", response_model=list[WorkerResponse])
 def get_my_workers(email: str, db: Session = Depends(get_db)):
-    email = _normalize_email(email)
+    email = normalize_email(email)
     workers = (
         db.query(Worker)
         .filter(Worker.user_email == email)
@@ -151,14 +397,30 @@ def get_my_workers(email: str, db: Session = Depends(get_db)):
 @router.get("/{worker_id}", response_model=WorkerResponse)
 def get_worker_by_id(
     worker_id: int,
+    request: Request,
     viewer_email: Optional[str] = Query(None, description="Logged-in user email for ownership flags"),
     db: Session = Depends(get_db),
 ):
     try:
-        worker = db.query(Worker).filter(Worker.id == worker_id).first()
-        if not worker:
+        viewer_email = normalize_email(viewer_email)
+        # Revalidation only needs the row version, not the full row; the
+        # viewer is part of the tag because ownership flags depend on it
+        version = db.query(Worker.updated_at).filter(Worker.id == worker_id).first()
+        if version is None:
             raise HTTPException(status_code=404, detail="Worker not found")
-        return _serialize_worker(worker, viewer_email)
+        etag = make_etag("worker", worker_id, version.updated_at, viewer_email)
+        if is_not_modified(request, etag, version.updated_at):
+            return not_modified(etag, version.updated_at)
+
+        cache_key = response_cache.key(f"workers:{worker_id}", viewer_email=viewer_email)
+        response = response_cache.lookup(cache_key)
+        if response is None:
+            worker = db.query(Worker).filter(Worker.id == worker_id).first()
+            if not worker:
+                raise HTTPException(status_code=404, detail="Worker not found")
+            content = WorkerResponse.model_validate(_serialize_worker(worker, viewer_email)).model_dump()
+            response = response_cache.store(cache_key, content)
+        return with_validators(response, etag, version.updated_at)
     except HTTPException:
         raise
     except Exception as e:
@@ -168,13 +430,49 @@ def get_worker_by_id(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+# Typed path so /workers/my, /workers/nearby, ... still reach the sync router
+@async_router.get("/{worker_id:int}", response_model=WorkerResponse)
+async def get_worker_by_id_async(
+    worker_id: int,
+    request: Request,
+    viewer_email: Optional[str] = Query(None, description="Logged-in user email for ownership flags"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        viewer_email = normalize_email(viewer_email)
+        updated_at = (await db.execute(select(Worker.updated_at).where(Worker.id == worker_id))).first()
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail="Worker not found")
+        updated_at = updated_at[0]
+        etag = make_etag("worker", worker_id, updated_at, viewer_email)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(etag, updated_at)
+
+        cache_key = response_cache.key(f"workers:{worker_id}", viewer_email=viewer_email)
+        response = response_cache.lookup(cache_key)
+        if response is None:
+            worker = await db.get(Worker, worker_id)
+            if not worker:
+                raise HTTPException(status_code=404, detail="Worker not found")
+            content = WorkerResponse.model_validate(_serialize_worker(worker, viewer_email)).model_dump()
+            response = response_cache.store(cache_key, content)
+        return with_validators(response, etag, updated_at)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"ERROR in get_worker_by_id_async: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
 # =====================================================
 # 👤 USER SIDE – CREATE WORKER PROFILE
 # (DEFAULT: is_verified = False)
 # =====================================================
 @router.post("", response_model=WorkerResponse)
 def create_worker(worker: WorkerCreate, db: Session = Depends(get_db)):
-    owner_email = _normalize_email(worker.user_email)
+    owner_email = normalize_email(worker.user_email)
     # Determine is_available based on availability_type
     is_available = worker.availability_type != "not_available"
     
@@ -186,14 +484,13 @@ def create_worker(worker: WorkerCreate, db: Session = Depends(get_db)):
         phone=worker.phone,
         experience=worker.experience,
         location=worker.location,
-        latitude=worker.latitude,
-        longitude=worker.longitude,
         user_email=owner_email,
         availability_type=worker.availability_type or "everyday",
         available_days=worker.available_days,
         is_verified=False,     # 🔒 Admin must approve
         is_available=is_available
     )
+    _apply_coordinates(new_worker, worker.latitude, worker.longitude)
 
     db.add(new_worker)
     db.commit()
@@ -205,7 +502,7 @@ def create_worker(worker: WorkerCreate, db: Session = Depends(get_db)):
 # 🛡️ ADMIN SIDE – GET PENDING WORKERS
 # =====================================================
 @router.get("/admin/pending", response_model=list[WorkerResponse])
-def get_pending_workers(db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def get_pending_workers(db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     workers = (
         db.query(Worker)
         .filter(Worker.is_verified == False)
@@ -217,7 +514,7 @@ def get_pending_workers(db: Session = Depends(get_db), current_admin: User = Dep
 # 🛡️ ADMIN SIDE – APPROVE WORKER
 # =====================================================
 @router.put("/admin/approve/{worker_id}")
-def approve_worker(worker_id: int, db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def approve_worker(worker_id: int, db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     worker = db.query(Worker).filter(Worker.id == worker_id).first()
 
     if not worker:
@@ -247,7 +544,7 @@ def approve_worker(worker_id: int, db: Session = Depends(get_db), current_admin:
 # 🛡️ ADMIN SIDE – REJECT WORKER
 # =====================================================
 @router.put("/admin/reject/{worker_id}")
-def reject_worker(worker_id: int, db: Session = Depends(get_db), current_admin: User = Depends(get_current_admin)):
+def reject_worker(worker_id: int, db: Session = Depends(get_db), current_admin: Principal = Depends(get_current_admin)):
     worker = db.query(Worker).filter(Worker.id == worker_id).first()
 
     if not worker:
@@ -279,7 +576,7 @@ def reject_worker(worker_id: int, db: Session = Depends(get_db), current_admin:
 # =====================================================
 @router.put("/{worker_id}", response_model=WorkerResponse)
 def update_worker(worker_id: int, worker: WorkerCreate, email: str = Query(...), db: Session = Depends(get_db)):
-    email = _normalize_email(email)
+    email = normalize_email(email)
     existing_worker = db.query(Worker).filter(Worker.id == worker_id, Worker.user_email == email).first()
 
     if not existing_worker:
@@ -293,8 +590,7 @@ def update_worker(worker_id: int, worker: WorkerCreate, email: str = Query(...),
     existing_worker.phone = worker.phone
     existing_worker.experience = worker.experience
     existing_worker.location = worker.location
-    existing_worker.latitude = worker.latitude
-    existing_worker.longitude = worker.longitude
+    _apply_coordinates(existing_worker, worker.latitude, worker.longitude)
     existing_worker.availability_type = worker.availability_type or "everyday"
     existing_worker.available_days = worker.available_days
     existing_worker.is_available = worker.availability_type != "not_available"
@@ -309,6 +605,7 @@ def update_worker(worker_id: int, worker: WorkerCreate, email: str = Query(...),
 # =====================================================
 @router.delete("/{worker_id}")
 def delete_worker(worker_id: int, email: str = Query(...), db: Session = Depends(get_db)):
+    email = normalize_email(email)
     worker = db.query(Worker).filter(Worker.id == worker_id, Worker.user_email == email).first()
 
     if not worker:
@@ -106,6 +106,8 @@ class JobResponse(BaseModel):
     user_email: str
     urgent: bool = False
     salary: Optional[str] = None
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
     required_workers: int = 1
     is_verified: bool = False
     verified: bool = False
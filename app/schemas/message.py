@@ -82,3 +82,4 @@ class ConversationDetailResponse(BaseModel):
     worker_id: Optional[int] = None
     worker_name: Optional[str] = None
     messages: list[MessageResponse]
+    has_more: bool = False
@@ -10,9 +10,13 @@ class ReviewBase(BaseModel):
 
 
 class ReviewCreate(ReviewBase):
-    # Only worker_id, rating, and comment are required from frontend
-    # reviewer_email and reviewer_name come from JWT token (current_user)
-    pass
+    reviewer_email: str
+
+
+class ReviewUpdate(BaseModel):
+    reviewer_email: Optional[str] = None
+    rating: Optional[int] = None
+    comment: Optional[str] = None
 
 
 
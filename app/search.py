@@ -0,0 +1,133 @@
+"""
+Full-text search over jobs and workers
+
+On SQLite the *_fts tables are external-content FTS5 indexes over the base
+tables and are kept in sync by triggers, so every write path (routers,
+admin tools, scripts) updates them in the same transaction without extra
+code. On PostgreSQL the same columns and weights are searched with a
+weighted tsvector expression backed by a GIN expression index, which the
+database maintains on its own.
+"""
+import re
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+# table -> (fts table, indexed columns, bm25 column weights)
+FTS_TABLES = {
+    "jobs": ("jobs_fts", ("title", "description", "category", "location"), (10.0, 1.0, 5.0, 3.0)),
+    "workers": ("workers_fts", ("name", "role", "location"), (10.0, 5.0, 3.0)),
+}
+# PostgreSQL has four weight classes; columns get them in order of their bm25 weight
+PG_WEIGHT_CLASSES = "ABCD"
+
+
+def _search_table_ddl(table: str) -> list[str]:
+    fts, columns, _ = FTS_TABLES[table]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, content='{table}', "
+        f"content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column_list} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+    ]
+
+
+def _pg_search_vector(table: str) -> str:
+    """Weighted tsvector over the indexed columns; must match the GIN index expression."""
+    _, columns, weights = FTS_TABLES[table]
+    ranked = sorted(zip(columns, weights), key=lambda item: -item[1])
+    parts = [
+        f"setweight(to_tsvector('simple', coalesce({column}, '')), '{PG_WEIGHT_CLASSES[min(i, 3)]}')"
+        for i, (column, _) in enumerate(ranked)
+    ]
+    return "(" + " || ".join(parts) + ")"
+
+
+def create_search_tables(conn: Connection) -> None:
+    """
+    Create the search indexes (and FTS5 triggers) if missing and index
+    existing rows. Runs from the search migration, inside its transaction.
+    """
+    if conn.dialect.name == "postgresql":
+        for table, (fts, _, _) in FTS_TABLES.items():
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {fts}_idx ON {table} USING GIN ({_pg_search_vector(table)})"
+            ))
+        return
+    if conn.dialect.name != "sqlite":
+        return
+
+    for table, (fts, _, _) in FTS_TABLES.items():
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": fts},
+        ).first()
+        if exists:
+            continue
+        for statement in _search_table_ddl(table):
+            conn.execute(text(statement))
+        conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def drop_search_tables(conn: Connection) -> None:
+    for table, (fts, _, _) in FTS_TABLES.items():
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(f"DROP INDEX IF EXISTS {fts}_idx"))
+        elif conn.dialect.name == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {fts}_{suffix}"))
+            conn.execute(text(f"DROP TABLE IF EXISTS {fts}"))
+
+
+def rebuild_search_tables(engine: Engine) -> None:
+    """Re-index every row, e.g. after bulk edits made with triggers disabled."""
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as conn:
+        for fts, _, _ in FTS_TABLES.values():
+            conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def search_terms(raw: str) -> list[str]:
+    """
+    Split free text into word terms. Every term is later matched as a
+    prefix, and nothing but word characters survives, so user input can
+    never inject FTS operators or column filters.
+    """
+    return re.findall(r"\w+", raw or "")
+
+
+def search_ids(db: Session, table: str, terms: list[str], filters: str, limit: int, offset: int) -> list[int]:
+    """Return ids of `table` rows matching all `terms`, best rank first."""
+    if db.get_bind().dialect.name == "postgresql":
+        vector = _pg_search_vector(table)
+        rows = db.execute(
+            text(
+                f"SELECT t.id FROM {table} t, to_tsquery('simple', :query) query "
+                f"WHERE {vector} @@ query AND {filters} "
+                f"ORDER BY ts_rank({vector}, query) DESC, t.id DESC LIMIT :limit OFFSET :offset"
+            ),
+            {"query": " & ".join(f"{term}:*" for term in terms), "limit": limit, "offset": offset},
+        )
+        return [row[0] for row in rows]
+
+    fts, _, weights = FTS_TABLES[table]
+    rank = f"bm25({fts}, {', '.join(str(weight) for weight in weights)})"
+    rows = db.execute(
+        text(
+            f"SELECT t.id FROM {fts} JOIN {table} t ON t.id = {fts}.rowid "
+            f"WHERE {fts} MATCH :match AND {filters} "
+            f"ORDER BY {rank}, t.id DESC LIMIT :limit OFFSET :offset"
+        ),
+        {"match": " ".join(f'"{term}"*' for term in terms), "limit": limit, "offset": offset},
+    )
+    return [row[0] for row in rows]
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Sync vs async read-path benchmark.
+
+Runs the app in-process through httpx's ASGI transport against a throwaway
+SQLite database seeded with verified jobs and workers, once with the sync
+routes and once with JOBSIFY_ASYNC_ROUTES=1, and reports requests/sec and
+p50/p99 latency for the hot read endpoints at several concurrency levels.
+Each mode runs in its own interpreter because the setting is read at import.
+The response cache is off unless --with-cache is given, so the numbers
+measure the database path.
+
+    pip install httpx aiosqlite
+    python benchmarks/async_reads.py --rows 2000 --requests 2000 --concurrency 1 10 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHASES = ("job_detail", "job_list", "worker_detail", "unread_count")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def seed(rows: int):
+    from app.database import SessionLocal
+    from app.models.job import Job
+    from app.models.workers import Worker
+
+    db = SessionLocal()
+    try:
+        db.add_all(
+            Job(
+                title=f"Bench job {i}",
+                category="Plumbing",
+                description="benchmark",
+                location="Kochi",
+                phone="0000000000",
+                user_email=f"owner{i % 50}@bench.local",
+                verified=True,
+                salary="800-1000",
+                salary_min=800.0,
+                salary_max=1000.0,
+            )
+            for i in range(rows)
+        )
+        db.add_all(
+            Worker(
+                name=f"Bench worker {i}",
+                role="Plumber",
+                phone="0000000000",
+                location="Kochi",
+                user_email=f"worker{i}@bench.local",
+                is_verified=True,
+            )
+            for i in range(rows)
+        )
+        db.commit()
+        job_ids = [row[0] for row in db.query(Job.id).all()]
+        worker_ids = [row[0] for row in db.query(Worker.id).all()]
+    finally:
+        db.close()
+    return job_ids, worker_ids
+
+
+async def run_phase(client, paths: list[str], concurrency: int) -> dict:
+    latencies: list[float] = []
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def one(path: str):
+        async with limiter:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(path) for path in paths))
+    elapsed = time.perf_counter() - start
+    return {
+        "rps": len(paths) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+    }
+
+
+async def child_main(rows: int, requests: int, levels: list[int]):
+    import httpx
+
+    from app.database import dispose_async_engine
+    from app.main import app
+    from migrate import upgrade
+
+    upgrade()
+
+    job_ids, worker_ids = seed(rows)
+    rng = random.Random(42)
+    pages = max(1, rows // 20)
+    workloads = {
+        "job_detail": lambda: f"/jobs/{rng.choice(job_ids)}",
+        "job_list": lambda: f"/jobs?limit=20&page={rng.randint(1, pages)}",
+        "worker_detail": lambda: f"/workers/{rng.choice(worker_ids)}",
+        "unread_count": lambda: f"/notifications/unread-count?user_email=owner{rng.randint(0, 49)}@bench.local",
+    }
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        for concurrency in levels:
+            for phase in PHASES:
+                paths = [workloads[phase]() for _ in range(requests)]
+                results.append({"phase": phase, "concurrency": concurrency, **await run_phase(client, paths, concurrency)})
+    # ASGITransport sends no lifespan events, so the app's shutdown hook never runs
+    await dispose_async_engine()
+    print(json.dumps(results))
+
+
+def run_mode(mode: str, args) -> list[dict]:
+    env = dict(os.environ)
+    env["JOBSIFY_DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='jobsify-bench-'), 'bench.db')}"
+    env["JOBSIFY_ASYNC_ROUTES"] = "1" if mode == "async" else "0"
+    if not args.with_cache:
+        env["JOBSIFY_CACHE_BACKEND"] = "off"
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child",
+        "--rows", str(args.rows), "--requests", str(args.requests),
+        "--concurrency", *map(str, args.concurrency),
+    ]
+    output = subprocess.run(command, env=env, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args):
+    print(f"rows: {args.rows}  requests per phase: {args.requests}  cache: {'on' if args.with_cache else 'off'}")
+    print(f"{'mode':<6} {'phase':<14} {'conc':>5} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for mode in args.modes:
+        for row in run_mode(mode, args):
+            print(
+                f"{mode:<6} {row['phase']:<14} {row['concurrency']:>5} "
+                f"{row['rps']:>10.1f} {row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000, help="Jobs and workers to seed")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per phase and concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50], help="Maximum in-flight requests")
+    parser.add_argument("--modes", nargs="+", choices=["sync", "async"], default=["sync", "async"])
+    parser.add_argument("--with-cache", action="store_true", help="Leave the response cache enabled")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        sys.path.insert(0, ROOT)
+        asyncio.run(child_main(args.rows, args.requests, args.concurrency))
+    else:
+        main(args)
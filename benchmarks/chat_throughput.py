@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Chat throughput benchmark.
+
+Runs the app in-process through httpx's ASGI transport against a throwaway
+SQLite database and measures send-message, inbox-list and mark-read
+throughput and p50/p99 latency at several conversation counts.
+
+    pip install httpx
+    python benchmarks/chat_throughput.py --sizes 10 100 1000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Point the app at a temp database before anything imports app.database
+_tmp_dir = tempfile.mkdtemp(prefix="jobsify-bench-")
+os.environ.setdefault("JOBSIFY_DATABASE_URL", f"sqlite:///{os.path.join(_tmp_dir, 'bench.db')}")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from app.main import app
+from migrate import upgrade
+
+INBOX_OWNERS = 10
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def timed(latencies: list[float], request, limiter: asyncio.Semaphore):
+    async with limiter:
+        start = time.perf_counter()
+        response = await request
+        latencies.append(time.perf_counter() - start)
+    response.raise_for_status()
+    return response
+
+
+async def run_phase(name: str, requests: list, concurrency: int) -> dict:
+    latencies: list[float] = []
+    limiter = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(latencies, request, limiter) for request in requests))
+    elapsed = time.perf_counter() - start
+    return {
+        "phase": name,
+        "ops": len(latencies),
+        "ops_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+    }
+
+
+async def bench_size(
+    client: httpx.AsyncClient, size: int, rounds: int, concurrency: int, run_id: int
+) -> list[dict]:
+    owners = [f"owner{i}.run{run_id}@bench.local" for i in range(INBOX_OWNERS)]
+    clients = [f"client{i}.run{run_id}@bench.local" for i in range(size)]
+
+    # Setup (not timed): one conversation per client, spread over the inbox owners
+    conversations = []
+    for index, client_email in enumerate(clients):
+        owner_email = owners[index % INBOX_OWNERS]
+        response = await client.post(
+            "/messages/conversations",
+            json={"sender_email": client_email, "recipient_email": owner_email},
+        )
+        response.raise_for_status()
+        conversations.append((response.json()["id"], client_email, owner_email))
+
+    results = []
+    for _ in range(rounds):
+        results.append(await run_phase("send", [
+            client.post(
+                f"/messages/conversations/{conversation_id}",
+                json={"sender_email": client_email, "content": "benchmark message"},
+            )
+            for conversation_id, client_email, _ in conversations
+        ], concurrency))
+        results.append(await run_phase("inbox", [
+            client.get("/messages/conversations", params={"user_email": owners[index % INBOX_OWNERS]})
+            for index in range(size)
+        ], concurrency))
+        results.append(await run_phase("mark_read", [
+            client.put(
+                f"/messages/conversations/{conversation_id}/read",
+                params={"user_email": owner_email},
+            )
+            for conversation_id, _, owner_email in conversations
+        ], concurrency))
+    return results
+
+
+def summarize(size: int, results: list[dict]):
+    for phase in ("send", "inbox", "mark_read"):
+        rows = [row for row in results if row["phase"] == phase]
+        print(
+            f"{size:>6} {phase:<10} {sum(r['ops'] for r in rows):>7} "
+            f"{statistics.fmean(r['ops_per_sec'] for r in rows):>10.1f} "
+            f"{statistics.median(r['p50_ms'] for r in rows):>9.2f} "
+            f"{max(r['p99_ms'] for r in rows):>9.2f}"
+        )
+
+
+async def main(sizes: list[int], rounds: int, concurrency: int):
+    upgrade()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        print(f"database: {os.environ['JOBSIFY_DATABASE_URL']}  in-flight requests: {concurrency}")
+        print(f"{'convs':>6} {'phase':<10} {'ops':>7} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+        for run_id, size in enumerate(sizes):
+            summarize(size, await bench_size(client, size, rounds, concurrency, run_id))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Concurrent conversations")
+    parser.add_argument("--rounds", type=int, default=3, help="Repetitions of each phase per size")
+    # Sync routes hold a pooled connection per request; keep in-flight requests
+    # under the engine's pool size or the run measures pool timeouts instead.
+    parser.add_argument("--concurrency", type=int, default=10, help="Maximum in-flight requests")
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.rounds, args.concurrency))
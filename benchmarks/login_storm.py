@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Login-storm benchmark.
+
+Fires a burst of concurrent logins at the app (in-process, through httpx's
+ASGI transport) while a probe requests a non-auth endpoint (GET /jobs, with
+the response cache off) at a steady rate, and reports the probe's p50/p99
+latency before and during the storm plus login throughput and shed (503)
+logins. Each configuration runs in its own interpreter against a fresh
+database:
+
+- inline: bcrypt in the request threadpool, no admission limit (the old behaviour)
+- pool:   bcrypt on the password process pool with admission control (the default)
+
+    pip install httpx
+    python benchmarks/login_storm.py --logins 200 --login-concurrency 40 --rounds 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIGS = {
+    "inline": {"JOBSIFY_PASSWORD_WORKERS": "0", "JOBSIFY_PASSWORD_MAX_PENDING": "100000"},
+    "pool": {},
+}
+# Enough accounts that no email exceeds the login rate limit (5/min) during a run
+LOGINS_PER_USER = 4
+PASSWORD = "Bench-passw0rd!"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def seed(rounds: int, users: int):
+    import bcrypt
+
+    from app.database import SessionLocal
+    from app.models.job import Job
+    from app.models.user import User
+
+    # One hash shared by every user keeps seeding fast; logins still pay full cost
+    hashed = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds)).decode()
+    db = SessionLocal()
+    try:
+        db.add_all(
+            User(email=f"user{i}@example.com", password=hashed, role="user", email_verified=True, blocked=False)
+            for i in range(users)
+        )
+        db.add_all(
+            Job(
+                title=f"Bench job {i}",
+                category="Plumber",
+                description="login storm benchmark",
+                location="Kochi",
+                phone="0000000000",
+                user_email="owner@example.com",
+                verified=True,
+            )
+            for i in range(200)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+async def probe(client, stop: asyncio.Event, interval: float) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get("/jobs", params={"limit": 20})
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def child_main(logins: int, concurrency: int, interval: float, idle_seconds: float):
+    import httpx
+
+    from app.main import app
+    from app.passwords import BCRYPT_ROUNDS, shutdown_password_pool, start_password_pool
+    from migrate import upgrade
+
+    upgrade()
+    users = max(1, -(-logins // LOGINS_PER_USER))
+    seed(BCRYPT_ROUNDS, users)
+    # ASGITransport does not run startup handlers
+    start_password_pool()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        stop = asyncio.Event()
+        idle_probe = asyncio.create_task(probe(client, stop, interval))
+        await asyncio.sleep(idle_seconds)
+        stop.set()
+        idle = await idle_probe
+
+        limiter = asyncio.Semaphore(concurrency)
+        statuses = []
+        login_latencies = []
+
+        async def login(i: int):
+            async with limiter:
+                start = time.perf_counter()
+                response = await client.post(
+                    "/auth/login", json={"email": f"user{i % users}@example.com", "password": PASSWORD}
+                )
+                login_latencies.append(time.perf_counter() - start)
+                statuses.append(response.status_code)
+
+        stop = asyncio.Event()
+        storm_probe = asyncio.create_task(probe(client, stop, interval))
+        start = time.perf_counter()
+        await asyncio.gather(*(login(i) for i in range(logins)))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        storm = await storm_probe
+    shutdown_password_pool()
+
+    ok = statuses.count(200)
+    print(json.dumps({
+        "idle_p50_ms": percentile(idle, 50) * 1000,
+        "idle_p99_ms": percentile(idle, 99) * 1000,
+        "storm_p50_ms": percentile(storm, 50) * 1000,
+        "storm_p99_ms": percentile(storm, 99) * 1000,
+        "storm_mean_ms": statistics.fmean(storm) * 1000,
+        "logins_ok": ok,
+        "logins_shed": statuses.count(503),
+        "logins_per_sec": ok / elapsed if elapsed else 0.0,
+        "login_p50_ms": percentile(login_latencies, 50) * 1000,
+    }))
+
+
+def run_config(name: str, args) -> dict:
+    env = dict(os.environ)
+    env.update(CONFIGS[name])
+    env["JOBSIFY_DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='jobsify-bench-'), 'bench.db')}"
+    env["JOBSIFY_CACHE_BACKEND"] = "off"
+    env["JOBSIFY_BCRYPT_ROUNDS"] = str(args.rounds)
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child",
+        "--logins", str(args.logins), "--login-concurrency", str(args.login_concurrency),
+        "--probe-interval", str(args.probe_interval), "--idle-seconds", str(args.idle_seconds),
+    ]
+    output = subprocess.run(command, env=env, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args):
+    print(f"logins: {args.logins}  in-flight logins: {args.login_concurrency}  bcrypt rounds: {args.rounds}")
+    print(
+        f"{'config':<7} {'idle p50':>9} {'idle p99':>9} {'storm p50':>10} {'storm p99':>10} "
+        f"{'logins/s':>9} {'ok':>5} {'shed':>5}"
+    )
+    for name in args.configs:
+        row = run_config(name, args)
+        print(
+            f"{name:<7} {row['idle_p50_ms']:>9.2f} {row['idle_p99_ms']:>9.2f} {row['storm_p50_ms']:>10.2f} "
+            f"{row['storm_p99_ms']:>10.2f} {row['logins_per_sec']:>9.1f} {row['logins_ok']:>5} {row['logins_shed']:>5}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200, help="Logins in the storm")
+    parser.add_argument("--login-concurrency", type=int, default=40, help="Maximum in-flight logins")
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt cost factor for the run")
+    parser.add_argument("--probe-interval", type=float, default=0.02, help="Seconds between probe requests")
+    parser.add_argument("--idle-seconds", type=float, default=2.0, help="Probe time before the storm")
+    parser.add_argument("--configs", nargs="+", choices=sorted(CONFIGS), default=["inline", "pool"])
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        sys.path.insert(0, ROOT)
+        asyncio.run(child_main(args.logins, args.login_concurrency, args.probe_interval, args.idle_seconds))
+    else:
+        main(args)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Rate limiter microbenchmark.
+
+Calls check_rate_limit directly (no HTTP) with the login limit (5 per 60s)
+for keys drawn at random from a pool, and reports checks per second. It
+then floods the limiter with distinct keys and reports how many it still
+holds and the memory they take (tracemalloc). Each configuration runs in
+its own interpreter against a fresh database:
+
+- legacy:   per-key timestamp lists that are never evicted (the old RateLimiter)
+- memory:   sliding-window counters in an LRU map (JOBSIFY_RATE_LIMIT_BACKEND=memory)
+- database: sliding-window counters in the rate_limits table (the default)
+
+    python benchmarks/rate_limiter.py --seconds 3 --keys 20000 --flood 200000
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIGS = {
+    "legacy": {},
+    "memory": {"JOBSIFY_RATE_LIMIT_BACKEND": "memory"},
+    "database": {"JOBSIFY_RATE_LIMIT_BACKEND": "database"},
+}
+
+
+class LegacyRateLimiter:
+    """The RateLimiter that app/middleware/rate_limiter.py used to contain."""
+
+    def __init__(self):
+        self.requests = defaultdict(list)
+        self.locked_ips = {}
+
+    def check_rate_limit(self, key: str, max_requests: int = 5, window_seconds: int = 60):
+        from fastapi import HTTPException
+
+        now = time.time()
+        if key in self.locked_ips:
+            if time.time() < self.locked_ips[key]:
+                raise HTTPException(status_code=429, detail="Too many attempts. Please try again later.")
+            else:
+                del self.locked_ips[key]
+        self.requests[key] = [t for t in self.requests[key] if now - t < window_seconds]
+        if len(self.requests[key]) >= max_requests:
+            self.locked_ips[key] = now + 300
+            raise HTTPException(status_code=429, detail="Too many attempts. Please try again later.")
+        self.requests[key].append(now)
+
+
+def make_limiter(name: str):
+    if name == "legacy":
+        return LegacyRateLimiter(), lambda limiter: len(limiter.requests) + len(limiter.locked_ips)
+    from app.middleware.rate_limiter import RateLimiter, create_backend
+
+    limiter = RateLimiter(create_backend())
+    return limiter, lambda limiter: limiter.backend.size()
+
+
+def throughput(limiter, keys: int, seconds: float) -> dict:
+    from fastapi import HTTPException
+
+    rng = random.Random(0)
+    pool = [f"login:user{i}@example.com" for i in range(keys)]
+    checks = denied = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            try:
+                limiter.check_rate_limit(rng.choice(pool), max_requests=5, window_seconds=60)
+            except HTTPException:
+                denied += 1
+        checks += 100
+    elapsed = time.perf_counter() - start
+    return {"checks_per_sec": checks / elapsed, "us_per_check": elapsed / checks * 1e6, "denied": denied}
+
+
+def flood(limiter, size, count: int, trace: bool) -> dict:
+    if trace:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        limiter.check_rate_limit(f"register:flood{i}@example.com", max_requests=3, window_seconds=300)
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return {"keys_held": size(limiter), "flood_mib": used / 2 ** 20 if trace else None}
+
+
+def child_main(name: str, keys: int, seconds: float, flood_keys: int):
+    sys.path.insert(0, ROOT)
+    if name != "legacy":
+        from migrate import upgrade
+
+        upgrade()
+    limiter, _ = make_limiter(name)
+    row = throughput(limiter, keys, seconds)
+    # The database backend keeps its rows on disk, so there is no process memory to trace
+    row.update(flood(*make_limiter(name), flood_keys, trace=name != "database"))
+    print(json.dumps(row))
+
+
+def run_config(name: str, args) -> dict:
+    env = dict(os.environ)
+    env.update(CONFIGS[name])
+    env["JOBSIFY_DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='jobsify-bench-'), 'bench.db')}"
+    env["JOBSIFY_RATE_LIMIT_MAX_KEYS"] = str(args.max_keys)
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child", name,
+        "--keys", str(args.keys), "--seconds", str(args.seconds), "--flood", str(args.flood),
+    ]
+    output = subprocess.run(command, env=env, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args):
+    print(f"key pool: {args.keys}  flood: {args.flood} distinct keys  memory backend bound: {args.max_keys} keys")
+    print(f"{'config':<9} {'checks/s':>10} {'us/check':>9} {'denied':>7} {'keys held':>10} {'flood MiB':>10}")
+    for name in args.configs:
+        row = run_config(name, args)
+        flood_mib = "on disk" if row["flood_mib"] is None else f"{row['flood_mib']:.2f}"
+        print(
+            f"{name:<9} {row['checks_per_sec']:>10.0f} {row['us_per_check']:>9.2f} {row['denied']:>7} "
+            f"{row['keys_held']:>10} {flood_mib:>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=20000, help="Distinct keys in the throughput run")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of the throughput run")
+    parser.add_argument("--flood", type=int, default=200000, help="Distinct keys in the memory run")
+    parser.add_argument("--max-keys", type=int, default=100000, help="JOBSIFY_RATE_LIMIT_MAX_KEYS for the run")
+    parser.add_argument("--configs", nargs="+", choices=sorted(CONFIGS), default=["legacy", "memory", "database"])
+    parser.add_argument("--child", choices=sorted(CONFIGS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child_main(args.child, args.keys, args.seconds, args.flood)
+    else:
+        main(args)
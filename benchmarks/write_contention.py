@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+SQLite write-contention benchmark.
+
+Fires concurrent job creations and message sends at the app (in-process,
+through httpx's ASGI transport) while readers page through the job list,
+once with the legacy engine settings (rollback journal, no pragmas, 5+10
+pool) and once with the tuned engine (WAL, busy_timeout, synchronous=NORMAL,
+mmap/cache/temp_store pragmas, pool sized to the request threadpool).
+Each configuration runs in its own interpreter against a fresh database and
+reports writes/sec, p50/p99 latency and failed requests ("database is
+locked" surfaces as HTTP 500).
+
+    pip install httpx
+    python benchmarks/write_contention.py --writes 1000 --concurrency 10 40
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIGS = {
+    "legacy": {
+        "JOBSIFY_SQLITE_PRAGMAS": "0",
+        "JOBSIFY_DB_POOL_SIZE": "5",
+        "JOBSIFY_DB_MAX_OVERFLOW": "10",
+    },
+    "tuned": {},
+}
+CONVERSATIONS = 20
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_mixed(client, writes: int, concurrency: int, conversations: list, run_id: int) -> dict:
+    limiter = asyncio.Semaphore(concurrency)
+    latencies = {"create_job": [], "send_message": [], "list_jobs": []}
+    failures = {name: 0 for name in latencies}
+
+    async def one(kind: str, send):
+        async with limiter:
+            start = time.perf_counter()
+            try:
+                response = await send()
+                ok = response.status_code < 400
+            except Exception:
+                ok = False
+            latencies[kind].append(time.perf_counter() - start)
+        if not ok:
+            failures[kind] += 1
+
+    def create_job(i: int):
+        return lambda: client.post("/jobs", json={
+            "title": f"Contention job {run_id}-{i}",
+            "category": "Plumber",
+            "description": "write contention benchmark",
+            "location": "Kochi",
+            "phone": "9876543210",
+            "user_email": f"poster{i % 25}@bench.local",
+            "salary": "800-1000",
+        })
+
+    def send_message(i: int):
+        conversation_id, sender = conversations[i % len(conversations)]
+        return lambda: client.post(
+            f"/messages/conversations/{conversation_id}",
+            json={"sender_email": sender, "content": f"message {i}"},
+        )
+
+    tasks = []
+    for i in range(writes):
+        tasks.append(one("create_job", create_job(i)))
+        tasks.append(one("send_message", send_message(i)))
+        if i % 4 == 0:
+            tasks.append(one("list_jobs", lambda: client.get("/jobs", params={"limit": 20})))
+
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    results = []
+    for kind, samples in latencies.items():
+        results.append({
+            "op": kind,
+            "concurrency": concurrency,
+            "ops": len(samples),
+            "ops_per_sec": len(samples) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+            "mean_ms": statistics.fmean(samples) * 1000,
+            "failed": failures[kind],
+        })
+    return results
+
+
+async def child_main(writes: int, levels: list[int]):
+    import httpx
+
+    from app.main import app
+    from migrate import upgrade
+
+    upgrade()
+
+    transport = httpx.ASGITransport(app=app)
+    results = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        conversations = []
+        for i in range(CONVERSATIONS):
+            sender = f"sender{i}@bench.local"
+            response = await client.post(
+                "/messages/conversations",
+                json={"sender_email": sender, "recipient_email": f"owner{i}@bench.local"},
+            )
+            response.raise_for_status()
+            conversations.append((response.json()["id"], sender))
+        for run_id, concurrency in enumerate(levels):
+            results.extend(await run_mixed(client, writes, concurrency, conversations, run_id))
+    print(json.dumps(results))
+
+
+def run_config(name: str, args) -> list[dict]:
+    env = dict(os.environ)
+    env.update(CONFIGS[name])
+    env["JOBSIFY_DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='jobsify-bench-'), 'bench.db')}"
+    env["JOBSIFY_CACHE_BACKEND"] = "off"
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child",
+        "--writes", str(args.writes), "--concurrency", *map(str, args.concurrency),
+    ]
+    output = subprocess.run(command, env=env, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args):
+    print(f"writes per op and level: {args.writes}")
+    print(f"{'config':<7} {'op':<13} {'conc':>5} {'ops':>6} {'ops/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'failed':>7}")
+    for name in args.configs:
+        for row in run_config(name, args):
+            print(
+                f"{name:<7} {row['op']:<13} {row['concurrency']:>5} {row['ops']:>6} "
+                f"{row['ops_per_sec']:>9.1f} {row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['failed']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=500, help="Job creations (and message sends) per level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 40], help="Maximum in-flight requests")
+    parser.add_argument("--configs", nargs="+", choices=sorted(CONFIGS), default=["legacy", "tuned"])
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        sys.path.insert(0, ROOT)
+        asyncio.run(child_main(args.writes, args.concurrency))
+    else:
+        main(args)
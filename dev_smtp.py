@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Local SMTP sink for development and tests (aiosmtpd). Accepts every
+message and prints it instead of delivering it, so OTPs can be read off
+the console.
+
+    pip install aiosmtpd
+    python dev_smtp.py --port 8025
+    JOBSIFY_SMTP_HOST=localhost JOBSIFY_SMTP_PORT=8025 JOBSIFY_SMTP_STARTTLS=0 uvicorn app.main:app
+
+--delay makes every message take that long to accept, like a slow provider;
+--reject-first N answers the first N messages with a temporary 451 to
+exercise the dispatcher's retries.
+"""
+import argparse
+import asyncio
+import time
+
+
+class PrintingHandler:
+    def __init__(self, delay: float = 0.0, reject_first: int = 0):
+        self.delay = delay
+        self.reject_remaining = reject_first
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.reject_remaining > 0:
+            self.reject_remaining -= 1
+            print(f"↩️  Deferred mail to {', '.join(envelope.rcpt_tos)}")
+            return "451 Try again later"
+        self.received += 1
+        print("=" * 60)
+        print(f"📧 #{self.received} {time.strftime('%H:%M:%S')} {envelope.mail_from} -> {', '.join(envelope.rcpt_tos)}")
+        print(envelope.content.decode("utf8", errors="replace"))
+        return "250 Message accepted for delivery"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait before accepting each message")
+    parser.add_argument("--reject-first", type=int, default=0, help="Answer the first N messages with 451")
+    args = parser.parse_args()
+
+    try:
+        from aiosmtpd.controller import Controller
+    except ImportError:
+        raise SystemExit("dev_smtp.py requires the 'aiosmtpd' package: pip install aiosmtpd")
+
+    controller = Controller(PrintingHandler(args.delay, args.reject_first), hostname=args.host, port=args.port)
+    controller.start()
+    print(f"✅ SMTP sink listening on {args.host}:{args.port} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,10 @@ Initialize predefined admin users in the database.
 Run this script once to create admin accounts.
 """
 
-import bcrypt
 from sqlalchemy.orm import Session
-from app.database import SessionLocal, engine, Base
+from app.database import SessionLocal
 from app.models.user import User
+from app.passwords import hash_password
 
 # Predefined admin emails and their passwords
 # You can change these passwords before running the script
@@ -51,10 +51,7 @@ def init_admin_users():
                 continue
             
             # Hash password
-            hashed_password = bcrypt.hashpw(
-                admin_data["password"].encode(),
-                bcrypt.gensalt()
-            ).decode()
+            hashed_password = hash_password(admin_data["password"])
             
             # Create admin user
             new_admin = User(
@@ -82,6 +79,7 @@ def init_admin_users():
         db.close()
 
 if __name__ == "__main__":
-    # Create tables if they don't exist
-    Base.metadata.create_all(bind=engine)
+    # Create/upgrade tables if needed
+    from migrate import upgrade
+    upgrade()
     init_admin_users()
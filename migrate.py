@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Apply and inspect schema migrations (Alembic, see migrations/).
+
+The app no longer creates or alters tables when it starts; run this first
+on every deploy, against the same JOBSIFY_DATABASE_URL / DATABASE_URL the
+app will use:
+
+    python migrate.py upgrade            # bring the database to the latest revision
+    python migrate.py check              # exit 1 if migrations are pending or tables/columns/indexes are missing
+    python migrate.py check --strict     # ... or any difference from the models at all
+    python migrate.py current            # revision the database is at
+    python migrate.py history
+    python migrate.py downgrade 0010
+    python migrate.py revision -m "add jobs.deadline" --autogenerate
+
+Databases created before migrations existed need no stamping: the first
+revisions only add what is missing, so `upgrade` works from any state the
+old add_*/fix_* scripts left behind.
+"""
+import argparse
+import os
+import sys
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+
+
+def alembic_config() -> Config:
+    return Config(os.path.join(ROOT, "alembic.ini"))
+
+
+def upgrade(revision: str = "head"):
+    """Programmatic upgrade (benchmarks, reset_db.py); leaves the caller's logging alone."""
+    config = alembic_config()
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, revision)
+
+
+def _describe(diff) -> str:
+    # compare_metadata yields tuples, or lists of tuples for column modifications
+    if isinstance(diff, list):
+        kind, _, table, column = diff[0][:4]
+        return f"{kind} {table}.{column}"
+    kind, target = diff[0], diff[-1]
+    if kind in ("add_column", "remove_column"):
+        return f"{kind} {diff[2]}.{target.name}"
+    if kind in ("add_index", "remove_index"):
+        return f"{kind} {target.name} on {target.table.name}"
+    return f"{kind} {getattr(target, 'name', target)}"
+
+
+def check(strict: bool = False) -> list[str]:
+    """
+    Return why the database does not match the code; empty when it does.
+    By default only tables, columns and indexes the models need but the
+    database lacks count; databases that predate migrations also differ in
+    column types and nullability, which `strict` reports as well.
+    """
+    from app.database import DATABASE_URL, Base, create_db_engine
+    from migrations.helpers import include_name
+
+    heads = set(ScriptDirectory.from_config(alembic_config()).get_heads())
+    engine = create_db_engine(DATABASE_URL, mode="script")
+    try:
+        with engine.connect() as conn:
+            context = MigrationContext.configure(conn, opts={"include_name": include_name})
+            current = set(context.get_current_heads())
+            if current != heads:
+                return [
+                    f"database is at {', '.join(sorted(current)) or 'no revision'}, "
+                    f"code expects {', '.join(sorted(heads))}; run `python migrate.py upgrade`"
+                ]
+            diffs = compare_metadata(context, Base.metadata)
+    finally:
+        engine.dispose()
+    return [
+        f"model drift: {_describe(diff)}"
+        for diff in diffs
+        if strict or (not isinstance(diff, list) and diff[0].startswith("add_"))
+    ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    upgrade_parser = commands.add_parser("upgrade", help="Upgrade to a revision (default: head)")
+    upgrade_parser.add_argument("revision", nargs="?", default="head")
+    downgrade_parser = commands.add_parser("downgrade", help="Downgrade to a revision")
+    downgrade_parser.add_argument("revision")
+    check_parser = commands.add_parser("check", help="Fail if migrations are pending or the models drifted")
+    check_parser.add_argument("--strict", action="store_true", help="Also fail on type/nullability differences")
+    commands.add_parser("current", help="Show the database revision")
+    commands.add_parser("history", help="List revisions")
+    revision_parser = commands.add_parser("revision", help="Create a new revision file")
+    revision_parser.add_argument("-m", "--message", required=True)
+    revision_parser.add_argument("--autogenerate", action="store_true", help="Diff the models against the database")
+    args = parser.parse_args(argv)
+
+    config = alembic_config()
+    if args.command == "upgrade":
+        command.upgrade(config, args.revision)
+    elif args.command == "downgrade":
+        command.downgrade(config, args.revision)
+    elif args.command == "check":
+        problems = check(strict=args.strict)
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            return 1
+        print("✅ Database schema is up to date")
+    elif args.command == "current":
+        command.current(config, verbose=True)
+    elif args.command == "history":
+        command.history(config)
+    elif args.command == "revision":
+        command.revision(config, message=args.message, autogenerate=args.autogenerate)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Alembic environment for the Jobsify schema.
+
+The URL comes from app.database (JOBSIFY_DATABASE_URL / DATABASE_URL), so
+migrations always target the database the app would use. The full-text
+search objects are created by a migration but are not part of the ORM
+metadata, so autogenerate and `migrate.py check` ignore them.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.database import DATABASE_URL, Base, create_db_engine
+from migrations.helpers import include_name
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def _configure(**options):
+    context.configure(
+        target_metadata=target_metadata,
+        include_name=include_name,
+        # SQLite can only ALTER by copying tables; let autogenerate emit batch ops
+        render_as_batch=True,
+        **options,
+    )
+
+
+def run_migrations_offline() -> None:
+    """
+    Emit the migration SQL instead of running it (`alembic upgrade 0011:head --sql`).
+    Revisions up to 0011 inspect the live schema and need online mode.
+    """
+    _configure(url=config.get_main_option("sqlalchemy.url") or DATABASE_URL, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    engine = create_db_engine(config.get_main_option("sqlalchemy.url") or DATABASE_URL, mode="script")
+    with engine.connect() as connection:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,62 @@
+"""
+Helpers shared by env.py, migrate.py and the revisions.
+
+The guards exist because databases created before migrations existed were
+built by create_all plus whichever of the old add_*/fix_* scripts someone
+happened to run, so the revisions up to the search indexes check what is
+already there instead of assuming a known starting point. Later revisions
+can use plain `op` calls.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from app.search import FTS_TABLES
+
+SEARCH_OBJECTS = {fts for fts, _, _ in FTS_TABLES.values()}
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """Keep the search objects (not in the ORM metadata) out of autogenerate and drift checks."""
+    if type_ == "table":
+        # jobs_fts plus the FTS5 shadow tables (jobs_fts_data, jobs_fts_idx, ...)
+        return not any(name == fts or name.startswith(f"{fts}_") for fts in SEARCH_OBJECTS)
+    if type_ == "index":
+        return name not in {f"{fts}_idx" for fts in SEARCH_OBJECTS}
+    return True
+
+
+def has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def column_names(table: str) -> set[str]:
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def create_table_if_missing(table: str, *columns, **kw) -> bool:
+    if has_table(table):
+        return False
+    op.create_table(table, *columns, **kw)
+    return True
+
+
+def add_columns_if_missing(table: str, *columns: sa.Column) -> list[str]:
+    """Add the columns the table lacks; returns the names that were added."""
+    existing = column_names(table)
+    added = []
+    for column in columns:
+        if column.name not in existing:
+            op.add_column(table, column)
+            added.append(column.name)
+    return added
+
+
+def drop_columns(table: str, *names: str):
+    # SQLite before 3.35 cannot DROP COLUMN; batch mode rebuilds the table instead
+    with op.batch_alter_table(table) as batch_op:
+        for name in names:
+            batch_op.drop_column(name)
+
+
+def create_index_if_missing(name: str, table: str, columns: list[str], unique: bool = False):
+    op.create_index(name, table, columns, unique=unique, if_not_exists=True)
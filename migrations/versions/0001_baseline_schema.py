@@ -0,0 +1,192 @@
+"""baseline schema
+
+Creates every table the app uses, in its current shape, when it does not
+exist yet. Replaces create_all at import time plus create_reviews_table.py,
+migrate_reviews.py, create_saved_jobs_table.py and update_notification_table.py.
+Tables that already exist are left alone; the following revisions bring
+their columns and indexes up to date.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 11:35:54.928628
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_table_if_missing
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_table_if_missing('jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.Column('location', sa.String(), nullable=False),
+        sa.Column('phone', sa.String(), nullable=False),
+        sa.Column('latitude', sa.String(), nullable=True),
+        sa.Column('longitude', sa.String(), nullable=True),
+        sa.Column('lat', sa.Float(), nullable=True),
+        sa.Column('lng', sa.Float(), nullable=True),
+        sa.Column('user_email', sa.String(), nullable=False),
+        sa.Column('verified', sa.Boolean(), nullable=True),
+        sa.Column('urgent', sa.Boolean(), nullable=True),
+        sa.Column('salary', sa.String(), nullable=True),
+        sa.Column('salary_min', sa.Float(), nullable=True),
+        sa.Column('salary_max', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.String(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('required_workers', sa.Integer(), nullable=True),
+        sa.Column('hired_count', sa.Integer(), nullable=True),
+        sa.Column('is_hidden', sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    create_table_if_missing('notifications',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_email', sa.String(), nullable=True),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('message', sa.String(), nullable=False),
+        sa.Column('type', sa.String(), nullable=True),
+        sa.Column('reference_id', sa.Integer(), nullable=True),
+        sa.Column('is_read', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    create_table_if_missing('user_counters',
+        sa.Column('user_email', sa.String(), nullable=False),
+        sa.Column('unread_messages', sa.Integer(), nullable=False),
+        sa.Column('unread_notifications', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('user_email')
+    )
+
+    create_table_if_missing('users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('first_name', sa.String(), nullable=True),
+        sa.Column('last_name', sa.String(), nullable=True),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('password', sa.String(), nullable=False),
+        sa.Column('role', sa.String(), nullable=False),
+        sa.Column('phone', sa.String(), nullable=True),
+        sa.Column('email_verified', sa.Boolean(), nullable=True),
+        sa.Column('blocked', sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    create_table_if_missing('workers',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('first_name', sa.String(), nullable=True),
+        sa.Column('last_name', sa.String(), nullable=True),
+        sa.Column('name', sa.String(), nullable=True),
+        sa.Column('role', sa.String(), nullable=True),
+        sa.Column('phone', sa.String(), nullable=True),
+        sa.Column('experience', sa.Integer(), nullable=True),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('latitude', sa.String(), nullable=True),
+        sa.Column('longitude', sa.String(), nullable=True),
+        sa.Column('lat', sa.Float(), nullable=True),
+        sa.Column('lng', sa.Float(), nullable=True),
+        sa.Column('user_email', sa.String(), nullable=False),
+        sa.Column('is_verified', sa.Boolean(), nullable=True),
+        sa.Column('availability_type', sa.String(), nullable=True),
+        sa.Column('available_days', sa.String(), nullable=True),
+        sa.Column('is_available', sa.Boolean(), nullable=True),
+        sa.Column('rating', sa.Float(), nullable=True),
+        sa.Column('reviews', sa.Integer(), nullable=True),
+        sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_1', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_2', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_3', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_4', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_5', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    create_table_if_missing('conversations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('participant_one_email', sa.String(), nullable=False),
+        sa.Column('participant_two_email', sa.String(), nullable=False),
+        sa.Column('worker_id', sa.Integer(), nullable=True),
+        sa.Column('last_message', sa.String(), nullable=True),
+        sa.Column('last_message_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['worker_id'], ['workers.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    create_table_if_missing('reports',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('worker_id', sa.Integer(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('job_id', sa.Integer(), nullable=True),
+        sa.Column('reporter_email', sa.String(), nullable=False),
+        sa.Column('reason', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+        sa.ForeignKeyConstraint(['worker_id'], ['workers.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    create_table_if_missing('reviews',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('worker_id', sa.Integer(), nullable=False),
+        sa.Column('reviewer_email', sa.String(), nullable=False),
+        sa.Column('reviewer_name', sa.String(), nullable=True),
+        sa.Column('rating', sa.Integer(), nullable=False),
+        sa.Column('comment', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['worker_id'], ['workers.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    create_table_if_missing('saved_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_email', sa.String(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('saved_at', sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    create_table_if_missing('messages',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('conversation_id', sa.Integer(), nullable=False),
+        sa.Column('sender_email', sa.String(), nullable=False),
+        sa.Column('recipient_email', sa.String(), nullable=False),
+        sa.Column('content', sa.String(), nullable=False),
+        sa.Column('is_read', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+
+
+
+def downgrade() -> None:
+    op.drop_table('messages')
+    op.drop_table('saved_jobs')
+    op.drop_table('reviews')
+    op.drop_table('reports')
+    op.drop_table('conversations')
+    op.drop_table('workers')
+    op.drop_table('users')
+    op.drop_table('user_counters')
+    op.drop_table('notifications')
+    op.drop_table('jobs')
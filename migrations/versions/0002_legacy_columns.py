@@ -0,0 +1,58 @@
+"""legacy columns
+
+Folds in add_availability_columns.py, add_job_vacancies_columns.py,
+add_name_columns.py, add_user_id_column.py, fix_reports_table.py and
+migrate_notifications.py: columns added to the models after their tables
+were first created.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from migrations.helpers import add_columns_if_missing, drop_columns
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    add_columns_if_missing('users',
+        sa.Column('first_name', sa.String(), nullable=True),
+        sa.Column('last_name', sa.String(), nullable=True),
+    )
+    add_columns_if_missing('workers',
+        sa.Column('first_name', sa.String(), nullable=True),
+        sa.Column('last_name', sa.String(), nullable=True),
+        sa.Column('availability_type', sa.String(), server_default='everyday', nullable=True),
+        sa.Column('available_days', sa.String(), nullable=True),
+    )
+    add_columns_if_missing('jobs',
+        sa.Column('required_workers', sa.Integer(), server_default='1', nullable=True),
+        sa.Column('hired_count', sa.Integer(), server_default='0', nullable=True),
+        sa.Column('is_hidden', sa.Boolean(), server_default=sa.false(), nullable=True),
+    )
+    add_columns_if_missing('reports',
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    add_columns_if_missing('notifications',
+        sa.Column('type', sa.String(), server_default='general', nullable=True),
+        sa.Column('reference_id', sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    drop_columns('notifications', 'type', 'reference_id')
+    drop_columns('reports', 'user_id', 'created_at')
+    drop_columns('jobs', 'required_workers', 'hired_count', 'is_hidden')
+    drop_columns('workers', 'first_name', 'last_name', 'availability_type', 'available_days')
+    drop_columns('users', 'first_name', 'last_name')
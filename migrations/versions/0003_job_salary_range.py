@@ -0,0 +1,64 @@
+"""job salary range
+
+Folds in add_job_salary_columns.py: numeric salary bounds parsed once from
+the free-text salary, plus the index used by the salary range filter.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 12:00:01.000000
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import add_columns_if_missing, create_index_if_missing, drop_columns
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def parse_salary_range(salary_str):
+    """Same parsing rules as parse_salary_range_fixed in app/routers/jobs.py at the time"""
+    if not salary_str or not isinstance(salary_str, str) or not salary_str.strip():
+        return None, None
+    numbers = [float(num) for num in re.findall(r"\d+\.?\d*", salary_str.replace(",", ""))]
+    if not numbers:
+        return None, None
+    return min(numbers), max(numbers)
+
+
+def upgrade() -> None:
+    add_columns_if_missing('jobs',
+        sa.Column('salary_min', sa.Float(), nullable=True),
+        sa.Column('salary_max', sa.Float(), nullable=True),
+    )
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, salary FROM jobs WHERE salary IS NOT NULL AND salary_min IS NULL"
+    )).fetchall()
+    updates = []
+    for job_id, salary in rows:
+        salary_min, salary_max = parse_salary_range(salary)
+        if salary_min is not None:
+            updates.append({"id": job_id, "salary_min": salary_min, "salary_max": salary_max})
+    if updates:
+        conn.execute(
+            sa.text("UPDATE jobs SET salary_min = :salary_min, salary_max = :salary_max WHERE id = :id"),
+            updates,
+        )
+
+    create_index_if_missing('idx_jobs_verified_hidden_salary', 'jobs',
+                            ['verified', 'is_hidden', 'salary_min', 'salary_max'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_jobs_verified_hidden_salary', table_name='jobs', if_exists=True)
+    drop_columns('jobs', 'salary_min', 'salary_max')
@@ -0,0 +1,69 @@
+"""geo coordinates
+
+Folds in add_geo_columns.py: numeric lat/lng used by radius search,
+backfilled from the latitude/longitude strings, plus their indexes.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:00:02.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import add_columns_if_missing, create_index_if_missing, drop_columns
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (index name, index columns)
+GEO_INDEXES = {
+    'jobs': ('idx_jobs_verified_hidden_geo', ['verified', 'is_hidden', 'lat', 'lng']),
+    'workers': ('idx_workers_verified_available_geo', ['is_verified', 'is_available', 'lat', 'lng']),
+}
+
+
+def parse_lat_lng(latitude, longitude):
+    """Same rules as app.geo.parse_lat_lng at the time"""
+    try:
+        lat = float(str(latitude).strip())
+        lng = float(str(longitude).strip())
+    except (TypeError, ValueError):
+        return None, None
+    if lat != lat or lng != lng or abs(lat) > 90 or abs(lng) > 180:
+        return None, None
+    return lat, lng
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for table, (index_name, index_columns) in GEO_INDEXES.items():
+        add_columns_if_missing(table,
+            sa.Column('lat', sa.Float(), nullable=True),
+            sa.Column('lng', sa.Float(), nullable=True),
+        )
+
+        rows = conn.execute(sa.text(
+            f"SELECT id, latitude, longitude FROM {table} WHERE latitude IS NOT NULL AND lat IS NULL"
+        )).fetchall()
+        updates = []
+        for row_id, latitude, longitude in rows:
+            lat, lng = parse_lat_lng(latitude, longitude)
+            if lat is not None:
+                updates.append({"id": row_id, "lat": lat, "lng": lng})
+        if updates:
+            conn.execute(sa.text(f"UPDATE {table} SET lat = :lat, lng = :lng WHERE id = :id"), updates)
+
+        create_index_if_missing(index_name, table, index_columns)
+
+
+def downgrade() -> None:
+    for table, (index_name, _) in GEO_INDEXES.items():
+        op.drop_index(index_name, table_name=table, if_exists=True)
+        drop_columns(table, 'lat', 'lng')
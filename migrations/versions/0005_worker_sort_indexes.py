@@ -0,0 +1,37 @@
+"""worker sort indexes
+
+Folds in add_worker_sort_indexes.py: NULL rating/experience become 0 so
+keyset cursors never compare NULLs, and the per-sort indexes are added.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 12:00:03.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_if_missing
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text("UPDATE workers SET rating = 0 WHERE rating IS NULL"))
+    op.execute(sa.text("UPDATE workers SET experience = 0 WHERE experience IS NULL"))
+    create_index_if_missing('idx_workers_verified_available_rating', 'workers',
+                            ['is_verified', 'is_available', 'rating'])
+    create_index_if_missing('idx_workers_verified_available_experience', 'workers',
+                            ['is_verified', 'is_available', 'experience'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_workers_verified_available_experience', table_name='workers', if_exists=True)
+    op.drop_index('idx_workers_verified_available_rating', table_name='workers', if_exists=True)
@@ -0,0 +1,52 @@
+"""worker rating aggregates
+
+Folds in the DDL half of rebuild_worker_ratings.py: the running rating sum
+and per-star histogram on workers. When the columns are new they are
+filled from the reviews table; rebuild_worker_ratings.py remains the tool
+for repairing drift later.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 12:00:04.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import add_columns_if_missing, drop_columns
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AGGREGATE_COLUMNS = ['rating_sum', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5']
+WORKER_REVIEWS = "FROM reviews r WHERE r.worker_id = workers.id"
+
+
+def upgrade() -> None:
+    added = add_columns_if_missing('workers', *(
+        sa.Column(name, sa.Integer(), server_default='0', nullable=False) for name in AGGREGATE_COLUMNS
+    ))
+    if not added:
+        return
+
+    stars = ", ".join(
+        f"rating_{star} = (SELECT COUNT(*) {WORKER_REVIEWS} AND r.rating = {star})" for star in range(1, 6)
+    )
+    op.execute(sa.text(
+        f"UPDATE workers SET "
+        f"rating_sum = COALESCE((SELECT SUM(r.rating) {WORKER_REVIEWS}), 0), "
+        f"reviews = (SELECT COUNT(*) {WORKER_REVIEWS}), "
+        # NUMERIC so round(x, 1) works on SQLite and PostgreSQL
+        f"rating = COALESCE((SELECT ROUND(CAST(AVG(CAST(r.rating AS FLOAT)) AS NUMERIC), 1) {WORKER_REVIEWS}), 0), "
+        f"{stars}"
+    ))
+
+
+def downgrade() -> None:
+    drop_columns('workers', *AGGREGATE_COLUMNS)
@@ -0,0 +1,59 @@
+"""row versions
+
+Folds in add_updated_at_columns.py: updated_at on jobs, workers and
+reviews, used for ETag / Last-Modified. Rows without one are stamped from
+created_at where there is one, else with the migration time.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 12:00:05.000000
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import add_columns_if_missing, drop_columns
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('jobs', 'workers', 'reviews')
+
+
+def _parse(value):
+    # jobs.created_at is an ISO string column; reviews.created_at is a DATETIME
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    for table in TABLES:
+        add_columns_if_missing(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+        select = "SELECT id, NULL" if table == 'workers' else "SELECT id, created_at"
+        rows = conn.execute(sa.text(f"{select} FROM {table} WHERE updated_at IS NULL")).fetchall()
+        updates = [{"id": row_id, "updated_at": _parse(created_at) or now} for row_id, created_at in rows]
+        if updates:
+            conn.execute(
+                sa.text(f"UPDATE {table} SET updated_at = :updated_at WHERE id = :id")
+                .bindparams(sa.bindparam("updated_at", type_=sa.DateTime())),
+                updates,
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        drop_columns(table, 'updated_at')
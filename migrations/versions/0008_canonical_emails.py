@@ -0,0 +1,81 @@
+"""canonical emails
+
+Folds in normalize_emails.py: every email column is rewritten to the
+stripped, lowercase form the models enforce, so lookups can use plain
+equality on the existing indexes. Users whose addresses only differ by
+case are reported and left untouched; saved jobs that collapse onto the
+same (user_email, job_id) are de-duplicated.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 12:00:06.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMAIL_COLUMNS = [
+    ('users', 'email'),
+    ('workers', 'user_email'),
+    ('jobs', 'user_email'),
+    ('saved_jobs', 'user_email'),
+    ('reviews', 'reviewer_email'),
+    ('notifications', 'user_email'),
+    ('conversations', 'participant_one_email'),
+    ('conversations', 'participant_two_email'),
+    ('messages', 'sender_email'),
+    ('messages', 'recipient_email'),
+    ('reports', 'reporter_email'),
+]
+
+
+def normalize_email(value):
+    """Same rules as app.emails.normalize_email at the time"""
+    return value.strip().lower() if value is not None else None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # Unique emails that would collide once lowercased need a manual merge
+    seen = {}
+    for (email,) in conn.execute(sa.text("SELECT email FROM users")):
+        seen.setdefault(normalize_email(email), []).append(email)
+    conflicting = {email for variants in seen.values() if len(variants) > 1 for email in variants}
+    for canonical, variants in seen.items():
+        if len(variants) > 1:
+            print(f"Skipping users {variants}: they collapse onto {canonical}, merge them by hand")
+
+    kept = set()
+    duplicates = []
+    for saved_id, email, job_id in conn.execute(sa.text("SELECT id, user_email, job_id FROM saved_jobs ORDER BY id")):
+        key = (normalize_email(email), job_id)
+        if key in kept:
+            duplicates.append({"id": saved_id})
+        kept.add(key)
+    if duplicates:
+        conn.execute(sa.text("DELETE FROM saved_jobs WHERE id = :id"), duplicates)
+
+    for table, column in EMAIL_COLUMNS:
+        rows = conn.execute(sa.text(f"SELECT DISTINCT {column} FROM {table} WHERE {column} IS NOT NULL"))
+        updates = [
+            {"canonical": normalize_email(email), "email": email}
+            for (email,) in rows
+            if normalize_email(email) != email and not (table == 'users' and email in conflicting)
+        ]
+        if updates:
+            conn.execute(sa.text(f"UPDATE {table} SET {column} = :canonical WHERE {column} = :email"), updates)
+
+
+def downgrade() -> None:
+    # The original spellings are gone; there is nothing to restore
+    pass
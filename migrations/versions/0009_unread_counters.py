@@ -0,0 +1,39 @@
+"""unread counters
+
+Folds in the DDL half of rebuild_unread_counters.py: user_counters is
+created by the baseline, and this fills it from the unread messages and
+notifications. rebuild_unread_counters.py remains the repair tool.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 12:00:07.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text("DELETE FROM user_counters"))
+    op.execute(sa.text(
+        "INSERT INTO user_counters (user_email, unread_messages, unread_notifications) "
+        "SELECT email, SUM(messages), SUM(notifications) FROM ("
+        "  SELECT recipient_email AS email, 1 AS messages, 0 AS notifications "
+        "  FROM messages WHERE is_read = FALSE"
+        "  UNION ALL "
+        "  SELECT user_email, 0, 1 FROM notifications WHERE is_read = FALSE AND user_email IS NOT NULL"
+        ") unread GROUP BY email"
+    ))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DELETE FROM user_counters"))
@@ -0,0 +1,119 @@
+"""model indexes
+
+create_all only creates indexes together with their table, so databases
+whose tables predate an index declared on the models never got it. This
+creates every remaining model index that is missing (the salary, geo and
+worker sort indexes come from earlier revisions), including
+add_review_indexes.py's (worker_id, created_at, id).
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 12:00:08.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from migrations.helpers import create_index_if_missing
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> [(index name, columns, unique)]
+MODEL_INDEXES = {
+    'jobs': [
+        ('idx_jobs_category_verified', ['category', 'verified'], False),
+        ('idx_jobs_user_verified', ['user_email', 'verified'], False),
+        ('idx_jobs_verified_hidden', ['verified', 'is_hidden'], False),
+        ('ix_jobs_category', ['category'], False),
+        ('ix_jobs_created_at', ['created_at'], False),
+        ('ix_jobs_id', ['id'], False),
+        ('ix_jobs_is_hidden', ['is_hidden'], False),
+        ('ix_jobs_location', ['location'], False),
+        ('ix_jobs_user_email', ['user_email'], False),
+        ('ix_jobs_verified', ['verified'], False),
+    ],
+    'notifications': [
+        ('idx_notifications_user_read', ['user_email', 'is_read'], False),
+        ('ix_notifications_created_at', ['created_at'], False),
+        ('ix_notifications_id', ['id'], False),
+        ('ix_notifications_is_read', ['is_read'], False),
+        ('ix_notifications_type', ['type'], False),
+        ('ix_notifications_user_email', ['user_email'], False),
+    ],
+    'users': [
+        ('idx_users_email_verified', ['email_verified'], False),
+        ('idx_users_role_blocked', ['role', 'blocked'], False),
+        ('ix_users_blocked', ['blocked'], False),
+        ('ix_users_email', ['email'], True),
+        ('ix_users_email_verified', ['email_verified'], False),
+        ('ix_users_id', ['id'], False),
+        ('ix_users_role', ['role'], False),
+    ],
+    'workers': [
+        ('idx_workers_location_verified', ['location', 'is_verified'], False),
+        ('idx_workers_role_verified', ['role', 'is_verified'], False),
+        ('idx_workers_verified_available', ['is_verified', 'is_available'], False),
+        ('ix_workers_availability_type', ['availability_type'], False),
+        ('ix_workers_experience', ['experience'], False),
+        ('ix_workers_id', ['id'], False),
+        ('ix_workers_is_available', ['is_available'], False),
+        ('ix_workers_is_verified', ['is_verified'], False),
+        ('ix_workers_location', ['location'], False),
+        ('ix_workers_rating', ['rating'], False),
+        ('ix_workers_role', ['role'], False),
+        ('ix_workers_user_email', ['user_email'], False),
+    ],
+    'conversations': [
+        ('idx_conversations_participants', ['participant_one_email', 'participant_two_email'], False),
+        ('ix_conversations_id', ['id'], False),
+        ('ix_conversations_participant_one_email', ['participant_one_email'], False),
+        ('ix_conversations_participant_two_email', ['participant_two_email'], False),
+        ('ix_conversations_worker_id', ['worker_id'], False),
+    ],
+    'reports': [
+        ('ix_reports_id', ['id'], False),
+    ],
+    'reviews': [
+        ('idx_reviews_worker_created', ['worker_id', 'created_at', 'id'], False),
+        ('idx_reviews_worker_rating', ['worker_id', 'rating'], False),
+        ('ix_reviews_created_at', ['created_at'], False),
+        ('ix_reviews_id', ['id'], False),
+        ('ix_reviews_rating', ['rating'], False),
+        ('ix_reviews_reviewer_email', ['reviewer_email'], False),
+        ('ix_reviews_worker_id', ['worker_id'], False),
+    ],
+    'saved_jobs': [
+        ('idx_saved_jobs_user_job', ['user_email', 'job_id'], True),
+        ('ix_saved_jobs_id', ['id'], False),
+        ('ix_saved_jobs_job_id', ['job_id'], False),
+        ('ix_saved_jobs_user_email', ['user_email'], False),
+    ],
+    'messages': [
+        ('idx_messages_conversation_created', ['conversation_id', 'created_at'], False),
+        ('idx_messages_recipient_read', ['recipient_email', 'is_read'], False),
+        ('ix_messages_conversation_id', ['conversation_id'], False),
+        ('ix_messages_created_at', ['created_at'], False),
+        ('ix_messages_id', ['id'], False),
+        ('ix_messages_is_read', ['is_read'], False),
+        ('ix_messages_recipient_email', ['recipient_email'], False),
+        ('ix_messages_sender_email', ['sender_email'], False),
+    ],
+}
+
+
+def upgrade() -> None:
+    for table, indexes in MODEL_INDEXES.items():
+        for name, columns, unique in indexes:
+            create_index_if_missing(name, table, columns, unique=unique)
+
+
+def downgrade() -> None:
+    for table, indexes in MODEL_INDEXES.items():
+        for name, _, _ in indexes:
+            op.drop_index(name, table_name=table, if_exists=True)
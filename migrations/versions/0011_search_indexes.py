@@ -0,0 +1,30 @@
+"""search indexes
+
+Moves the full-text search setup out of app startup: FTS5 tables and sync
+triggers on SQLite, GIN tsvector indexes on PostgreSQL (see app/search.py).
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 12:00:09.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.search import create_search_tables, drop_search_tables
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_search_tables(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_search_tables(op.get_bind())
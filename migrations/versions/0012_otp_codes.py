@@ -0,0 +1,39 @@
+"""otp codes
+
+Backs the "database" OTP store (app/otp.py), which lets every uvicorn
+worker verify codes issued by any other.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 12:00:10.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'otp_codes',
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('purpose', sa.String(), nullable=False),
+        sa.Column('code_hash', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('expires_at', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('email'),
+    )
+    op.create_index('ix_otp_codes_expires_at', 'otp_codes', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_otp_codes_expires_at', table_name='otp_codes')
+    op.drop_table('otp_codes')
@@ -0,0 +1,43 @@
+"""outbound emails
+
+Persistent queue for the background mail dispatcher (app/mailer.py).
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18 12:00:11.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'outbound_emails',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('recipient', sa.String(), nullable=False),
+        sa.Column('subject', sa.String(), nullable=False),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('next_attempt_at', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.Float(), nullable=False),
+        sa.Column('sent_at', sa.Float(), nullable=True),
+        sa.Column('last_error', sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('idx_outbound_emails_status_due', 'outbound_emails', ['status', 'next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_outbound_emails_status_due', table_name='outbound_emails')
+    op.drop_table('outbound_emails')
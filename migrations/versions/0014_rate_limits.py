@@ -0,0 +1,40 @@
+"""rate limits
+
+Backs the "database" rate limiter backend (app/middleware/rate_limiter.py),
+so limits hold across uvicorn workers and restarts.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-18 12:00:12.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0014'
+down_revision: Union[str, None] = '0013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'rate_limits',
+        sa.Column('bucket', sa.String(), nullable=False),
+        sa.Column('window_start', sa.BigInteger(), nullable=False),
+        sa.Column('current_count', sa.Integer(), nullable=False),
+        sa.Column('previous_count', sa.Integer(), nullable=False),
+        sa.Column('locked_until', sa.Float(), nullable=False),
+        sa.Column('expires_at', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('bucket'),
+    )
+    op.create_index('ix_rate_limits_expires_at', 'rate_limits', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rate_limits_expires_at', table_name='rate_limits')
+    op.drop_table('rate_limits')
@@ -0,0 +1,32 @@
+"""worker review version
+
+workers.review_version is bumped with every review insert, edit and delete
+for the worker (app/ratings.py), so the worker's review list has a version
+that a single primary-key read returns. It backs the ETag of
+/reviews/worker/{id} and the key of its cached first page.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-18 12:00:13.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from migrations.helpers import add_columns_if_missing, drop_columns
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0015'
+down_revision: Union[str, None] = '0014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    add_columns_if_missing('workers', sa.Column('review_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    drop_columns('workers', 'review_version')
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Rebuild every unread counter from the messages and notifications tables.
+Run any time badges look wrong (the user_counters table itself comes from
+the migrations: `python migrate.py upgrade`).
+"""
+from app.database import SessionLocal
+from app.counters import rebuild_unread_counters
+
+
+def main():
+    db = SessionLocal()
+    try:
+        users = rebuild_unread_counters(db)
+        print(f"✅ Rebuilt unread counters for {users} users")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
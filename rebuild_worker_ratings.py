@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Rebuild every worker's rating sum, count and star histogram from reviews.
+Safe to re-run at any time to fix drift (the aggregate columns themselves
+come from the migrations: `python migrate.py upgrade`).
+"""
+
+
+def main():
+    from app.database import SessionLocal
+    from app.ratings import rebuild_worker_ratings
+
+    db = SessionLocal()
+    try:
+        workers = rebuild_worker_ratings(db)
+        print(f"✅ Rebuilt ratings for {workers} workers with reviews")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,15 +11,11 @@ if os.path.exists(db_path):
     os.remove(db_path)
     print("Old database removed.")
 
-# Import and run the database initialization
-from app.init_db import Base, engine
-from app.models.user import User
-from app.models.job import Job
-from app.models.workers import Worker
-from app.models.report import Report
+# Build the schema from the migrations
+from migrate import upgrade
 
 print("Creating new database tables with updated schema...")
-Base.metadata.create_all(bind=engine)
+upgrade()
 print("Database recreated successfully!")
 
 # Initialize admin users
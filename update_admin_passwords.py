@@ -3,9 +3,9 @@
 Update admin passwords. Run this to set new passwords for admin users.
 """
 
-import bcrypt
 from app.database import SessionLocal
 from app.models.user import User
+from app.passwords import hash_password
 
 # Set your desired admin passwords here
 ADMIN_PASSWORDS = {
@@ -28,10 +28,7 @@ def update_admin_passwords():
                 continue
             
             # Hash new password
-            hashed_password = bcrypt.hashpw(
-                new_password.encode(),
-                bcrypt.gensalt()
-            ).decode()
+            hashed_password = hash_password(new_password)
             
             # Update password
             admin.password = hashed_password